@@ -0,0 +1,86 @@
+import argparse
+import importlib
+import json
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.common import MappedInput
+from aoc.runner import PART_ARGS, measure
+
+
+def find_inputs(source: Path) -> list[Path]:
+    # A directory holds one input per file; any other file is a manifest with
+    # one path per line, relative to the manifest itself
+    if source.is_dir():
+        return sorted(path for path in source.iterdir() if path.is_file() and not path.name.startswith('.'))
+
+    inputs = []
+    with open(source) as manifest:
+        for line in manifest:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                inputs.append(source.parent / line)
+
+    return inputs
+
+
+def solve_input(day: int, path: Path, part: Optional[int] = None) -> dict[str, Any]:
+    module = importlib.import_module(f"aoc.day{day:02}")
+    result: dict[str, Any] = {'input': str(path)}
+
+    try:
+        data = MappedInput(path)
+    except OSError as error:
+        result['error'] = repr(error)
+        return result
+
+    with data:
+        if part is None:
+            answers, stats = measure(module.solve, data, trace_memory=False)
+            result['answers'] = {'1': answers[0], '2': answers[1]} if answers else None
+        else:
+            solver = getattr(module, f"solve_part{part}")
+            args = PART_ARGS.get(day, ((), ()))[part - 1]
+            answer, stats = measure(solver, data, *args, trace_memory=False)
+            result['answers'] = {str(part): answer}
+
+    result.update(stats)
+    return result
+
+
+def batch(day: int, inputs: Sequence[Path], jobs: Optional[int] = None,
+          part: Optional[int] = None) -> Iterator[dict[str, Any]]:
+    # Results come back as each input is solved, not in input order
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(solve_input, day, path, part): path for path in inputs}
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # Only fails this input, like the errors solve_input reports itself
+                result = {'input': str(futures[future]), 'error': repr(error)}
+            yield result
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='aoc.batch', description="Solve one day for many inputs, printing a JSON line per input")
+    parser.add_argument('day', type=int, help="day to solve")
+    parser.add_argument('source', type=Path, help="directory of inputs, or a manifest listing one input path per line")
+    parser.add_argument('-j', '--jobs', type=int, help="number of worker processes, one per CPU by default")
+    parser.add_argument('-p', '--part', type=int, choices=(1, 2), help="only solve this part")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    for result in batch(args.day, find_inputs(args.source), args.jobs, args.part):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+import os
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, suppress
+from functools import wraps
+from typing import Any, Concatenate, Optional, ParamSpec, Self, TypeVar
+
+from aoc.common import MappedInput
+
+# hashlib, pickle and tempfile are imported where they are used: the days
+# import this module, and most runs never turn the cache on
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class DiskCache:
+    """
+    Content-addressed store of preprocessed inputs, bounded in size.
+
+    Entries are pickled files named after the sha256 of the key, which is
+    made of the input's own digest, the producing function and its
+    arguments. Hits refresh the file's mtime, and whenever the directory
+    grows past max_bytes the least recently used entries are evicted.
+    """
+
+    directory: str
+    max_bytes: int
+
+    def __init__(self: Self, directory: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self: Self, key: str) -> str:
+        import hashlib
+
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.pickle")
+
+    def get(self: Self, key: str) -> Optional[Any]:
+        import pickle
+
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as entry_file:
+                value = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, ValueError):
+            # Damaged entry, drop it and recompute, unless a concurrent run already did
+            with suppress(FileNotFoundError):
+                os.remove(path)
+            return None
+
+        os.utime(path)
+        return value
+
+    def set(self: Self, key: str, value: Any) -> None:
+        import pickle
+        import tempfile
+
+        # Written aside and renamed, so concurrent runs never see half an entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as entry_file:
+                pickle.dump(value, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path(key))
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+
+        self.evict()
+
+    def evict(self: Self) -> None:
+        with os.scandir(self.directory) as scan:
+            entries = sorted(
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in scan if entry.name.endswith('.pickle')
+            )
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Evicted by a concurrent run
+                pass
+
+
+_cache: Optional[DiskCache] = None
+
+
+@contextmanager
+def caching(directory: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES) -> Iterator[DiskCache]:
+    global _cache
+
+    previous, _cache = _cache, DiskCache(directory, max_bytes)
+    try:
+        yield _cache
+    finally:
+        _cache = previous
+
+
+def input_digest(data: Sequence[str]) -> str:
+    import hashlib
+
+    if isinstance(data, MappedInput):
+        digest = hashlib.sha256(data.buffer)
+    else:
+        digest = hashlib.sha256()
+        for line in data:
+            digest.update(line.encode())
+            digest.update(b'\n')
+
+    return digest.hexdigest()
+
+
+def cached(encode: Callable[[R], Any], decode: Callable[[Any], R], version: int = 1) -> Callable[[Callable[Concatenate[Sequence[str], P], R]], Callable[Concatenate[Sequence[str], P], R]]:
+    # Caches func(data, *args) while caching() is active. The value is stored
+    # as encode() makes it, flat arrays rather than object graphs, which are
+    # slow to pickle and can hit the recursion limit. The version is part of
+    # the key and must be bumped whenever the encoding changes
+    def decorator(func: Callable[Concatenate[Sequence[str], P], R]) -> Callable[Concatenate[Sequence[str], P], R]:
+        name = f"{func.__module__}.{func.__qualname__}:v{version}"
+
+        @wraps(func)
+        def wrapper(data: Sequence[str], *args: P.args, **kwargs: P.kwargs) -> R:
+            if _cache is None:
+                return func(data, *args, **kwargs)
+
+            key = f"{input_digest(data)}:{name}:{args!r}:{sorted(kwargs.items())!r}"
+            if (stored := _cache.get(key)) is not None:
+                try:
+                    return decode(stored)
+                except (TypeError, ValueError, IndexError, KeyError):
+                    # Stored in another format, overwritten below
+                    pass
+
+            value = func(data, *args, **kwargs)
+            _cache.set(key, encode(value))
+            return value
+
+        return wrapper
+
+    return decorator
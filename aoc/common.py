@@ -1,15 +1,333 @@
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterator, MutableSequence, Sequence
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Optional, ParamSpec, Self, TypeVar, overload
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class MappedInput(Sequence[str]):
+    """
+    Input file mapped into memory, indexed by line.
+
+    Behaves as a sequence of lines, decoding each one only when accessed, so
+    it can be handed to any solver. Code that can work on raw bytes, like
+    Grid.from_lines, uses line(n) or buffer instead and never builds strings.
+    """
+
+    buffer: memoryview
+    starts: array
+    ends: array
+
+    def __init__(self: Self, path: str | os.PathLike) -> None:
+        with open(path, 'rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size:
+                self._map: Optional[mmap.mmap] = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.buffer = memoryview(self._map)
+            else:
+                # Empty files cannot be mapped
+                self._map = None
+                self.buffer = memoryview(b'')
+
+        self.starts, self.ends = self._index_lines()
+
+    def _index_lines(self: Self) -> tuple[array, array]:
+        starts, ends = array('Q'), array('Q')
+        if self._map is None:
+            return starts, ends
+
+        find = self._map.find
+        size = len(self.buffer)
+        start = 0
+        while start < size:
+            end = find(b'\n', start)
+            if end == -1:
+                end = size
+            next_start = end + 1
+
+            if end > start and self.buffer[end - 1] == ord('\r'):
+                end -= 1
+
+            starts.append(start)
+            ends.append(end)
+            start = next_start
+
+        return starts, ends
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: Any) -> None:
+        self.close()
+
+    def close(self: Self) -> None:
+        self.buffer.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Some line views are still alive, the map is unmapped along with them
+                pass
+
+    def __len__(self: Self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self: Self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self: Self, index: slice) -> list[str]: ...
+
+    def __getitem__(self: Self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return str(self.line(index), 'utf-8')
+
+    def __iter__(self: Self) -> Iterator[str]:
+        buffer = self.buffer
+        for start, end in zip(self.starts, self.ends):
+            yield str(buffer[start:end], 'utf-8')
+
+    def line(self: Self, index: int) -> memoryview:
+        return self.buffer[self.starts[index]:self.ends[index]]
+
+
+def stream_lines(path: str | os.PathLike) -> Iterator[str]:
+    # Lines are read one at a time, '-' reads them from stdin. As in
+    # MappedInput, only '\n' breaks lines and a '\r' before it is dropped
+    if path == '-':
+        for line in sys.stdin:
+            yield line.removesuffix('\n').removesuffix('\r')
+        return
+
+    with open(path, newline='\n') as input_file:
+        for line in input_file:
+            yield line.removesuffix('\n').removesuffix('\r')
+
+
+class Profiler:
+    """
+    Wall time spent in nested sections, as flamegraph collapsed stacks.
+
+    Each stack of section names, joined with ';', accumulates its self time,
+    that is without the time of the sections nested in it, which is what
+    flamegraph tools expect.
+    """
+
+    stacks: Counter[str]
+
+    def __init__(self: Self) -> None:
+        self.stacks = Counter()
+        self._names: list[str] = []
+        self._nested_time: list[float] = []
+
+    @contextmanager
+    def section(self: Self, name: str) -> Iterator[None]:
+        self._names.append(name)
+        self._nested_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stacks[';'.join(self._names)] += elapsed - self._nested_time.pop()
+            self._names.pop()
+            if self._nested_time:
+                self._nested_time[-1] += elapsed
+
+    def collapsed(self: Self) -> list[str]:
+        # One 'frame;frame;frame microseconds' line per stack
+        return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in self.stacks.items()]
+
+
+_profiler: Optional[Profiler] = None
+
+
+@contextmanager
+def profiling() -> Iterator[Profiler]:
+    global _profiler
+
+    previous, _profiler = _profiler, Profiler()
+    try:
+        yield _profiler
+    finally:
+        _profiler = previous
+
+
+@contextmanager
+def profile_section(name: str) -> Iterator[None]:
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.section(name):
+            yield
+
+
+def profiled(func: Callable[P, R]) -> Callable[P, R]:
+    # Times every call as a section while profiling() is active, otherwise
+    # the only cost is a global lookup
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if _profiler is None:
+            return func(*args, **kwargs)
+        with _profiler.section(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 class Grid:
-    def __init__(self, width: int, height:int, default_value=None):
+    """
+    Rectangular grid stored as a single flat sequence in row-major order.
+
+    With a typecode the cells live in an array of that type, so rows and
+    columns can be viewed without copying; otherwise they are a plain list
+    and may hold any object. Cells can be addressed by (x, y) through the
+    bounds-checked get/set, or by flat index through grid[index], which is
+    unchecked. Stepping by offsets[n] moves an index one cell east, south,
+    west or north.
+    """
+
+    width: int
+    height: int
+    cells: MutableSequence[Any]
+    offsets: tuple[int, int, int, int]
+
+    __slots__ = 'width', 'height', 'cells', 'offsets'
+
+    def __init__(self: Self, width: int, height: int, default_value: Any = None,
+                 typecode: Optional[str] = None, cells: Optional[MutableSequence[Any]] = None) -> None:
         self.width = width
         self.height = height
-        self.content = [[default_value] * width for _ in range(height)]
-    
-    def get(self, x: int, y: int):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        return self.content[y][x]
 
-    def set(self, x: int, y: int, value):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
+        if cells is not None:
+            if len(cells) != width * height:
+                raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+            self.cells = cells
+        elif typecode is not None:
+            self.cells = array(typecode, [default_value or 0]) * (width * height)
+        else:
+            self.cells = [default_value] * (width * height)
+
+        self.offsets = (1, width, -1, -width)
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str], convert: Optional[Callable[[str], Any]] = None,
+                   typecode: Optional[str] = None) -> Self:
+        if isinstance(lines, MappedInput):
+            return cls._from_mapped(lines, convert, typecode)
+
+        width, height = len(lines[0]), len(lines)
+
+        if typecode == 'B' and convert is None:
+            cells: MutableSequence[Any] = array('B', ''.join(lines).encode())
+        else:
+            values = (convert(ch) if convert else ch for line in lines for ch in line)
+            cells = array(typecode, values) if typecode else list(values)
+
+        return cls(width, height, cells=cells)
+
+    @classmethod
+    def _from_mapped(cls, lines: MappedInput, convert: Optional[Callable[[str], Any]],
+                     typecode: Optional[str]) -> Self:
+        width, height = len(lines.line(0)), len(lines)
+
+        if typecode == 'B' and convert is None:
+            # Straight copy of the rows, skipping the line breaks
+            cells: MutableSequence[Any] = array('B')
+            for y in range(height):
+                cells.frombytes(lines.line(y))
+        else:
+            values = (
+                convert(chr(byte)) if convert else chr(byte)
+                for y in range(height) for byte in lines.line(y)
+            )
+            cells = array(typecode, values) if typecode else list(values)
+
+        return cls(width, height, cells=cells)
+
+    def __repr__(self: Self) -> str:
+        return f"{self.__class__.__name__}({self.width}x{self.height})"
+
+    def __eq__(self: Self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    def __hash__(self: Self) -> int:
+        # Only meaningful for grids that are no longer modified, like cache keys
+        if isinstance(self.cells, array):
+            return hash(self.cells.tobytes())
+        return hash(tuple(self.cells))
+
+    def __getitem__(self: Self, index: int) -> Any:
+        return self.cells[index]
+
+    def __setitem__(self: Self, index: int, value: Any) -> None:
+        self.cells[index] = value
+
+    def __len__(self: Self) -> int:
+        return len(self.cells)
+
+    def copy(self: Self) -> Self:
+        return self.__class__(self.width, self.height, cells=self.cells[:])
+
+    def in_bounds(self: Self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self: Self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self: Self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def get(self: Self, x: int, y: int) -> Any:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        raise IndexError(f"({x}, {y}) is out of grid area")
+
+    def set(self: Self, x: int, y: int, value: Any) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[y * self.width + x] = value
+        else:
             raise IndexError(f"({x}, {y}) is out of grid area")
-        self.content[y][x] = value
+
+    def neighbors(self: Self, index: int) -> Iterator[int]:
+        x = index % self.width
+        if x + 1 < self.width:
+            yield index + 1
+        if index + self.width < len(self.cells):
+            yield index + self.width
+        if x > 0:
+            yield index - 1
+        if index >= self.width:
+            yield index - self.width
+
+    def row(self: Self, y: int) -> Sequence[Any]:
+        start = y * self.width
+        if isinstance(self.cells, array):
+            return memoryview(self.cells)[start:start + self.width]
+        return self.cells[start:start + self.width]
+
+    def column(self: Self, x: int) -> Sequence[Any]:
+        if isinstance(self.cells, array):
+            return memoryview(self.cells)[x::self.width]
+        return self.cells[x::self.width]
+
+    @property
+    def rows(self: Self) -> Iterator[Sequence[Any]]:
+        return (self.row(y) for y in range(self.height))
+
+    @property
+    def columns(self: Self) -> Iterator[Sequence[Any]]:
+        return (self.column(x) for x in range(self.width))
@@ -1,62 +1,156 @@
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+from aoc.common import MappedInput
+
 def extract_digit_numbers(line: str):
     return [int(ch) for ch in line if ch.isdigit()]
 
-def replace_number_text(line: str):
-    REPLACEMENTS = {
-        'zero': '0ero',
-        'one': '1ne',
-        'two': '2wo',
-        'three': '3hree',
-        'four': '4our',
-        'five': '5ive',
-        'six': '6ix',
-        'seven': '7even',
-        'eight': '8ight',
-        'nine': '9ine',
-    }
-
-    while True:
-        indexes = {}
-        for text in REPLACEMENTS:
-            idx = line.find(text)
-            if idx != -1:
-                indexes[text] = idx
-
-        if len(indexes) > 0:
-            target = min(indexes.items(), key=lambda item: item[1])[0]
-            line = line.replace(target, REPLACEMENTS[target], 1)
-        else:
-            break
-    
-    return line
+# Everything but digits and line breaks, dropped before counting
+NOT_DIGITS = bytes(byte for byte in range(256) if byte not in b'0123456789\n')
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# Bit n of each digit, as '1' or '0', one table per bit
+BIT_PLANES = [
+    bytes.maketrans(b'0123456789', bytes(ord('1') if value >> bit & 1 else ord('0') for value in range(10)))
+    for bit in range(4)
+]
+
+def sum_digit_lines(lines: bytes) -> int:
+    # lines holds only digits and starts and ends with a line break: a digit
+    # right after one is a line's first, right before one its last. Counting
+    # them by bit takes 8 scans of the block instead of 18 by digit
+    if b'\n\n' in lines:
+        raise ValueError("No digit in line")
+
+    total = 0
+    for bit, table in enumerate(BIT_PLANES):
+        plane = lines.translate(table)
+        total += (10 * plane.count(b'\n1') + plane.count(b'1\n')) << bit
 
-def extract_all_numbers(line: str):
-    return extract_digit_numbers(replace_number_text(line))
+    return total
+
+def sum_calibration_bytes(buffer: bytes | bytearray | memoryview, chunk_size: int = CHUNK_SIZE) -> int:
+    # Works on the whole file at once, a chunk at a time, without a Python
+    # object per line. The digits of the line cut at the end of a chunk are
+    # carried over to the next one
+    view = memoryview(buffer)
+    total = 0
+    pending = b'\n'
+    for start in range(0, len(view), chunk_size):
+        block = pending + view[start:start + chunk_size].tobytes().translate(None, NOT_DIGITS)
+        cut = block.rindex(b'\n')
+        total += sum_digit_lines(block[:cut + 1])
+        pending = block[cut:]
+
+    if view and view[-1] != ord('\n'):
+        # The last line has no line break of its own
+        total += sum_digit_lines(pending + b'\n')
+
+    return total
+
+# Spelled out or written as a digit, each number counts where it starts, and
+# overlapping words like 'eightwo' both count
+NUMBER_WORDS = {
+    word: value for value, word in enumerate(('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine'))
+} | {str(value): value for value in range(10)}
+
+# Transitions of each state, and the number recognized on reaching it or -1
+Automaton = tuple[list[dict[str, int]], list[int]]
+
+def build_automaton(words: dict[str, int]) -> Automaton:
+    # Aho-Corasick: a trie of the words whose missing transitions are filled in
+    # from the failure links, so scanning is a single dict lookup per character
+    transitions: list[dict[str, int]] = [{}]
+    output = [-1]
+    for word, value in words.items():
+        state = 0
+        for ch in word:
+            if ch not in transitions[state]:
+                transitions[state][ch] = len(transitions)
+                transitions.append({})
+                output.append(-1)
+            state = transitions[state][ch]
+        output[state] = value
+
+    failure = [0] * len(transitions)
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        children = transitions[state]
+        for ch, child in children.items():
+            if state:
+                failure[child] = transitions[failure[state]].get(ch, 0)
+            if output[child] == -1:
+                output[child] = output[failure[child]]
+            queue.append(child)
+
+        # Breadth first, the failure state is shallower and already complete
+        if state:
+            transitions[state] = transitions[failure[state]] | children
+
+    return transitions, output
+
+FORWARD = build_automaton(NUMBER_WORDS)
+BACKWARD = build_automaton({word[::-1]: value for word, value in NUMBER_WORDS.items()})
+
+def scan(chars: Iterable[str], automaton: Automaton) -> int:
+    # No word contains another, so the first match to end is also the first to start
+    transitions, output = automaton
+    state = 0
+    for ch in chars:
+        state = transitions[state].get(ch, 0)
+        if output[state] != -1:
+            return output[state]
+
+    raise ValueError("No number in line")
+
+def first_and_last_numbers(line: str) -> tuple[int, int]:
+    # The last number is the first one of the reversed line, read by the reversed words
+    return scan(line, FORWARD), scan(reversed(line), BACKWARD)
+
+def calibration_value(numbers: Sequence[int]) -> int:
+    if not numbers:
+        raise ValueError("No digit in line")
+    return numbers[0] * 10 + numbers[-1]
+
+def solve_part1(data: Iterable[str] | bytes | bytearray | memoryview):
+    if isinstance(data, MappedInput):
+        return sum_calibration_bytes(data.buffer)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return sum_calibration_bytes(data)
 
-def solve_part1(data):
     total = 0
     for line in data:
-        numbers = extract_digit_numbers(line)
-        line_value = numbers[0] * 10 + numbers[-1]
-        total += line_value
+        total += calibration_value(extract_digit_numbers(line))
     
     return total
 
-def solve_part2(data):
+def solve_part2(data: Iterable[str]):
     total = 0
     for line in data:
-        numbers = extract_all_numbers(line)
-        line_value = numbers[0] * 10 + numbers[-1]
-        total += line_value
+        total += calibration_value(first_and_last_numbers(line))
 
     return total
 
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    if isinstance(data, MappedInput):
+        # The digits are summed straight from the file, faster than any pass over the lines
+        return solve_part1(data), solve_part2(data)
+
+    # Both values of each line in a single pass
+    digits_total = 0
+    words_total = 0
+    for line in data:
+        digits_total += calibration_value(extract_digit_numbers(line))
+        words_total += calibration_value(first_and_last_numbers(line))
+
+    return digits_total, words_total
+
 if __name__ == '__main__':
-    with open("input/day01.txt", 'r') as data_file:
-        data: list[str] = data_file.readlines()
+    with MappedInput("input/day01.txt") as data:
+        part1, part2 = solve(data)
 
-    p1 = solve_part1(data)
-    p2 = solve_part2(data)
-    
-    print(f"Part 1: {p1}")
-    print(f"Part 2: {p2}")
+    print("Part 1:", part1)
+    print("Part 2:", part2)
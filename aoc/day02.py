@@ -1,5 +1,10 @@
-from collections import defaultdict
-from functools import reduce
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from math import prod
+from typing import Optional, Self
+
+from aoc.common import MappedInput
 
 LIMITS = {
     'red': 12,
@@ -7,64 +12,145 @@ LIMITS = {
     'blue': 14,
 }
 
-def process_game_set(game, set_str: str):
-    colors = {}
-
-def process_game(game_str: str):
-    colors = {}
-    game_sets = game_str.split("; ")
+def process_game(game_str: str) -> dict[str, int]:
+    colors: dict[str, int] = {}
 
-    for game_set in game_sets:
-        set_colors = defaultdict(int)
-        cube_groups = game_set.split(", ")
-
-        for cube_group in cube_groups:
+    for game_set in game_str.split("; "):
+        set_colors: dict[str, int] = {}
+        for cube_group in game_set.split(", "):
             count, color = cube_group.strip().split(" ")
-            count = int(count)
-            set_colors[color] += count
+            set_colors[color] = set_colors.get(color, 0) + int(count)
 
-        for color in set_colors:
-            colors[color] = max(set_colors[color], colors.get(color, 0))
+        for color, count in set_colors.items():
+            if count > colors.get(color, 0):
+                colors[color] = count
 
     return colors
 
-def is_valid_game(game_colors):
-    return all([
-        game_colors[color] <= LIMITS[color]
-        for color
-        in game_colors
-    ])
+def parse_game(line: str) -> tuple[int, dict[str, int]]:
+    game_info, game_results = line.split(": ", 1)
+
+    return int(game_info.split(" ")[1]), process_game(game_results)
+
+def bitset(games: Iterable[int], count: int) -> int:
+    # Bit n is set when game n is in games, built in a bytearray as shifting
+    # an ever growing int would be quadratic
+    bits = bytearray((count + 7) // 8)
+    for game in games:
+        bits[game >> 3] |= 1 << (game & 7)
+
+    return int.from_bytes(bits, 'little')
+
+class GameStore:
+    """
+    The most cubes of each colour shown in each game, stored by column.
+
+    Games are numbered by their position in the store. Queries on the
+    limits go through bitsets over those positions, built on the first
+    query: for each colour, the games showing at most each count of it,
+    and for each bit of the ids, the games whose id has it. The id sum of
+    the games within some limits then takes a few big int operations,
+    however many games there are.
+    """
+
+    ids: array
+    maxima: dict[str, array]
+
+    def __init__(self) -> None:
+        self.ids = array('I')
+        self.maxima = {}
+        self._index: Optional[tuple[dict[str, tuple[list[int], list[int]]], list[int]]] = None
+
+    @classmethod
+    def from_lines(cls, data: Iterable[str]) -> Self:
+        store = cls()
+        for line in data:
+            store.add(*parse_game(line))
+
+        return store
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, game_id: int, colors: Mapping[str, int]) -> None:
+        for color in colors:
+            if color not in self.maxima:
+                self.maxima[color] = array('I', bytes(self.ids.itemsize * len(self.ids)))
+
+        self.ids.append(game_id)
+        for color, column in self.maxima.items():
+            column.append(colors.get(color, 0))
+
+        self._index = None
+
+    def index(self) -> tuple[dict[str, tuple[list[int], list[int]]], list[int]]:
+        if self._index is None:
+            count = len(self.ids)
+
+            colors = {}
+            for color, column in self.maxima.items():
+                by_value: dict[int, list[int]] = {}
+                for game, maximum in enumerate(column):
+                    by_value.setdefault(maximum, []).append(game)
+
+                values = sorted(by_value)
+                at_most = []
+                games = 0
+                for value in values:
+                    games |= bitset(by_value[value], count)
+                    at_most.append(games)
+                colors[color] = values, at_most
+
+            id_bits = [
+                bitset((game for game, game_id in enumerate(self.ids) if game_id >> bit & 1), count)
+                for bit in range(max(self.ids, default=0).bit_length())
+            ]
+
+            self._index = colors, id_bits
+
+        return self._index
+
+    def possible_games(self, limits: Mapping[str, int]) -> int:
+        # A colour missing from the limits cannot be shown at all
+        colors, _ = self.index()
+
+        games = (1 << len(self.ids)) - 1
+        for color, (values, at_most) in colors.items():
+            position = bisect_right(values, limits.get(color, 0))
+            games &= at_most[position - 1] if position else 0
+
+        return games
+
+    def possible_id_sum(self, limits: Mapping[str, int] = LIMITS) -> int:
+        games = self.possible_games(limits)
+        _, id_bits = self.index()
+
+        return sum((games & games_with_bit).bit_count() << bit for bit, games_with_bit in enumerate(id_bits))
 
-def solve_part1(data: list[str]):
-    total = 0
-    for line in data:
-        game_info, game_results = line.split(": ", 1)
+    def possible_id_sums(self, limit_sets: Iterable[Mapping[str, int]]) -> list[int]:
+        return [self.possible_id_sum(limits) for limits in limit_sets]
 
-        game_id = int(game_info.split(" ")[1])
-        game_colors = process_game(game_results)
+    def power_sum(self) -> int:
+        # Colours a game never shows are left out of its power
+        return sum(prod(filter(None, counts)) for counts in zip(*self.maxima.values()))
 
-        if is_valid_game(game_colors):
-            total += game_id
-    
-    return total
+def solve_part1(data: Iterable[str], limits: Mapping[str, int] = LIMITS):
+    return GameStore.from_lines(data).possible_id_sum(limits)
 
-def solve_part2(data: list[str]):
-    total = 0
-    for line in data:
-        game_results = line.split(": ", 1)[1]
+def solve_part2(data: Iterable[str]):
+    return GameStore.from_lines(data).power_sum()
 
-        game_colors = process_game(game_results)
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    store = GameStore.from_lines(data)
 
-        total += reduce(lambda a, b: a * b, game_colors.values())
-    
-    return total
+    return store.possible_id_sum(), store.power_sum()
 
 def main():
-    with open("input/day02.txt", 'r') as data_file:
-        data: list[str] = data_file.readlines()
+    with MappedInput("input/day02.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
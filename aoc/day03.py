@@ -1,142 +1,96 @@
-import math
 import string
-from functools import reduce
-from dataclasses import dataclass
-
-class Grid:
-    def __init__(self, width: int, height:int, default_value=None):
-        self.width = width
-        self.height = height
-        self.content = [[default_value] * width for _ in range(height)]
-    
-    def get(self, x: int, y: int):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        self.content[y][x] = value
-@dataclass
-class Element:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-@dataclass
-class Number(Element):
-    def __init__(self, x, y, initial_value=0):
-        super().__init__(x, y)
-        self.value = initial_value
-        self.part = False
-    
-    def __repr__(self):
-        return f"Number({self.value})"
-    
-    def insert(self, value):
-        self.value = self.value * 10 + value
-
-    def set_part(self, is_part):
-        self.part = self.part or is_part
-
-    @property
-    def width(self):
-        return len(str(self.value))
-
-@dataclass
-class Symbol(Element):
-    def __init__(self, x, y, symbol):
-        super().__init__(x, y)
-        self.symbol = symbol
-        self.neighbors = []
-
-    def __repr__(self):
-        return f"Symbol({self.symbol}, {self.neighbors})"
-
-    def add_neighbor(self, neighbor):
-        self.neighbors.append(neighbor)
-
-def extract_info(data: list[str]):
-    symbols: list[Symbol] = []
-    numbers: list[Number] = []
-    symbol_grid: Grid = Grid(len(data[0].strip()), len(data), False)
-    current_number = None
-
-    for y, line in enumerate(data):
-        line = line.strip()
-
-        for x, char in enumerate(line):
-            if char.isdigit():
-                if not current_number:
-                    current_number = Number(x, y)
-
-                char_value = int(char)
-                current_number.insert(char_value)
-            else:
-                if char in string.punctuation and char != '.':
-                    symbols.append(Symbol(x, y, char))
-                    symbol_grid.set(x, y, True)
-
-                if current_number:
-                    numbers.append(current_number)
-                current_number = None
-
-        if current_number:
-            numbers.append(current_number)
-        current_number = None
-    
-    return (symbols, numbers, symbol_grid)
-
-
-def solve_part1(data: list[str]):
-    _, numbers, symbol_grid = extract_info(data)
-    total = 0
-    for number in numbers:
-        for y in range(number.y - 1, number.y + 2):
-            for x in range(number.x - 1, number.x + number.width + 1):
-                try:
-                    number.set_part(not not symbol_grid.get(x, y))
-                except IndexError:
-                    continue
-        if number.part:
-            total += number.value
-    
-    return total
-
-def solve_part2(data: list[str]):
-    symbols, numbers, _ = extract_info(data)
-
-    gears = [elem for elem in symbols if elem.symbol == '*']
-    gear_map = Grid(len(data[0].strip()), len(data))
-
-    for gear in gears:
-        gear_map.set(gear.x, gear.y, gear)
-
-    for number in numbers:
-        for y in range(number.y - 1, number.y + 2):
-            for x in range(number.x - 1, number.x + number.width + 1):
-                try:
-                    if gear := gear_map.get(x, y):
-                        gear.add_neighbor(number)
-                except IndexError:
-                    continue
-    
-    total = 0
-    for gear in gears:
-        if len(gear.neighbors) == 2:
-            a, b = gear.neighbors
-            total += a.value * b.value
-
-    return total
+from collections.abc import Iterable, Iterator
+
+from aoc.common import MappedInput
+
+# Symbols become 1 and anything else 0
+SYMBOL_TABLE = bytes.maketrans(
+    bytes(range(256)),
+    bytes(1 if chr(byte) in string.punctuation and chr(byte) != '.' else 0 for byte in range(256)),
+)
+
+# Numbers as (start, end, value), symbols as a mask padded by one cell on
+# each side, and the positions of the gears
+Row = tuple[list[tuple[int, int, int]], bytes, list[int]]
+
+EMPTY_ROW: Row = ([], b'', [])
+
+def scan_row(line: str) -> Row:
+    line = line.strip()
+
+    numbers = []
+    start = None
+    for x, ch in enumerate(line):
+        if ch.isdigit():
+            if start is None:
+                start = x
+        elif start is not None:
+            numbers.append((start, x, int(line[start:x])))
+            start = None
+    if start is not None:
+        numbers.append((start, len(line), int(line[start:])))
+    symbols = b'\0' + line.encode().translate(SYMBOL_TABLE) + b'\0'
+
+    gears = []
+    x = line.find('*')
+    while x != -1:
+        gears.append(x)
+        x = line.find('*', x + 1)
+
+    return numbers, symbols, gears
+
+def windows(data: Iterable[str]) -> Iterator[tuple[Row, Row, Row]]:
+    # Each row along with the ones above and below it, only three rows being
+    # kept at any time. The first and last rows get an empty neighbor
+    above, current = EMPTY_ROW, None
+    for line in data:
+        row = scan_row(line)
+        if current is not None:
+            yield above, current, row
+            above = current
+        current = row
+
+    if current is not None:
+        yield above, current, EMPTY_ROW
+
+def part_numbers(window: tuple[Row, Row, Row]) -> Iterator[int]:
+    _, current, _ = window
+
+    for start, end, value in current[0]:
+        # In the padded masks, the cells around the number span start to end + 2
+        if any(1 in row[1][start:end + 2] for row in window):
+            yield value
+
+def gear_ratios(window: tuple[Row, Row, Row]) -> Iterator[int]:
+    _, current, _ = window
+
+    for x in current[2]:
+        neighbors = [value for row in window for start, end, value in row[0] if start <= x + 1 and end >= x]
+        if len(neighbors) == 2:
+            yield neighbors[0] * neighbors[1]
+
+def solve_part1(data: Iterable[str]):
+    return sum(sum(part_numbers(window)) for window in windows(data))
+
+def solve_part2(data: Iterable[str]):
+    return sum(sum(gear_ratios(window)) for window in windows(data))
+
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    parts_total = 0
+    ratios_total = 0
+    for window in windows(data):
+        parts_total += sum(part_numbers(window))
+        ratios_total += sum(gear_ratios(window))
+
+    return parts_total, ratios_total
 
 
 def main():
-    with open("input/day03.txt", 'r') as data_file:
-        data: list[str] = data_file.readlines()
-    
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    with MappedInput("input/day03.txt") as data:
+        part1, part2 = solve(data)
+
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
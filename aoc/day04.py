@@ -1,64 +1,85 @@
-from functools import reduce
+from collections.abc import Iterable, Iterator
+
+from aoc.common import MappedInput
 
 class Card:
-    def __init__(self, card_id: int, winners: set[int], numbers: set[int]):
+    # Numbers are kept as bitmasks, bit n being set when n is on the card
+    def __init__(self, card_id: int, winners: int, numbers: int):
         self.card_id = card_id
         self.winners = winners
         self.numbers = numbers
-        self.instances = 1
-    
-    def add_copies(self, copies=1):
-        self.instances += copies
 
-def extract_card_info(data: list[str]) -> list[Card]:
-    cards = []
+    @property
+    def matches(self) -> int:
+        return (self.winners & self.numbers).bit_count()
+
+def number_mask(numbers: str) -> int:
+    mask = 0
+    for num in numbers.split():
+        mask |= 1 << int(num)
+
+    return mask
+
+def extract_card_info(data: Iterable[str]) -> Iterator[Card]:
     for line in data:
         line = line.strip()
         card_meta, card_contents = line.split(": ")
         card_number = int(card_meta.split()[1])
 
-        card_winners = {int(num) for num in card_contents.split(" | ")[0].split()}
-        card_numbers = {int(num) for num in card_contents.split(" | ")[1].split()}
-
-        cards.append(Card(card_number, card_winners, card_numbers))
+        card_winners, card_numbers = card_contents.split(" | ")
 
-    return cards
-
-def solve_part1(data: list[str]):
-    cards = extract_card_info(data)
+        yield Card(card_number, number_mask(card_winners), number_mask(card_numbers))
 
+def sum_points(cards: Iterable[Card]) -> int:
     total = 0
     for card in cards:
-        winning_numbers = card.winners & card.numbers
-
-        if winners := len(winning_numbers):
-            total += 2 ** (winners - 1)
+        if matches := card.matches:
+            total += 1 << (matches - 1)
     
     return total
 
 
-def solve_part2(data: list[str]):
-    cards = extract_card_info(data)
-    for idx, card in enumerate(cards):
-        winners = len(card.winners & card.numbers)
+def count_instances(cards: Iterable[Card]) -> int:
+    # Difference array over the upcoming cards: a card's copies are added once
+    # to the running count and taken back once past the last card they reach,
+    # so each card costs the same however many matches it has
+    expiring: dict[int, int] = {}
+    copies = 0
 
-        for i in range(1, winners + 1):
-            try:
-                cards[idx + i].add_copies(card.instances)
-            except IndexError:
-                continue
+    total = 0
+    for position, card in enumerate(cards):
+        copies -= expiring.pop(position, 0)
+        instances = 1 + copies
+        total += instances
 
-    total = reduce(lambda val, card: val + card.instances, cards, 0)
+        if matches := card.matches:
+            copies += instances
+            end = position + matches + 1
+            expiring[end] = expiring.get(end, 0) + instances
 
     return total
 
 
+def solve_part1(data: Iterable[str]):
+    return sum_points(extract_card_info(data))
+
+
+def solve_part2(data: Iterable[str]):
+    return count_instances(extract_card_info(data))
+
+
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    cards = list(extract_card_info(data))
+
+    return sum_points(cards), count_instances(cards)
+
+
 def main():
-    with open("input/day04.txt", 'r') as data_file:
-        data: list[str] = data_file.readlines()
+    with MappedInput("input/day04.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
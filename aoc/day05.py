@@ -1,4 +1,10 @@
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import reduce
+from typing import Optional, Self
+
+from aoc.common import MappedInput
 
 @dataclass
 class Transform:
@@ -6,31 +12,105 @@ class Transform:
         self.dest_pos = dest_pos
         self.source_pos = source_pos
         self.length = length
-        self.range = range(self.source_pos, self.source_pos + self.length)
-    
-    def __call__(self, value):
-        delta = self.dest_pos - self.source_pos
-        transformed = False
-        if value in self.range:
-            value += delta
-            transformed = True
-        return value, transformed
+
+class Piecewise:
+    """
+    Piecewise function adding offsets[i] to the values from starts[i] up to
+    starts[i + 1].
+
+    starts begins at 0 and the last piece never ends, so every non-negative
+    value has a piece, found by bisecting starts. Two functions compose into
+    another one, with at most as many pieces as both together: the pieces
+    of the first one are cut where their image crosses a start of the second.
+    """
+
+    starts: list[int]
+    offsets: list[int]
+
+    def __init__(self, starts: list[int], offsets: list[int]):
+        self.starts = starts
+        self.offsets = offsets
+
+    @classmethod
+    def identity(cls) -> Self:
+        return cls([0], [0])
+
+    @classmethod
+    def from_transforms(cls, transforms: Iterable[Transform]) -> Self:
+        # Values no transform covers are left as they are
+        starts, offsets = [0], [0]
+        for transform in sorted(transforms, key=lambda transform: transform.source_pos):
+            if not transform.length:
+                continue
+            if transform.source_pos < starts[-1]:
+                raise ValueError(f"Transform at {transform.source_pos} overlaps the previous one")
+
+            delta = transform.dest_pos - transform.source_pos
+            if transform.source_pos == starts[-1]:
+                offsets[-1] = delta
+            else:
+                starts.append(transform.source_pos)
+                offsets.append(delta)
+
+            starts.append(transform.source_pos + transform.length)
+            offsets.append(0)
+
+        return cls(starts, offsets).merged()
+
+    def merged(self) -> Self:
+        # Neighbor pieces with the same offset become one
+        starts, offsets = [self.starts[0]], [self.offsets[0]]
+        for start, offset in zip(self.starts[1:], self.offsets[1:]):
+            if offset != offsets[-1]:
+                starts.append(start)
+                offsets.append(offset)
+
+        return self.__class__(starts, offsets)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def then(self, other: 'Piecewise') -> Self:
+        # Applying self, then other
+        starts, offsets = [], []
+        stops: list[Optional[int]] = [*self.starts[1:], None]
+        for start, stop, offset in zip(self.starts, stops, self.offsets):
+            low = start + offset
+            high = None if stop is None else stop + offset
+
+            piece = bisect_right(other.starts, low) - 1
+            while True:
+                starts.append(max(other.starts[piece], low) - offset)
+                offsets.append(offset + other.offsets[piece])
+
+                piece += 1
+                if piece == len(other.starts) or (high is not None and other.starts[piece] >= high):
+                    break
+
+        return self.__class__(starts, offsets).merged()
 
 class Map:
     def __init__(self, source, destination):
         self.source = source
         self.destination = destination
         self.transforms = []
+        self._piecewise: Optional[Piecewise] = None
     
     def add_transform(self, dest_pos, source_pos, length):        
         self.transforms.append(Transform(dest_pos, source_pos, length))
+        self._piecewise = None
+
+    @property
+    def piecewise(self) -> Piecewise:
+        if self._piecewise is None:
+            self._piecewise = Piecewise.from_transforms(self.transforms)
+        return self._piecewise
     
     def apply_transforms(self, value):
-        for transform in self.transforms:
-            value, transformed = transform(value)
-            if transformed:
-                break
-        return value
+        return self.piecewise(value)
 
 def extract_info(data: list[str]):
     seeds = [int(num) for num in data[0].split() if num.isdecimal()]
@@ -51,80 +131,79 @@ def extract_info(data: list[str]):
 
     return seeds, maps
 
-def map_seed(seed: int, mappings: list[Map]):
-    for mapping in mappings:
-        seed = mapping.apply_transforms(seed)
-    
-    return seed
+def compose_maps(mappings: list[Map]) -> Piecewise:
+    # A single function from seed to location, whatever the number of maps
+    return reduce(Piecewise.then, (mapping.piecewise for mapping in mappings), Piecewise.identity())
+
+def lowest_location(seeds: list[int], maps: list[Map]) -> int:
+    return min(map(compose_maps(maps), seeds))
+
+# Half-open ranges of values, as (start, stop)
+Ranges = list[tuple[int, int]]
+
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> Ranges:
+    # Sorted, with overlapping and touching ranges joined and empty ones dropped
+    merged: Ranges = []
+    for start, stop in sorted(ranges):
+        if start >= stop:
+            continue
+        if merged and start <= merged[-1][1]:
+            if stop > merged[-1][1]:
+                merged[-1] = merged[-1][0], stop
+        else:
+            merged.append((start, stop))
+
+    return merged
+
+def propagate(ranges: Ranges, function: Piecewise) -> Ranges:
+    # Sweeps the sorted ranges and the pieces together, cutting each range
+    # where it crosses into the next piece
+    starts, offsets = function.starts, function.offsets
+    last = len(starts) - 1
+
+    images = []
+    piece = 0
+    for start, stop in ranges:
+        while piece < last and starts[piece + 1] <= start:
+            piece += 1
+
+        while True:
+            end = stop if piece == last else min(stop, starts[piece + 1])
+            images.append((start + offsets[piece], end + offsets[piece]))
+            if end == stop:
+                break
+            start = end
+            piece += 1
 
-def solve_part1(data: list[str]) -> int:
-    seeds, maps = extract_info(data)
+    return merge_ranges(images)
 
-    mapped_seeds = map(lambda seed: map_seed(seed, maps), seeds)
-    
-    return min(mapped_seeds)
-
-def split_range(source: range, overlay: range) -> set[range]:
-    splits = set()
-
-    if overlay.start in source and overlay.stop in source:
-        splits.add(range(source.start, overlay.start))
-        splits.add(overlay)
-        splits.add(range(overlay.stop, source.stop))
-    elif overlay.start in source:
-        splits.add(range(source.start, overlay.start))
-        splits.add(range(overlay.start, source.stop))
-    elif overlay.stop in source:
-        splits.add(range(source.start, overlay.stop))
-        splits.add(range(overlay.stop, source.stop))
-    else:
-        splits.add(source)
-    
-    return splits
+def lowest_range_location(seeds: list[int], mappings: list[Map]) -> int:
+    ranges = merge_ranges((start, start + length) for start, length in zip(seeds[::2], seeds[1::2]))
+    if not ranges:
+        raise ValueError("No seeds")
 
-def transform_range(value: range, mapping: Map):
-    start, stop = value.start, value.stop
+    for mapping in mappings:
+        ranges = propagate(ranges, mapping.piecewise)
 
-    start = mapping.apply_transforms(start)
-    # Transform but move the stop point in-range temporarily
-    # to properly transform it into its new range
-    stop = mapping.apply_transforms(stop - 1) + 1
+    return ranges[0][0]
 
-    return range(start, stop)
+def solve_part1(data: list[str]) -> int:
+    return lowest_location(*extract_info(data))
 
 def solve_part2(data: list[str]) -> int:
-    seeds, mappings = extract_info(data)
+    return lowest_range_location(*extract_info(data))
 
-    seed_ranges: set[range] = set()
-    for seeds_start, seeds_length in zip(seeds[::2], seeds[1::2]):
-        seed_ranges.add(range(seeds_start, seeds_start + seeds_length))
-    
-    for mapping in mappings:
-        new_seed_ranges = set()
-        for seed_range in seed_ranges:
-            new_seed_ranges.update(
-                *[
-                    split_range(seed_range, transform.range) for
-                    transform in mapping.transforms
-                ]
-            )
-            
-
-        seed_ranges = {transform_range(r, mapping) for r in new_seed_ranges}
-
-    mins = 99999999999999999999999999
-    for r in seed_ranges:
-        if r.start > 0:
-            mins = min(mins, r.start)
+def solve(data: list[str]) -> tuple[int, int]:
+    seeds, maps = extract_info(data)
 
-    return mins
+    return lowest_location(seeds, maps), lowest_range_location(seeds, maps)
 
 def main():
-    with open("input/day05.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day05.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,4 +1,7 @@
-from functools import reduce
+from collections.abc import Iterable
+from math import isqrt, prod
+
+from aoc.common import MappedInput
 
 def extract_info(data: list[str], concatenate: bool = False) -> list[tuple[int, int]]:
     time_line = data[0].removeprefix("Time:").lstrip()
@@ -13,45 +16,47 @@ def extract_info(data: list[str], concatenate: bool = False) -> list[tuple[int,
 
     return list(zip(times, distances))
 
-def solve_part1(data: list[str]) -> int:
-    success_counts = []
-    for time, distance in extract_info(data):
-        successful = []
-        for t in range(time + 1):
-            travel = t * (time - t)
-            if travel > distance:
-                successful.append(t)
-        success_counts.append(len(successful))
+def count_ways(time: int, distance: int) -> int:
+    # Holding for t wins when t * (time - t) > distance, that is for the t
+    # strictly between the roots (time ± sqrt(time² - 4 * distance)) / 2
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0:
+        return 0
+    if distance < 0:
+        return time + 1
+
+    # Rounding of the square root leaves the first winning time off by at most one
+    shortest = (time - isqrt(discriminant)) // 2
+    if shortest * (time - shortest) <= distance:
+        shortest += 1
+    elif shortest and (shortest - 1) * (time - shortest + 1) > distance:
+        shortest -= 1
+
+    # The winning times are symmetric around time / 2
+    return max(time - 2 * shortest + 1, 0)
 
-    return reduce(lambda a, b: a * b, success_counts)
+def count_ways_batch(times: Iterable[int], distances: Iterable[int]) -> list[int]:
+    return list(map(count_ways, times, distances))
+
+def count_ways_product(races: list[tuple[int, int]]) -> int:
+    return prod(count_ways(time, distance) for time, distance in races)
+
+def solve_part1(data: list[str]) -> int:
+    return count_ways_product(extract_info(data))
 
 def solve_part2(data: list[str]) -> int:
-    time, distance = extract_info(data, True)[0]
-
-    success_min = 0
-    success_max = time
-
-    for t in range(time + 1):
-        travel = t * (time - t)
-        if travel > distance:
-            success_min = t
-            break
-    
-    for t in range(time + 1, 0, -1):
-        travel = t * (time - t)
-        if travel > distance:
-            # Add +1 to make is an inclusive range
-            success_max = t + 1
-            break
-
-    return success_max - success_min
+    return count_ways(*extract_info(data, True)[0])
+
+def solve(data: list[str]) -> tuple[int, int]:
+    # The two parts read the same two lines differently, there is nothing to share
+    return solve_part1(data), solve_part2(data)
 
 def main():
-    with open("input/day06.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day06.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
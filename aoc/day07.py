@@ -1,21 +1,20 @@
 from enum import IntEnum, auto
 from collections import Counter
+from collections.abc import Iterable
+from functools import cache
+from itertools import combinations, combinations_with_replacement
 
-SYMBOL_LABEL_VALUES = {
-    'T': 10,
-    'J': 11,
-    'Q': 12,
-    'K': 13,
-    'A': 14,
-}
+from aoc.common import MappedInput
+
+# Labels from weakest to strongest, a joker being the weakest card
+LABELS = '23456789TJQKA'
+JOKER_LABELS = 'J23456789TQKA'
 
-def get_label_value(label: str, jokers: bool = False) -> int:
-    if label.isdecimal():
-        return int(label)
-    elif jokers and label == 'J':
-        return 1
-    else:
-        return SYMBOL_LABEL_VALUES[label]
+# Labels to their strength as a single base 13 digit
+RANK_DIGITS = {
+    False: bytes.maketrans(LABELS.encode(), b'0123456789abc'),
+    True: bytes.maketrans(JOKER_LABELS.encode(), b'0123456789abc'),
+}
 
 class Hand:
     class Type(IntEnum):
@@ -29,88 +28,158 @@ class Hand:
 
     def __init__(self, cards, jokers):
         self.cards = cards
-        self.type = self._get_type(cards, jokers)
         self.jokers = jokers
+        self.type = self._get_type(cards, jokers)
+        self.key = hand_key(''.join(cards), jokers)
     
     def __repr__(self):
         return f"Hand({''.join(self.cards)})"
 
-    def __gt__(self, other):
-        if self.type != other.type:
-            return self.type > other.type
-        else:
-            for my_card, their_card in zip(self.cards, other.cards):
-                my_value = get_label_value(my_card, self.jokers)
-                their_value = get_label_value(their_card, self.jokers)
-                if my_value != their_value:
-                    return my_value > their_value
-
-    def _get_type(self, cards: list[str], jokers: bool = False):
-        groups = Counter()
-        for card in cards:
-            groups[card] += 1
-        
-        # If in joker mode, and there's at least one joker but less than a full hand
-        if jokers and 'J' in groups and groups['J'] != 5:
-            n_jokers = groups['J']
-            del groups['J']
-            most_cards = max(groups, key=groups.get)
-            groups[most_cards] += n_jokers
-
-        ordered_group_lengths = sorted(list(groups.values()), reverse=True)
-
-        match ordered_group_lengths:
-            case [5]:
-                return Hand.Type.FiveKind
-            case [4, 1]:
-                return Hand.Type.FourKind
-            case [3, 2]:
-                return Hand.Type.FullHouse
-            case [3, 1, 1]:
-                return Hand.Type.ThreeKind
-            case [2, 2, 1]:
-                return Hand.Type.TwoPair
-            case [2, 1, 1, 1]:
-                return Hand.Type.OnePair
-            case [1, 1, 1, 1, 1]:
-                return Hand.Type.HighCard
-            case _:
-                raise ValueError(f"Invalid card set {''.join(cards)}")
-    
-def extract_info(data: list[str], jokers: bool = False):
-    info = []
+    def __lt__(self, other):
+        return self.key < other.key
+
+    @staticmethod
+    def _get_type(cards: Iterable[str], jokers: bool = False):
+        return Hand.Type(type_table(jokers)[hand_code(''.join(cards), jokers)])
+
+def classify(cards: Iterable[str], jokers: bool = False) -> Hand.Type:
+    groups = Counter(cards)
+
+    # If in joker mode, and there's at least one joker but less than a full hand
+    if jokers and 0 < groups['J'] < 5:
+        n_jokers = groups.pop('J')
+        most_cards = max(groups, key=groups.get)
+        groups[most_cards] += n_jokers
+
+    ordered_group_lengths = sorted(groups.values(), reverse=True)
+
+    match ordered_group_lengths:
+        case [5]:
+            return Hand.Type.FiveKind
+        case [4, 1]:
+            return Hand.Type.FourKind
+        case [3, 2]:
+            return Hand.Type.FullHouse
+        case [3, 1, 1]:
+            return Hand.Type.ThreeKind
+        case [2, 2, 1]:
+            return Hand.Type.TwoPair
+        case [2, 1, 1, 1]:
+            return Hand.Type.OnePair
+        case [1, 1, 1, 1, 1]:
+            return Hand.Type.HighCard
+        case _:
+            raise ValueError(f"Invalid card set {''.join(cards)}")
+
+HAND_CODES = 13 ** 5
+
+def hand_code(cards: str, jokers: bool = False) -> int:
+    # The card strengths as the digits of a base 13 number, below HAND_CODES
+    if len(cards) != 5:
+        raise ValueError(f"Invalid card set {cards}")
+    return int(cards.encode().translate(RANK_DIGITS[jokers]), 13)
+
+@cache
+def type_table(jokers: bool) -> bytes:
+    """
+    Type of every hand, indexed by hand code, built on first use.
+
+    Calling classify() for each of the 13**5 codes takes seconds, so the
+    table is built from a count per code that determines the hand's type:
+    the number of pairs of positions holding equal cards, jokers left aside,
+    plus 16 times the number of jokers.
+    """
+    joker = 0 if jokers else None
+    labels = JOKER_LABELS if jokers else LABELS
+
+    def match_count(ranks: Iterable[int]) -> int:
+        ranks = list(ranks)
+        pairs = sum(a == b != joker for a, b in combinations(ranks, 2))
+        return pairs + 16 * ranks.count(joker)
+
+    # The counts of all the codes are the bytes of one big int, the count of
+    # code n in byte n. Each term added below is a byte string of 0s and one
+    # value, read as a big int: as the counts never go past 10 pairs + 16 * 5
+    # jokers = 90, no byte carries into the next and adding the strings as
+    # ints adds them byte by byte.
+    #
+    # In code order, the position p of a hand, the digit of weight 13**(4 - p),
+    # keeps each rank for runs of 13**(4 - p) codes, and goes through the 13
+    # ranks 13**p times over.
+    counts = 0
+    for first, second in combinations(range(5), 2):
+        # For each value of the first position, the positions in between go
+        # through all theirs, and for each of them the second position through
+        # its 13 runs: 1 on the run holding the same value, unless that is the
+        # joker. The whole repeats for the positions before the first
+        run = 13 ** (4 - second)
+        matching = b''.join(
+            b''.join((b'\1' if other == value != joker else b'\0') * run for other in range(13)) * 13 ** (second - first - 1)
+            for value in range(13)
+        )
+        counts += int.from_bytes(matching * 13 ** first, 'big')
+    for position in range(5):
+        # 16 on the runs where the position holds the joker
+        jokers_at = b''.join((b'\x10' if value == joker else b'\0') * 13 ** (4 - position) for value in range(13))
+        counts += int.from_bytes(jokers_at * 13 ** position, 'big')
+
+    # Every hand with the same count has the same type, so classifying one hand
+    # of each multiset of ranks fills a translation from counts to types
+    types = bytearray(256)
+    for ranks in combinations_with_replacement(range(13), 5):
+        types[match_count(ranks)] = classify([labels[rank] for rank in ranks], jokers)
+
+    return counts.to_bytes(HAND_CODES, 'big').translate(types)
+
+def parse_hands(data: Iterable[str]) -> list[tuple[str, int]]:
+    hands = []
     for line in data:
-        hand = Hand(list(line.split()[0]), jokers)
-        bid = int(line.split()[1])
+        cards, bid = line.split()
+        hands.append((cards, int(bid)))
 
-        info.append((hand, bid))
-    
-    return info
+    return hands
+
+def hand_key(cards: str, jokers: bool = False) -> int:
+    # The type above the hand code, so keys sort as the hands rank
+    code = hand_code(cards, jokers)
+
+    return type_table(jokers)[code] * HAND_CODES + code
+
+def extract_info(hands: Iterable[tuple[str, int]], jokers: bool = False):
+    return [(Hand(list(cards), jokers), bid) for cards, bid in hands]
+
+def total_winnings(hands: Iterable[tuple[str, int]], jokers: bool) -> int:
+    # Plain int keys rather than Hand objects, which take far longer to sort.
+    # Sorting positions keeps equal hands in input order, as sorting hands did
+    table = type_table(jokers)
+    keys = []
+    bids = []
+    for cards, bid in hands:
+        code = hand_code(cards, jokers)
+        keys.append(table[code] * HAND_CODES + code)
+        bids.append(bid)
+
+    ranked = sorted(range(len(keys)), key=keys.__getitem__)
+
+    return sum(rank * bids[position] for rank, position in enumerate(ranked, 1))
 
-def solve_part1(data: list[str]) -> int:
-    info = extract_info(data, False)
-    info.sort(key=lambda elem: elem[0])
-    total = 0
-    for rank, (hand, bid) in enumerate(info, 1):
-        total += bid * rank
+def solve_part1(data: Iterable[str]) -> int:
+    return total_winnings(parse_hands(data), jokers=False)
 
-    return total
+def solve_part2(data: Iterable[str]) -> int:
+    return total_winnings(parse_hands(data), jokers=True)
 
-def solve_part2(data: list[str]) -> int:
-    info = extract_info(data, True)
-    info.sort(key=lambda elem: elem[0])
-    total = 0
-    for rank, (hand, bid) in enumerate(info, 1):
-        total += bid * rank
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    hands = parse_hands(data)
 
-    return total
+    return total_winnings(hands, jokers=False), total_winnings(hands, jokers=True)
 
 def main():
-    with open("input/day07.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day07.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,6 +1,10 @@
+from array import array
+from collections.abc import Iterable
 from enum import Enum
-import itertools
 import math
+from typing import Optional
+
+from aoc.common import MappedInput
 
 class Direction(Enum):
     left = 'L'
@@ -33,58 +37,289 @@ def extract_info(data: list[str]) -> tuple[list[str], dict[str, Node]]:
     return instructions, nodes
 
 
-def next_node(nodes: list[Node], current_node: Node, direction: str):
-    if direction == Direction.left.value:
-        return nodes[current_node.left]
-    elif direction == Direction.right.value:
-        return nodes[current_node.right]
-    else:
-        raise ValueError(f"Invalid Direction {direction}")
+# Marks the passes not composed yet
+UNKNOWN = 0xFFFFFFFF
 
+# Fewer nodes than this are stepped one by one rather than mapped together
+BATCH_SIZE = 16
 
-def solve_part1(data: list[str]) -> int:
-    instructions, nodes = extract_info(data)
+class Cycle:
+    """
+    The effect of one pass through the whole instruction string.
 
-    current_node = nodes['AAA']
-    steps = 0
-    for direction in itertools.cycle(instructions):
-        current_node = next_node(nodes, current_node, direction)
-        steps += 1
+    jump[n] is the node a pass starting on node n ends on, and hits[n] the
+    steps into that pass, from 1, at which it stands on a target node.
+    Passes are composed for a batch of nodes at once, mapping the whole
+    batch through the left or right table for each instruction, and kept,
+    so walking the network takes one lookup per pass rather than one per
+    step. Only the passes a walk needs are composed: for all the nodes of a
+    large network with long instructions, that is often far more work than
+    the walks themselves, see trace_ghosts() for when it is not.
+    """
 
-        if current_node.name == 'ZZZ':
-            break
-    
-    return steps
+    length: int
+    jump: array
+    hits: dict[int, list[int]]
 
+    def __init__(self, network: 'Network', targets: Iterable[int]):
+        self.network = network
+        self.length = len(network.instructions)
 
-def solve_part2(data: list[str]) -> int:
-    instructions, nodes = extract_info(data)
+        self.is_target = bytearray(len(network))
+        for target in targets:
+            self.is_target[target] = 1
 
-    starting_points = filter(lambda node_name: node_name.endswith('A'), nodes)
+        self.jump = array('I', [UNKNOWN]) * len(network)
+        self.hits = {}
 
-    branches = [nodes[start] for start in starting_points]
-    branch_steps = []
+    def compose(self, nodes: Iterable[int]) -> None:
+        starts = [node for node in dict.fromkeys(nodes) if self.jump[node] == UNKNOWN]
+        if len(starts) >= BATCH_SIZE:
+            self._compose_batch(starts)
+        else:
+            for start in starts:
+                self._compose_one(start)
 
-    for branch in branches:
-        steps = 0
-        
-        for direction in itertools.cycle(instructions):
-            branch = next_node(nodes, branch, direction)
-            steps += 1
+    def _compose_one(self, start: int) -> None:
+        # Building arrays for small batches costs more than stepping
+        is_target = self.is_target
+        hits = []
+        node = start
+        for offset, table in enumerate(self.network.tables, 1):
+            node = table[node]
+            if is_target[node]:
+                hits.append(offset)
 
-            if branch.name.endswith('Z'):
-                branch_steps.append(steps)
-                break
-    
-    return math.lcm(*branch_steps)
+        if hits:
+            self.hits[start] = hits
+        self.jump[start] = node
+
+    def _compose_batch(self, starts: list[int]) -> None:
+        positions = array('I', starts)
+        for offset, table in enumerate(self.network.tables, 1):
+            positions = array('I', map(table.__getitem__, positions))
+
+            # Targets are few, so the batch members standing on one are found with bytes.find
+            reached = bytes(map(self.is_target.__getitem__, positions))
+            index = reached.find(1)
+            while index != -1:
+                self.hits.setdefault(starts[index], []).append(offset)
+                index = reached.find(1, index + 1)
+
+        for start, end in zip(starts, positions):
+            self.jump[start] = end
+
+    def next_pass(self, node: int) -> int:
+        if self.jump[node] == UNKNOWN:
+            self.compose([node])
+        return self.jump[node]
+
+    def first_hit(self, start: int) -> int:
+        # Whole passes are skipped until one goes through a target. Past one
+        # pass per node, the walk is going around a loop without any
+        node = start
+        for passes in range(len(self.jump) + 1):
+            if self.jump[node] == UNKNOWN:
+                self.compose([node])
+            if offsets := self.hits.get(node):
+                return passes * self.length + offsets[0]
+            node = self.jump[node]
+
+        raise ValueError("No target can be reached")
+
+class Network:
+    # Nodes are numbered in input order, their left and right neighbors kept by number
+    names: list[str]
+    ids: dict[str, int]
+    left: array
+    right: array
+    instructions: list[Direction]
+    tables: list[array]
+
+    def __init__(self, instructions: Iterable[str], nodes: dict[str, Node]):
+        try:
+            self.instructions = [Direction(direction) for direction in instructions]
+        except ValueError as error:
+            raise ValueError(f"Invalid Direction in {''.join(instructions)}") from error
+
+        self.names = list(nodes)
+        self.ids = {name: node_id for node_id, name in enumerate(self.names)}
+        self.left = array('I', (self.ids[node.left] for node in nodes.values()))
+        self.right = array('I', (self.ids[node.right] for node in nodes.values()))
+        # The table each instruction steps through
+        self.tables = [self.left if direction is Direction.left else self.right for direction in self.instructions]
+        self._cycles: dict[frozenset[int], Cycle] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def cycle(self, targets: Iterable[int]) -> Cycle:
+        key = frozenset(targets)
+        if key not in self._cycles:
+            self._cycles[key] = Cycle(self, key)
+        return self._cycles[key]
+
+    def matching(self, suffix: str) -> list[int]:
+        return [node_id for node_id, name in enumerate(self.names) if name.endswith(suffix)]
+
+
+def count_steps(network: Network) -> int:
+    return network.cycle([network.ids['ZZZ']]).first_hit(network.ids['AAA'])
+
+
+class GhostPath:
+    """
+    The passes a ghost goes through, as the node each one starts on.
+
+    The first prefix passes are only gone through once, the ones after
+    them repeat forever, so the ghost stands on a target at the steps
+    hit_times() lists at first and at those plus any multiple of the
+    period's steps afterwards.
+    """
+
+    passes: list[int]
+    prefix: int
+
+    def __init__(self, passes: list[int], prefix: int):
+        self.passes = passes
+        self.prefix = prefix
+
+    @property
+    def period(self) -> int:
+        return len(self.passes) - self.prefix
+
+    def hit_times(self, cycle: Cycle, start: int, stop: int) -> list[int]:
+        # Steps at which the passes from start up to stop stand on a target
+        return [
+            index * cycle.length + offset
+            for index in range(start, stop)
+            for offset in cycle.hits.get(self.passes[index], ())
+        ]
+
+    def is_hit(self, cycle: Cycle, time: int) -> bool:
+        index, offset = divmod(time, cycle.length)
+        if not offset:
+            # The last step of the previous pass
+            index, offset = index - 1, cycle.length
+        if index >= self.prefix:
+            index = self.prefix + (index - self.prefix) % self.period
+
+        return offset in cycle.hits.get(self.passes[index], ())
+
+
+def trace_ghosts(cycle: Cycle, starts: list[int]) -> list[GhostPath]:
+    # Every ghost is stepped a pass at a time, the passes of all the ghosts
+    # still going composed together, until each comes back to a node it
+    # started a pass on before
+    passes = [[start] for start in starts]
+    seen = [{start: 0} for start in starts]
+    paths: list[Optional[GhostPath]] = [None] * len(starts)
+
+    going = list(range(len(starts)))
+    traced = 0
+    while going:
+        # Composing every pass in one batch is cheaper per pass, but only pays
+        # off for long walks. Switching once the walks have cost as much as
+        # that batch spends at most twice what the better choice would have
+        if traced < len(cycle.jump) <= traced + len(going):
+            cycle.compose(range(len(cycle.jump)))
+        cycle.compose(passes[ghost][-1] for ghost in going)
+        traced += len(going)
+
+        still_going = []
+        for ghost in going:
+            node = cycle.jump[passes[ghost][-1]]
+            if node in seen[ghost]:
+                paths[ghost] = GhostPath(passes[ghost], seen[ghost][node])
+            else:
+                seen[ghost][node] = len(passes[ghost])
+                passes[ghost].append(node)
+                still_going.append(ghost)
+        going = still_going
+
+    return paths
+
+
+def combine_congruences(first: tuple[int, int], second: tuple[int, int]) -> Optional[tuple[int, int]]:
+    # Generalized CRT: moduli need not be coprime, the residues only have to
+    # agree modulo their gcd
+    (residue, modulus), (other_residue, other_modulus) = first, second
+    divisor = math.gcd(modulus, other_modulus)
+    if (other_residue - residue) % divisor:
+        return None
+
+    lcm = modulus // divisor * other_modulus
+    factor = (other_residue - residue) // divisor * pow(modulus // divisor, -1, other_modulus // divisor)
+
+    return (residue + modulus * factor) % lcm, lcm
+
+
+def count_ghost_steps(network: Network) -> int:
+    """
+    First step at which every ghost stands on a node ending with Z.
+
+    Each ghost settles into a loop of passes after some prefix. Before the
+    last ghost has settled, only the steps at which some ghost hits a
+    target within its prefix can work, and they are few enough to check
+    one by one. After that, every ghost hits a target at a set of residues
+    modulo its period, which are combined ghost by ghost with the CRT.
+    """
+
+    starts = network.matching('A')
+    if not starts:
+        raise ValueError("No ghost starts on a node ending with A")
+
+    cycle = network.cycle(network.matching('Z'))
+    paths = trace_ghosts(cycle, starts)
+
+    candidates = [
+        time
+        for path in paths
+        for time in path.hit_times(cycle, 0, path.prefix)
+        if all(other.is_hit(cycle, time) for other in paths)
+    ]
+
+    # Residues all share the modulus, the lcm of the periods so far
+    residues, modulus = {0}, 1
+    for path in paths:
+        period = path.period * cycle.length
+        hits = {time % period for time in path.hit_times(cycle, path.prefix, len(path.passes))}
+        congruences = {
+            combine_congruences((residue, modulus), (hit, period))
+            for residue in residues for hit in hits
+        } - {None}
+
+        residues = {residue for residue, _ in congruences}
+        modulus = math.lcm(modulus, period)
+
+    settled = max(max(path.prefix for path in paths) * cycle.length, 1)
+    candidates.extend(residue + (settled - residue + modulus - 1) // modulus * modulus for residue in residues)
+
+    if not candidates:
+        raise ValueError("The ghosts never all stand on a target at once")
+    return min(candidates)
+
+
+def solve_part1(data: list[str]) -> int:
+    return count_steps(Network(*extract_info(data)))
+
+
+def solve_part2(data: list[str]) -> int:
+    return count_ghost_steps(Network(*extract_info(data)))
+
+
+def solve(data: list[str]) -> tuple[int, int]:
+    network = Network(*extract_info(data))
+
+    return count_steps(network), count_ghost_steps(network)
 
 
 def main():
-    with open("input/day08.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day08.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
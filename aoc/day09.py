@@ -1,57 +1,93 @@
-from itertools import pairwise
-from pprint import pprint
+from collections.abc import Iterable, Iterator
+from functools import cache
+from math import comb
+from operator import add, mul
+from typing import Self
 
-def extract_info(data: list[str]) -> list[list[int]]:
-    return [
+from aoc.common import MappedInput
+
+def extract_info(data: Iterable[str]) -> Iterator[list[int]]:
+    return (
         [int(n) for n in line.split()]
         for line in data
-    ]
+    )
+
+
+@cache
+def weights(length: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    # Extending the difference pyramid of n values down to a constant row
+    # adds up to the next value Σ (-1)^(n-1-i) C(n, i) a_i and the previous
+    # one Σ (-1)^i C(n, i+1) a_i, so both are fixed weights of the history
+    next_weights = tuple((-1) ** (length - 1 - i) * comb(length, i) for i in range(length))
+    previous_weights = tuple((-1) ** i * comb(length, i + 1) for i in range(length))
+
+    return next_weights, previous_weights
+
+
+def weighted_sum(weights: Iterable[int], values: Iterable[int]) -> int:
+    return sum(map(mul, weights, values))
+
+
+def next_value(history: list[int]) -> int:
+    return weighted_sum(weights(len(history))[0], history)
+
+
+def previous_value(history: list[int]) -> int:
+    return weighted_sum(weights(len(history))[1], history)
+
+
+class HistoryTotals:
+    """
+    Sums of the next and previous values of many histories, in one pass.
+
+    Both values being weighted sums of a history, their totals over the
+    histories of one length are the same weights applied to the column
+    sums of those histories: that is the product of the histories' matrix
+    with the weight vector, summed, without keeping the matrix. Only one
+    running sum per column and length is kept, however many rows there are.
+    """
 
+    columns: dict[int, list[int]]
 
-def extrapolate(line: list[int]) -> int:
-    sequences = [line]
+    def __init__(self) -> None:
+        self.columns = {}
 
-    while not all(n == 0 for n in sequences[-1]):
-        sequences.append([
-            b - a for a, b in pairwise(sequences[-1])
-        ])
-    
-    sequences[-1].append(0)
+    def add(self, history: list[int]) -> None:
+        if (columns := self.columns.get(len(history))) is None:
+            self.columns[len(history)] = list(history)
+        else:
+            self.columns[len(history)] = list(map(add, columns, history))
 
-    for previous, current in pairwise(reversed(sequences)):
-        current.append(previous[-1] + current[-1])
-    
-    return sequences
+    def update(self, histories: Iterable[list[int]]) -> Self:
+        for history in histories:
+            self.add(history)
+        return self
 
+    def next_total(self) -> int:
+        return sum(weighted_sum(weights(length)[0], columns) for length, columns in self.columns.items())
 
-def solve_part1(data: list[str]) -> int:
-    input_lines = extract_info(data)
+    def previous_total(self) -> int:
+        return sum(weighted_sum(weights(length)[1], columns) for length, columns in self.columns.items())
 
-    total = 0
-    for line in input_lines:
-        extrapolation = extrapolate(line)
-        total += extrapolation[0][-1]
 
-    return total
+def solve_part1(data: Iterable[str]) -> int:
+    return HistoryTotals().update(extract_info(data)).next_total()
 
-def solve_part2(data: list[str]) -> int:
-    input_lines = extract_info(data)
+def solve_part2(data: Iterable[str]) -> int:
+    return HistoryTotals().update(extract_info(data)).previous_total()
 
-    total = 0
-    for line in input_lines:
-        line.reverse()
-        extrapolation = extrapolate(line)
-        total += extrapolation[0][-1]
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    totals = HistoryTotals().update(extract_info(data))
 
-    return total
+    return totals.next_total(), totals.previous_total()
 
 
 def main():
-    with open("input/day09.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day09.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
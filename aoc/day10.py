@@ -1,215 +1,209 @@
-from dataclasses import dataclass
-from enum import Enum, auto
-
-class Grid:
-    def __init__(self, width: int, height:int, default_value=None):
-        self.width = width
-        self.height = height
-        self.content = [[default_value] * width for _ in range(height)]
-    
-    def get(self, x: int, y: int):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        self.content[y][x] = value
-
-@dataclass(slots=True)
-class Vector2d:
-    x: int
-    y: int
-
-    def __add__(self, other: 'Vector2d'):
-        return Vector2d(self.x + other.x, self.y + other.y)
-    
-    def __sub__(self, other: 'Vector2d'):
-        return Vector2d(self.x - other.x, self.y - other.y)
-
-    def rotated(self, counter_clockwise: bool = False):
-        if counter_clockwise:
-            return Vector2d(self.y * -1, self.x)
-        else:
-            return Vector2d(self.y, self.x * -1)
-
-
-class Direction(Enum):
-    east = auto()
-    south = auto()
-    west = auto()
-    north = auto()
+from array import array
+from collections.abc import Sequence
+from enum import IntEnum
+from functools import partial
 
-    @property
-    def complement(self):
-        match self:
-            case self.east:
-                return self.west
-            case self.south:
-                return self.north
-            case self.west:
-                return self.east
-            case self.north:
-                return self.south
-
-
-    def as_vector(self):
-        match self:
-            case self.east:
-                return Vector2d(1, 0)
-            case self.south:
-                return Vector2d(0, 1)
-            case self.west:
-                return Vector2d(-1, 0)
-            case self.north:
-                return Vector2d(0, -1)
-
-
-class Cell:
-    class Type(Enum):
-        vertical = '|'
-        horizontal = '-'
-        up_right = 'L'
-        up_left = 'J'
-        down_left = '7'
-        down_right = 'F'
-        empty = '.'
-        start = 'S'
-
-
-    def __init__(self, celltype: 'Cell.Type', position: Vector2d):
-        self.type = celltype
-        self.position = position
-    
-
-    def __repr__(self):
-        return f"Cell({self.type}, {self.position})"
+from aoc.cache import cached
+from aoc.common import Grid, MappedInput
+
+
+class Direction(IntEnum):
+    # In the order of Grid.offsets
+    east = 0
+    south = 1
+    west = 2
+    north = 3
 
     @property
-    def openings(self):
-        match self.type:
-            case Cell.Type.vertical:
-                return [Direction.north, Direction.south]
-            case Cell.Type.horizontal:
-                return [Direction.east, Direction.west]
-            case Cell.Type.up_right:
-                return [Direction.north, Direction.east]
-            case Cell.Type.up_left:
-                return [Direction.north, Direction.west]
-            case Cell.Type.down_left:
-                return [Direction.south, Direction.west]
-            case Cell.Type.down_right:
-                return [Direction.south, Direction.east]
-            case Cell.Type.start:
-                return [Direction.east, Direction.south, Direction.west, Direction.north]
-            case _:
-                return []
-
-
-    def get_next_direction(self, current_direction: Direction):
-        if self.type == Cell.Type.start:
-            return current_direction
-        
-        complement = current_direction.complement
-
-        return next(filter(lambda dir: dir != complement, self.openings), None)
-
-
-def extract_info(data: list[str]) -> Grid:
-    world = Grid(len(data[0]), len(data))
-
-    for y, line in enumerate(data):
-        for x, char in enumerate(line):
-            cell = Cell(Cell.Type(char), Vector2d(x, y))
-            world.set(x, y, cell)
-
-            if (cell.type == Cell.Type.start):
-                start_pos = Vector2d(x, y)
-
-    return world, start_pos
-
-
-def get_loop(world: Grid, start_pos: Vector2d):
-    for direction in Direction:
-        chain = []
-        position = start_pos
-        left_start = False
-
-        while position != start_pos or not left_start:
-            left_start = True
-
-            current_cell = world.get(position.x, position.y)
-            
-            try:
-                next_pos = position + direction.as_vector()
-                next_cell = world.get(next_pos.x, next_pos.y)
-            except IndexError:
-                break
-
-            if direction.complement in next_cell.openings:
-                chain.append(current_cell)
-                position = position + direction.as_vector()
-                direction = next_cell.get_next_direction(direction)
-            else:
-                break
-        else:
-            break
-    
-    start_cell = chain[0]
-    first_cell = chain[1]
-    last_cell  = chain[-1]
-
-    # Replace the start with its missing piece
-    for pipe_type in Cell.Type:
-        dirs = []
-        start_cell.type = pipe_type
-
-        complemented_openings = [op.complement for op in start_cell.openings]
-
-        for direction in first_cell.openings:
-            if first_cell.position + direction.as_vector() == start_cell.position:
-                dirs.append(direction)
-
-        for direction in last_cell.openings:
-            if last_cell.position + direction.as_vector() == start_cell.position:
-                dirs.append(direction)
-        
-        if len(set(complemented_openings) & set(dirs)) == 2:
-            break
-    
-    return chain
-
-def solve_part1(data: list[str]) -> int:
-    world, start_pos = extract_info(data)
-    loop = get_loop(world, start_pos)
+    def complement(self) -> 'Direction':
+        return Direction((self + 2) % 4)
+
+
+OPENINGS = {
+    '|': (Direction.south, Direction.north),
+    '-': (Direction.east, Direction.west),
+    'L': (Direction.east, Direction.north),
+    'J': (Direction.west, Direction.north),
+    '7': (Direction.south, Direction.west),
+    'F': (Direction.east, Direction.south),
+}
+
+PIPES = {frozenset(openings): pipe for pipe, openings in OPENINGS.items()}
+
+BLOCKED = 0xFF
+
+def build_turns() -> bytes:
+    # Direction of travel out of a cell, indexed by the cell's byte << 2 | the
+    # direction it was entered moving in, BLOCKED where the pipe does not connect
+    turns = bytearray([BLOCKED]) * (256 * 4)
+    for pipe, (first, second) in OPENINGS.items():
+        turns[ord(pipe) << 2 | first.complement] = second
+        turns[ord(pipe) << 2 | second.complement] = first
+
+    return bytes(turns)
+
+TURNS = build_turns()
+
+# Marks of the cells in the loop, crossing the loop through a cell that opens
+# north flips between outside and inside
+OUTSIDE, ON_LOOP, CROSSING = range(3)
+
+MARKS = bytes(
+    (CROSSING if Direction.north in OPENINGS[chr(byte)] else ON_LOOP) if chr(byte) in OPENINGS else OUTSIDE
+    for byte in range(256)
+)
+
+# The traced map, with the start replaced by its pipe, the indices of the loop
+# cells in the map, starting from the start, and the mark of every cell
+Loop = tuple[Grid, array, bytearray]
+
+
+def extract_info(data: Sequence[str]) -> tuple[Grid, int]:
+    # A column of '.' after each row and a row of them above and below: every
+    # step off the map then lands on a cell that connects nowhere, and the
+    # tracing needs no bounds checks
+    if isinstance(data, MappedInput):
+        width, height = len(data.line(0)), len(data)
+        rows = (data.line(y) for y in range(height))
+    else:
+        width, height = len(data[0]), len(data)
+        rows = (line.encode() for line in data)
+
+    cells = array('B', b'.' * (width + 1))
+    for row in rows:
+        cells.frombytes(row)
+        cells.append(ord('.'))
+    cells.frombytes(b'.' * (width + 1))
+    world = Grid(width + 1, height + 2, cells=cells)
+
+    start = cells.index(ord('S'))
+    return world, start
+
+
+def get_loop(world: Grid, start: int) -> tuple[array, bytearray]:
+    cells, offsets = world.cells, world.offsets
+    in_loop = bytearray(len(cells))
+
+    # Stray pipes may connect to the start too, so each way out is followed
+    # until the walk either closes on the start or reaches a dead end
+    for first in Direction:
+        loop = array('I', [start])
+        direction = first
+        index = start + offsets[direction]
+        try:
+            while index != start:
+                loop.append(index)
+                in_loop[index] = MARKS[cells[index]]
+                direction = TURNS[cells[index] << 2 | direction]
+                index += offsets[direction]
+        except IndexError:
+            # offsets[BLOCKED], a dead end
+            for index in loop:
+                in_loop[index] = OUTSIDE
+            continue
+
+        # The start takes the pipe joining the first step and the last one
+        cells[start] = ord(PIPES[frozenset((first, Direction(direction).complement))])
+        in_loop[start] = MARKS[cells[start]]
+        return loop, in_loop
+
+    x, y = world.position(start)
+    raise ValueError(f"No loop goes through the start at ({x}, {y - 1})")
+
+
+def encode_loop(traced: Loop) -> tuple[int, bytes, array, bytes]:
+    world, loop, in_loop = traced
+
+    return world.width, world.cells.tobytes(), loop, bytes(in_loop)
 
+
+def decode_loop(encoded: tuple[int, bytes, array, bytes]) -> Loop:
+    width, cells, loop, in_loop = encoded
+
+    return Grid(width, len(cells) // width, cells=array('B', cells)), loop, bytearray(in_loop)
+
+
+@cached(encode_loop, decode_loop, version=2)
+def trace_loop(data: Sequence[str]) -> Loop:
+    world, start = extract_info(data)
+
+    return world, *get_loop(world, start)
+
+
+def farthest_distance(loop: array) -> int:
     return len(loop) // 2
 
 
-def solve_part2(data: list[str]) -> int:
-    world, start_pos = extract_info(data)
-    loop = get_loop(world, start_pos)
+def count_enclosed(in_loop: bytearray) -> int:
+    # Every row ends outside the loop, on its padding, so the crossings pair
+    # up within rows and the whole map can be scanned as a single line: the
+    # cells between the two crossings of a pair that are not on the loop are
+    # inside
+    find, count = in_loop.find, in_loop.count
 
     inner_spaces = 0
-    for row in world.content:
-        inside = False
-        for cell in row:
-            if cell in loop:
-                if Direction.north in cell.openings:
-                    inside = not inside
-            elif inside and cell not in loop:
-                inner_spaces += 1
+    left = find(CROSSING)
+    while left != -1:
+        right = find(CROSSING, left + 1)
+        inner_spaces += count(OUTSIDE, left + 1, right)
+        left = find(CROSSING, right + 1)
 
     return inner_spaces
 
+
+def enclosed_area(world: Grid, loop: array) -> int:
+    # Twice the area inside the path through the loop cells' centers, by the
+    # shoelace formula
+    width = world.width
+    previous_y, previous_x = divmod(loop[-1], width)
+    double_area = 0
+    for index in loop:
+        y, x = divmod(index, width)
+        double_area += previous_x * y - x * previous_y
+        previous_x, previous_y = x, y
+
+    # Pick's theorem, A = I + B / 2 - 1, with the loop cells as boundary points
+    return (abs(double_area) - len(loop)) // 2 + 1
+
+
+INTERIOR_METHODS = ('scan', 'shoelace')
+
+def solve_part1(data: Sequence[str]) -> int:
+    _, loop, _ = trace_loop(data)
+
+    return farthest_distance(loop)
+
+
+def solve_part2(data: Sequence[str], method: str = 'scan') -> int:
+    world, loop, in_loop = trace_loop(data)
+
+    match method:
+        case 'scan':
+            return count_enclosed(in_loop)
+        case 'shoelace':
+            return enclosed_area(world, loop)
+        case _:
+            raise ValueError(f"Unknown method {method!r}, expected one of {INTERIOR_METHODS}")
+
+
+# Solvers of a part by each of its methods, compared by the runner's --cross-check
+CROSS_CHECK = {
+    2: {method: partial(solve_part2, method=method) for method in INTERIOR_METHODS},
+}
+
+
+def solve(data: Sequence[str]) -> tuple[int, int]:
+    _, loop, in_loop = trace_loop(data)
+
+    return farthest_distance(loop), count_enclosed(in_loop)
+
 def main() -> None:
-    with open("input/day10.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day10.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
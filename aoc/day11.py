@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from itertools import combinations
 import math
 
+from aoc.common import MappedInput
+
 @dataclass(slots=True)
 class Vector2d:
     x: int
@@ -21,24 +23,32 @@ class Vector2d:
 
 
 
-def extract_info(data: list[str], empty_cost: int):
-    width = len(data[0])
-    height = len(data)
-
+def find_galaxies(data: list[str]) -> list[Vector2d]:
     galaxies = []
-    h_costs = [empty_cost for _ in range(width)]
-    v_costs = [empty_cost for _ in range(height)]
 
     for y, line in enumerate(data):
         for x, cell in enumerate(line):
             if cell == '#':
                 galaxies.append(Vector2d(x, y))
-    
+
+    return galaxies
+
+
+def expansion_costs(galaxies: list[Vector2d], width: int, height: int, empty_cost: int):
+    h_costs = [empty_cost for _ in range(width)]
+    v_costs = [empty_cost for _ in range(height)]
+
     for galaxy in galaxies:
         h_costs[galaxy.x] = 1
         v_costs[galaxy.y] = 1
     
-    return galaxies, h_costs, v_costs
+    return h_costs, v_costs
+
+
+def extract_info(data: list[str], empty_cost: int):
+    galaxies = find_galaxies(data)
+
+    return galaxies, *expansion_costs(galaxies, len(data[0]), len(data), empty_cost)
 
 
 def get_total_distances(galaxies: list[Vector2d], h_costs: list[int], v_costs: list[int]):
@@ -67,12 +77,22 @@ def solve_part2(data: list[str], expansion_factor: int) -> int:
     return get_total_distances(galaxies, h_costs, v_costs)
 
 
+def solve(data: list[str], expansion_factor: int = 1_000_000) -> tuple[int, int]:
+    galaxies = find_galaxies(data)
+    width, height = len(data[0]), len(data)
+
+    return (
+        get_total_distances(galaxies, *expansion_costs(galaxies, width, height, 2)),
+        get_total_distances(galaxies, *expansion_costs(galaxies, width, height, expansion_factor)),
+    )
+
+
 def main() -> None:
-    with open("input/day11.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day11.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data, 1_000_000))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,9 @@
+from collections.abc import Iterable, Iterator
 from enum import StrEnum
 from functools import cache, reduce
 
+from aoc.common import MappedInput
+
 
 class Spring(StrEnum):
     operative = '.'
@@ -11,12 +14,10 @@ class Spring(StrEnum):
         return f"{self.value}"
 
 
-Spring_list = list[tuple[tuple[Spring], tuple[int]]]
-
+Spring_line = tuple[tuple[Spring], tuple[int]]
 
-def extract_info(data: list[str], folded: bool) -> Spring_list:
-    springs: Spring_list = []
 
+def extract_info(data: Iterable[str], folded: bool) -> Iterator[Spring_line]:
     if folded:
         multiplier = 5
     else:
@@ -28,14 +29,16 @@ def extract_info(data: list[str], folded: bool) -> Spring_list:
         # Multiply the string [multiplier] times with a ? in between
         field_str = '?'.join([field_str] * multiplier)
 
-        springs.append(
-            (
-                tuple(Spring(ch) for ch in field_str),
-                tuple(int(n) for n in clue_str.split(',')) * multiplier,
-            )
+        yield (
+            tuple(Spring(ch) for ch in field_str),
+            tuple(int(n) for n in clue_str.split(',')) * multiplier,
         )
-    
-    return springs
+
+
+def unfold(spring_line: Spring_line) -> Spring_line:
+    springs, clues = spring_line
+
+    return ((springs + (Spring.unknown,)) * 5)[:-1], clues * 5
 
 
 @cache
@@ -73,24 +76,44 @@ def simple_solve(springs: tuple[Spring], clues: tuple[int]):
 
 
 
-def solve_part1(data: list[str]) -> int:
+def count_arrangements(springs: tuple[Spring], clues: tuple[int]) -> int:
+    # Lines hardly share any subproblems, so the cache is dropped after each
+    # one to keep memory flat over long inputs
+    arrangements = simple_solve(springs, clues)
+    simple_solve.cache_clear()
+
+    return arrangements
+
+
+def solve_part1(data: Iterable[str]) -> int:
     spring_lines = extract_info(data, folded=False)
 
-    return sum(map(lambda line: simple_solve(*line), spring_lines))
+    return sum(map(lambda line: count_arrangements(*line), spring_lines))
 
 
-def solve_part2(data: list[str]) -> int:
+def solve_part2(data: Iterable[str]) -> int:
     spring_lines = extract_info(data, folded=True)
 
-    return sum(map(lambda line: simple_solve(*line), spring_lines))
+    return sum(map(lambda line: count_arrangements(*line), spring_lines))
+
+
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    # Each record is parsed once and unfolded for part 2
+    folded_total = 0
+    unfolded_total = 0
+    for spring_line in extract_info(data, folded=False):
+        folded_total += count_arrangements(*spring_line)
+        unfolded_total += count_arrangements(*unfold(spring_line))
+
+    return folded_total, unfolded_total
 
 
 def main() -> None:
-    with open("input/day12.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day12.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -1,56 +1,21 @@
 from itertools import count
 from functools import partial
-from typing import Iterator, Any, Optional
-
-
-class Grid:
-    def __init__(self, 
-                 width: Optional[int] = None, height: Optional[int] = None,
-                 default_value: Any = None, 
-                 content: Optional[list[list[Any]]] = None):
-        if content is not None:
-            self._width = max(map(len, content))
-            self._height = len(content)
-            self.content = content.copy()
-        else:
-            if width is None or height is None:
-                raise ValueError("Grid width or height cannot be None unless content is provided")
-            
-            self._width = width
-            self._height = height
-            self.content = [[default_value] * width for _ in range(height)]
-
-    
-    def get(self, x: int, y: int):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value: Any):
-        if x < 0 or x > self.width or y < 0 or y > self.height:
-            raise IndexError(f"({x}, {y}) is out of grid area")
-        self.content[y][x] = value
-
-    @property
-    def width(self):
-        return self._width
-    
-    @property
-    def height(self):
-        return self._height
+from typing import Iterator
+
+from aoc.common import Grid, MappedInput
 
 
 def extract_info(data: list[str]) -> Iterator[Grid]:
-    grid_content = []
+    pattern = []
     for line in data:
         if not line or line.isspace():
-            yield Grid(content=grid_content)
-            grid_content.clear()
+            yield Grid.from_lines(pattern, typecode='B')
+            pattern = []
             continue
 
-        grid_content.append([ch == '#' for ch in line])
+        pattern.append(line)
     else:
-        yield Grid(content=grid_content)
+        yield Grid.from_lines(pattern, typecode='B')
 
 
 def get_reflections(grid: Grid, with_smudge: bool) -> tuple[int, None] | tuple[None, int]:
@@ -115,13 +80,22 @@ def solve_part2(data: list[str]) -> int:
     func = partial(reflection_value, with_smudge=True)
     return sum(map(func, extract_info(data)))
 
+def solve(data: list[str]) -> tuple[int, int]:
+    clean_total = 0
+    smudged_total = 0
+    for grid in extract_info(data):
+        clean_total += reflection_value(grid, with_smudge=False)
+        smudged_total += reflection_value(grid, with_smudge=True)
+
+    return clean_total, smudged_total
+
 
 def main() -> None:
-    with open("input/day13.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day13.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
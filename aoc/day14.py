@@ -1,49 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Any, Optional
 from itertools import cycle
 from functools import cache
 
-
-class Grid:
-    def __init__(self, 
-                 width: Optional[int] = None, height: Optional[int] = None,
-                 default_value: Any = None, 
-                 content: Optional[list[list[Any]]] = None):
-        if content is not None:
-            self.width = max(map(len, content))
-            self.height = len(content)
-            self.content = content.copy()
-        else:
-            if width is None or height is None:
-                raise ValueError("Grid width or height cannot be None unless content is provided")
-            
-            self.width = width
-            self.height = height
-            self.content = [[default_value] * width for _ in range(height)]
-
-    
-    def get(self, x: int, y: int):
-        # if x < 0 or x > self.width or y < 0 or y > self.height:
-        #     raise IndexError(f"({x}, {y}) is out of grid area")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value: Any):
-        # if x < 0 or x > self.width or y < 0 or y > self.height:
-        #     raise IndexError(f"({x}, {y}) is out of grid area")
-        self.content[y][x] = value
-
-    def __hash__(self):
-        return hash(''.join([''.join(x) for x in self.content]))
-
-    @property
-    def rows(self):
-        yield from self.content
-    
-    @property
-    def columns(self):
-        for x in range(self.width):
-            yield [self.content[y][x] for y in range(self.height)]
+from aoc.common import Grid, MappedInput
 
 
 @dataclass(slots=True)
@@ -82,65 +42,33 @@ class Direction(Enum):
 
 
 def extract_info(data: list[str]):
-    grid = Grid(len(data[0]), len(data), '.')
-
-    for y, line in enumerate(data):
-        for x, cell in enumerate(line):
-            grid.content[y][x] = cell
-    
-    return grid
+    return Grid.from_lines(data, typecode='B')
 
 
 @cache
-def slide_rocks(line: tuple[Rock], backwards: bool) -> list[Rock]:
-    result: list[Rock] = []
-    insertion_point = 0
-
-    expect_n_rocks = line.count('O')
-    n_rocks = 0
-
-    if not backwards:
-        for n, rock in enumerate(line):
-            if rock == '.':
-                result.insert(insertion_point, rock)
-            elif rock == 'O':
-                n_rocks += 1
-                result.append(rock)
-            elif rock == '#':
-                result.append(rock)
-                insertion_point = n + 1
-    else:
-        for n, rock in enumerate(line):
-            if rock == '.':
-                result.append(rock)
-            elif rock == 'O':
-                n_rocks += 1
-                result.insert(insertion_point, rock)
-            elif rock == '#':
-                result.append(rock)
-                insertion_point = n + 1
-    
-    assert n_rocks == expect_n_rocks
-    
-    return result
+def slide_rocks(line: bytes, backwards: bool) -> bytes:
+    # Round rocks roll to one end of each stretch between square rocks
+    stretches = []
+    for stretch in line.split(b'#'):
+        n_rocks = stretch.count(b'O')
+        rocks, spaces = b'O' * n_rocks, b'.' * (len(stretch) - n_rocks)
+        stretches.append(rocks + spaces if backwards else spaces + rocks)
+
+    return b'#'.join(stretches)
 
 @cache
 def tilt(grid: Grid, direction: Direction) -> Grid:
-    result = Grid(content=grid.content.copy())
+    result = grid.copy()
+    cells = memoryview(result.cells)
     match direction:
         case Direction.east | Direction.west:
             for y, row in enumerate(grid.rows):
-                new_row = slide_rocks(tuple(row), backwards=(direction == Direction.west))
-
-                for x, rock in enumerate(new_row):
-                    result.content[y][x] = rock
+                start = y * grid.width
+                cells[start:start + grid.width] = slide_rocks(bytes(row), backwards=(direction == Direction.west))
 
         case Direction.north | Direction.south:
             for x, column in enumerate(grid.columns):
-                new_column = slide_rocks(tuple(column), backwards=(direction == Direction.north))
-
-                for y, rock in enumerate(new_column):
-                    result.content[y][x] = rock
+                cells[x::grid.width] = slide_rocks(bytes(column), backwards=(direction == Direction.north))
 
     return result
 
@@ -161,23 +89,17 @@ def do_cycle(grid: Grid):
 def calculate_load(grid: Grid):
     load = 0
     for n, row in enumerate(grid.rows):
-        for rock in row:
-            if rock == 'O':
-                load += grid.height - n
+        load += (grid.height - n) * bytes(row).count(b'O')
     
     return load
 
-def solve_part1(data: list[str]) -> int:
-    grid = extract_info(data)
-
+def tilted_load(grid: Grid) -> int:
     grid = tilt(grid, Direction.north)
 
     return calculate_load(grid)
 
 
-def solve_part2(data: list[str]) -> int:
-    grid = extract_info(data)
-
+def spun_load(grid: Grid) -> int:
     cycles = 1000
 
     for n in range(cycles):
@@ -188,12 +110,27 @@ def solve_part2(data: list[str]) -> int:
     return calculate_load(grid)
 
 
+def solve_part1(data: list[str]) -> int:
+    return tilted_load(extract_info(data))
+
+
+def solve_part2(data: list[str]) -> int:
+    return spun_load(extract_info(data))
+
+
+def solve(data: list[str]) -> tuple[int, int]:
+    # Tilting returns new grids, so both parts can start from the same one
+    grid = extract_info(data)
+
+    return tilted_load(grid), spun_load(grid)
+
+
 def main() -> None:
-    with open("input/day14.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day14.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
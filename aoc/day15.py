@@ -1,7 +1,10 @@
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import Self
 
+from aoc.common import MappedInput
+
 def HASH(values: str) -> int:
     state = 0
     for value in values:
@@ -11,11 +14,18 @@ def HASH(values: str) -> int:
     return state
 
     
-def extract_steps(data: list[str]) -> list[str]:
-    return data[0].split(',')
+def extract_steps(data: Iterable[str]) -> Iterator[str]:
+    # Newlines are ignored, so a step may continue on the next line
+    pending = ''
+    for line in data:
+        *steps, pending = (pending + line).split(',')
+        yield from filter(None, steps)
+
+    if pending:
+        yield pending
 
 
-def solve_part1(data: list[str]) -> int:
+def solve_part1(data: Iterable[str]) -> int:
     sequence = extract_steps(data)
 
     return sum(HASH(s) for s in sequence)
@@ -48,25 +58,38 @@ def calculate_focusing_power(hashmap: dict[int, dict[str, int]]) -> int:
 
     return total
 
-def solve_part2(data: list[str]) -> int:
-    sequence = [Step(step) for step in extract_steps(data)]
+def apply_step(hashmap: dict[int, dict[str, int]], step: Step) -> None:
+    if step.operation == '=':
+        hashmap[step.hash][step.label] = step.focal_length
+    elif step.operation == '-' and step.label in hashmap[step.hash]:
+        del hashmap[step.hash][step.label]
+
+def solve_part2(data: Iterable[str]) -> int:
+    sequence = map(Step, extract_steps(data))
 
     hashmap = defaultdict(dict)
 
     for step in sequence:
-        if step.operation == '=':
-            hashmap[step.hash][step.label] = step.focal_length
-        elif step.operation == '-' and step.label in hashmap[step.hash]:
-            del hashmap[step.hash][step.label]
+        apply_step(hashmap, step)
     
     return calculate_focusing_power(hashmap)
 
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    hash_total = 0
+    hashmap = defaultdict(dict)
+
+    for step_str in extract_steps(data):
+        hash_total += HASH(step_str)
+        apply_step(hashmap, Step(step_str))
+
+    return hash_total, calculate_focusing_power(hashmap)
+
 def main() -> None:
-    with open("input/day15.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day15.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 from itertools import chain
-from typing import Self, Any
+from typing import Iterator, Self
+
+from aoc.common import Grid, MappedInput
 
 @dataclass(slots=True)
 class Vector2d:
@@ -20,23 +22,6 @@ class Vector2d:
     def __hash__(self):
         return hash((self.x, self.y))
 
-class Grid:
-    def __init__(self, width: int, height: int, default_value: Any = None):
-        self.width = width
-        self.height = height
-        self.content = [[default_value] * width for _ in range(height)]
-    
-    def get(self, x: int, y: int) -> Any:
-        if x < 0 or y < 0:
-            raise IndexError(f"({x}, {y}) is out of grid")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value: Any) -> None:
-        if x < 0 or y < 0:
-            raise IndexError(f"({x}, {y}) is out of grid")
-        self.content[y][x] = value
-
-
 class Direction(Enum):
     east = auto()
     south = auto()
@@ -90,13 +75,7 @@ class Beam:
     direction: Vector2d
 
 def extract_grid(data: list[str]) -> Grid:
-    grid = Grid(len(data[0]), len(data))
-
-    for y, line in enumerate(data):
-        for x, cell in enumerate(line):
-            grid.set(x, y, Tile(cell))
-    
-    return grid
+    return Grid.from_lines(data, convert=Tile)
 
 def trace_beam(grid: Grid, beam: Beam):
     beams = [beam]
@@ -137,12 +116,7 @@ def trace_beam(grid: Grid, beam: Beam):
                 beam.direction = new_direction
                 beam.position = new_position
     
-    total = 0
-    for row in grid.content:
-        for tile in row:
-            total += 1 if tile.energized else 0
-    
-    return total
+    return sum(1 for tile in grid.cells if tile.energized)
 
 
 def solve_part1(data: list[str]) -> int:
@@ -151,10 +125,9 @@ def solve_part1(data: list[str]) -> int:
 
     return trace_beam(grid, beam)
 
-def solve_part2(data: list[str]) -> int:
-    grid = extract_grid(data)
-
-    beams = chain(
+def edge_beams(grid: Grid) -> Iterator[Beam]:
+    # The first one is the beam of part 1, entering the top left corner eastwards
+    return chain(
         (
             Beam(Vector2d(0, y), Direction.east.as_vector())
             for y in range(grid.height)
@@ -173,28 +146,36 @@ def solve_part2(data: list[str]) -> int:
         ),
     )
 
-    best = 0
 
-    for n, beam in enumerate(beams):
-        beam_energized = trace_beam(grid, beam)
-        best = max(best, beam_energized)
-        # print(f"Beam {n}/{grid.width * 2 + grid.height * 2}: Energized = {beam_energized}, Best = {best}")
+def energize(grid: Grid, beam: Beam) -> int:
+    beam_energized = trace_beam(grid, beam)
+
+    # Reset the grid
+    for tile in grid.cells:
+        tile.reset()
+
+    return beam_energized
 
-        # Reset the grid
-        for row in grid.content:
-            for tile in row:
-                tile.reset()
 
+def solve_part2(data: list[str]) -> int:
+    grid = extract_grid(data)
+
+    return max(energize(grid, beam) for beam in edge_beams(grid))
+
+
+def solve(data: list[str]) -> tuple[int, int]:
+    grid = extract_grid(data)
+    energized = [energize(grid, beam) for beam in edge_beams(grid)]
 
-    return best
+    return energized[0], max(energized)
 
 
 def main() -> None:
-    with open("input/day16.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day16.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -1,8 +1,13 @@
+from array import array
+from collections.abc import Sequence
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from functools import total_ordering
 import heapq
-from typing import Self, Any, Optional, NamedTuple
+from typing import Self, Optional, NamedTuple
+
+from aoc.cache import cached
+from aoc.common import Grid, MappedInput, profiled
 
 
 _infinity = float("infinity")
@@ -33,23 +38,6 @@ class Vector2d:
         return hash((self.x, self.y))
 
 
-class Grid:
-    def __init__(self, width: int, height: int, default_value: Any = None):
-        self.width = width
-        self.height = height
-        self.content = [[default_value] * width for _ in range(height)]
-    
-    def get(self, x: int, y: int) -> Any:
-        if x < 0 or y < 0:
-            raise IndexError(f"({x}, {y}) is out of grid")
-        return self.content[y][x]
-
-    def set(self, x: int, y: int, value: Any) -> None:
-        if x < 0 or y < 0:
-            raise IndexError(f"({x}, {y}) is out of grid")
-        self.content[y][x] = value
-
-
 class Direction(Enum):
     east = auto()
     south = auto()
@@ -80,6 +68,7 @@ class Direction(Enum):
                 return Vector2d(0, -1)
 
 
+@profiled
 def extract_grid(data: list[str]) -> Grid:
     grid = Grid(len(data[0]), len(data))
 
@@ -138,7 +127,7 @@ class Node:
         return hash((self.cost, self.position, self.plane))
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     cost: int | float
     target: Node
@@ -151,6 +140,7 @@ Cell = NamedTuple("Cell",[
 
 
 
+@profiled
 def make_graph(grid: Grid, min_dist: int, max_dist: int) -> tuple[list[Node], Node, Node]:
     R"""
     Builds the graph based on the grid contents.
@@ -174,42 +164,42 @@ def make_graph(grid: Grid, min_dist: int, max_dist: int) -> tuple[list[Node], No
 
     nodes: list[Node] = []
 
-    for y, row in enumerate(grid.content):
-        for x, cell in enumerate(row):
-            h_cell, v_cell = cell
-
-            # Horizontal cell neighbors
-            for direction in (Direction.east, Direction.west):
-                cost = 0
-                direction_multiplier = 1 if direction is Direction.east else -1
-                for factor in range(1, max_dist):
-                    try:
-                        neighbor = grid.get(x + direction_multiplier * factor, y).v
-
-                        cost += neighbor.cost
-                    except IndexError:
-                        break
-
-                    if factor in range(min_dist, max_dist):
-                        h_cell.edges.append(Edge(cost, neighbor))
-
-            # Vertical cell neighbors
-            for direction in (Direction.north, Direction.south):
-                cost = 0
-                direction_multiplier = 1 if direction is Direction.south else -1
-                for factor in range(1, max_dist):
-                    try:
-                        neighbor = grid.get(x, y + direction_multiplier * factor).h
-
-                        cost += neighbor.cost
-                    except IndexError:
-                        break
-
-                    if factor in range(min_dist, max_dist):
-                        v_cell.edges.append(Edge(cost, neighbor))
-
-            nodes.append(cell.v)
-            nodes.append(cell.h)
+    for index, cell in enumerate(grid.cells):
+        x, y = grid.position(index)
+        h_cell, v_cell = cell
+
+        # Horizontal cell neighbors
+        for direction in (Direction.east, Direction.west):
+            cost = 0
+            direction_multiplier = 1 if direction is Direction.east else -1
+            for factor in range(1, max_dist):
+                try:
+                    neighbor = grid.get(x + direction_multiplier * factor, y).v
+
+                    cost += neighbor.cost
+                except IndexError:
+                    break
+
+                if factor in range(min_dist, max_dist):
+                    h_cell.edges.append(Edge(cost, neighbor))
+
+        # Vertical cell neighbors
+        for direction in (Direction.north, Direction.south):
+            cost = 0
+            direction_multiplier = 1 if direction is Direction.south else -1
+            for factor in range(1, max_dist):
+                try:
+                    neighbor = grid.get(x, y + direction_multiplier * factor).h
+
+                    cost += neighbor.cost
+                except IndexError:
+                    break
+
+                if factor in range(min_dist, max_dist):
+                    v_cell.edges.append(Edge(cost, neighbor))
+
+        nodes.append(cell.v)
+        nodes.append(cell.h)
     
 
     start = Node(Vector2d(-1, -1), 0, Plane.both, distance=0)
@@ -228,6 +218,57 @@ def make_graph(grid: Grid, min_dist: int, max_dist: int) -> tuple[list[Node], No
     return nodes, start, end
 
 
+Graph = tuple[list[Node], Node, Node]
+
+
+def encode_graph(graph: Graph) -> tuple[array, array, array, array]:
+    # Nodes as (x, y, cost, plane) rows and their edges in compressed sparse
+    # row form, the start and end nodes are the last two
+    nodes, start, end = graph
+    index = {id(node): i for i, node in enumerate(nodes)}
+    planes = list(Plane)
+
+    node_info = array('i', (
+        n for node in nodes
+        for n in (node.position.x, node.position.y, node.cost, planes.index(node.plane))
+    ))
+    edge_offsets = array('I', [0])
+    edge_targets = array('I')
+    edge_costs = array('I')
+    for node in nodes:
+        edge_targets.extend(index[id(edge.target)] for edge in node.edges)
+        edge_costs.extend(int(edge.cost) for edge in node.edges)
+        edge_offsets.append(len(edge_targets))
+
+    return node_info, edge_offsets, edge_targets, edge_costs
+
+
+def decode_graph(encoded: tuple[array, array, array, array]) -> Graph:
+    node_info, edge_offsets, edge_targets, edge_costs = encoded
+    planes = list(Plane)
+
+    nodes = [
+        Node(Vector2d(node_info[i], node_info[i + 1]), node_info[i + 2], planes[node_info[i + 3]])
+        for i in range(0, len(node_info), 4)
+    ]
+    targets = list(map(nodes.__getitem__, edge_targets))
+    for node, first, last in zip(nodes, edge_offsets, edge_offsets[1:]):
+        node.edges = list(map(Edge, edge_costs[first:last], targets[first:last]))
+
+    start, end = nodes[-2], nodes[-1]
+    start.distance = 0
+
+    return nodes, start, end
+
+
+@cached(encode_graph, decode_graph)
+def build_graph(data: Sequence[str], min_dist: int, max_dist: int) -> Graph:
+    grid = extract_grid(data)
+
+    return make_graph(grid, min_dist, max_dist)
+
+
+@profiled
 def dijkstra(start: Node, end: Node):
     queue: PriorityQueue = [start]
 
@@ -261,29 +302,31 @@ def dijkstra(start: Node, end: Node):
 
     return shortest_path
 
-def solve_part1(data: list[str]) -> int:
-    grid = extract_grid(data)
-    graph, start, end = make_graph(grid, 1, 4)
+def least_heat_loss(data: Sequence[str], min_dist: int, max_dist: int) -> int:
+    graph, start, end = build_graph(data, min_dist, max_dist)
 
     path = dijkstra(start, end)
 
     return int(path[-1].distance)
 
-def solve_part2(data: list[str]) -> int:
-    grid = extract_grid(data)
-    graph, start, end = make_graph(grid, 4, 11)
+def solve_part1(data: Sequence[str]) -> int:
+    return least_heat_loss(data, 1, 4)
 
-    path = dijkstra(start, end)
+def solve_part2(data: Sequence[str]) -> int:
+    return least_heat_loss(data, 4, 11)
 
-    return int(path[-1].distance)
+def solve(data: Sequence[str]) -> tuple[int, int]:
+    # Dijkstra marks the nodes it visits and each part moves by different
+    # distances, so every part needs a graph of its own
+    return least_heat_loss(data, 1, 4), least_heat_loss(data, 4, 11)
 
 
 def main() -> None:
-    with open("input/day17.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day17.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
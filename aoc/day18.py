@@ -1,10 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cache
 from itertools import pairwise
 import re
 from typing import Self
 
+from aoc.common import MappedInput
+
 
 @dataclass(slots=True, order=True)
 class Vector2d:
@@ -86,10 +89,13 @@ def parse_simple_instruction(line: str) -> Instruction:
     return Instruction(direction, length)
 
 
-COLOR_MATCHER = re.compile('#([0-9a-f]{5})([0-9a-f])')
+@cache
+def color_matcher() -> re.Pattern[str]:
+    # Compiled on first use rather than on import, part 1 never needs it
+    return re.compile('#([0-9a-f]{5})([0-9a-f])')
 
 def parse_color_instruction(line: str):
-    hex_color = COLOR_MATCHER.search(line)
+    hex_color = color_matcher().search(line)
 
     if not hex_color:
         raise ValueError("Color not found in line")
@@ -114,62 +120,65 @@ def parse_color_instruction(line: str):
 
 
 
-def parse_instructions(data: Sequence[str], use_color: bool) -> list[Instruction]:
+def parse_instructions(data: Iterable[str], use_color: bool) -> Iterator[Instruction]:
     if not use_color:
-        return [parse_simple_instruction(line) for line in data]
+        return (parse_simple_instruction(line) for line in data)
     else:
-        return [parse_color_instruction(line) for line in data]
+        return (parse_color_instruction(line) for line in data)
 
 
 
-def process_instructions(instructions: Sequence[Instruction]) -> list[Vector2d]:
+def process_instructions(instructions: Iterable[Instruction]) -> Iterator[Vector2d]:
     cursor: Vector2d = Vector2d(0, 0)
-    polygon: list[Vector2d] = [cursor]
+    yield cursor
 
     for instruction in instructions:
         cursor += instruction.direction.as_vector() * instruction.length
-        polygon.append(cursor)
-    
-    return polygon
+        yield cursor
 
 
-def shoelace(polygon: Sequence[Vector2d]) -> float:
+def shoelace(polygon: Iterable[Vector2d]) -> tuple[int, int]:
+    # Twice the enclosed area and the boundary length, in a single pass so the
+    # vertices never need to be stored
     area = 0
-    for lhs, rhs in pairwise(reversed(polygon)):
+    boundary = 0
+    for lhs, rhs in pairwise(polygon):
         area += lhs.x * rhs.y - lhs.y * rhs.x
-    
-    return abs(area / 2)
-
+        boundary += abs(rhs.x - lhs.x) + abs(rhs.y - lhs.y)
 
-def perimeter(instructions: Sequence[Instruction]) -> float:
-    return sum(instruction.length for instruction in instructions)
+    return abs(area), boundary
 
 
-def calculate_area(data: Sequence[str], use_color: bool) -> int:
+def calculate_area(data: Iterable[str], use_color: bool) -> int:
     instructions = parse_instructions(data, use_color=use_color)
     polygon = process_instructions(instructions)
-    inner_area = shoelace(polygon)
-    perimeter_area = perimeter(instructions)
+    double_area, perimeter_length = shoelace(polygon)
 
-    area = inner_area + perimeter_area / 2 + 1
-    
-    return int(area)
+    # Pick's theorem, the outline is rectilinear so both halves are exact
+    return double_area // 2 + perimeter_length // 2 + 1
 
 
-def solve_part1(data: Sequence[str]) -> int:
+def solve_part1(data: Iterable[str]) -> int:
     return calculate_area(data, use_color=False)
 
 
-def solve_part2(data: Sequence[str]) -> int:
+def solve_part2(data: Iterable[str]) -> int:
     return calculate_area(data, use_color=True)
 
 
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    # The parts read different fields of the same lines
+    lines = list(data)
+
+    return calculate_area(lines, use_color=False), calculate_area(lines, use_color=True)
+
+
 def main() -> None:
-    with open("input/day18.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day18.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
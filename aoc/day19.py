@@ -1,7 +1,9 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 import operator
 from typing import Callable, Self, Optional, NamedTuple, TypeAlias
 
+from aoc.common import MappedInput
+
 
 COMPARE_FUNCS = {
     '>': operator.gt,
@@ -73,13 +75,17 @@ class Workflow:
             raise ValueError("Invalid workflow")
 
 
-def split_data(data: Sequence[str]) -> tuple[Sequence[str], Sequence[str]]:
-    split_point = data.index('')
+def split_data(data: Iterable[str]) -> tuple[list[str], Iterator[str]]:
+    # Workflows are read up to the blank line, the parts are left in the stream
+    lines = iter(data)
 
-    workflow_data = data[:split_point]
-    part_data = data[split_point + 1:]
+    workflow_data = []
+    for line in lines:
+        if not line:
+            break
+        workflow_data.append(line)
 
-    return workflow_data, part_data
+    return workflow_data, lines
 
 
 def parse_workflow(line: str) -> Workflow:
@@ -103,7 +109,7 @@ def parse_part(line: str) -> Part:
     return part
 
 
-def parse_data(data: Sequence[str]) -> tuple[dict[str, Workflow], list[Part]]:
+def parse_data(data: Iterable[str]) -> tuple[dict[str, Workflow], Iterator[Part]]:
     workflow_data, part_data = split_data(data)
 
     workflows = {
@@ -111,7 +117,7 @@ def parse_data(data: Sequence[str]) -> tuple[dict[str, Workflow], list[Part]]:
         for workflow
         in map(parse_workflow, workflow_data)
     }
-    parts = [parse_part(line) for line in part_data]  
+    parts = (parse_part(line) for line in part_data)
 
     return workflows, parts
 
@@ -125,9 +131,7 @@ def process_part(part: Part, workflows: dict[str, Workflow]) -> str:
 
     return next_workflow
 
-def solve_part1(data: Sequence[str]) -> int:
-    workflows, parts = parse_data(data)
-
+def sum_accepted_parts(workflows: dict[str, Workflow], parts: Iterable[Part]) -> int:
     total = 0
     for part in parts:
         result = process_part(part, workflows)
@@ -160,9 +164,7 @@ def sum_accepted(interval: Interval) -> int:
     return size
 
 
-def solve_part2(data: Sequence[str]) -> int:
-    workflows, _ = parse_data(data)
-
+def count_accepted_combinations(workflows: dict[str, Workflow]) -> int:
     intervals = [
         Interval(
             {"x": 1, "m": 1, "a": 1, "s": 1},
@@ -208,12 +210,28 @@ def solve_part2(data: Sequence[str]) -> int:
     return total
 
 
+def solve_part1(data: Iterable[str]) -> int:
+    return sum_accepted_parts(*parse_data(data))
+
+
+def solve_part2(data: Iterable[str]) -> int:
+    workflows, _ = parse_data(data)
+
+    return count_accepted_combinations(workflows)
+
+
+def solve(data: Iterable[str]) -> tuple[int, int]:
+    workflows, parts = parse_data(data)
+
+    return sum_accepted_parts(workflows, parts), count_accepted_combinations(workflows)
+
+
 def main() -> None:
-    with open("input/day19.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day19.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
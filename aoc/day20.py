@@ -5,7 +5,9 @@ from functools import reduce
 from itertools import chain, count
 from math import lcm
 import operator
-from typing import Optional, Self
+from typing import Iterator, Optional, Self
+
+from aoc.common import MappedInput
 
 
 class Pulse:
@@ -138,54 +140,85 @@ def parse_input(data: Sequence[str]) -> dict[str, Module]:
     return modules
 
 
-def solve_part1(data: Sequence[str]) -> int:
-    modules = parse_input(data)
+def press_button(modules: dict[str, Module]) -> Iterator[Pulse]:
+    # Every pulse sent after a button press, in the order they are processed
+    pulse_queue: deque[Pulse] = deque()
+    pulse_queue.append(Pulse(False, Button('button'), modules['broadcaster']))
 
-    pulse_count = Counter()
+    while pulse_queue:
+        pulse = pulse_queue.popleft()
 
-    for _ in range(1000):
-        pulse_queue: deque[Pulse] = deque()
-        pulse_queue.append(Pulse(False, Button('button'), modules['broadcaster']))
+        yield pulse
 
-        while pulse_queue:
-            pulse = pulse_queue.popleft()
+        pulse_queue.extend(pulse.target.dispatch_pulse(pulse))
 
-            pulse_count[pulse.value] += 1
 
-            pulse_queue.extend(pulse.target.dispatch_pulse(pulse))
+def rx_feeders(modules: dict[str, Module]) -> dict[str, Optional[int]]:
+    rx_conjunction = modules['rx'].inputs[0]
+
+    return {module.name: None for module in rx_conjunction.inputs}
+
+
+def pulse_product(modules: dict[str, Module], presses: int = 1000) -> int:
+    pulse_count = Counter()
+
+    for _ in range(presses):
+        for pulse in press_button(modules):
+            pulse_count[pulse.value] += 1
 
     return reduce(operator.mul, pulse_count.values())
 
 
+def solve_part1(data: Sequence[str]) -> int:
+    return pulse_product(parse_input(data))
+
+
 def solve_part2(data: Sequence[str]) -> int:
     modules = parse_input(data)
 
-    rx_conjunction = modules['rx'].inputs[0]
-    targets: dict[str, Optional[int]] = {module.name: None for module in rx_conjunction.inputs}
+    targets = rx_feeders(modules)
 
     for i in count(1):
-        pulse_queue: deque[Pulse] = deque()
-        pulse_queue.append(Pulse(False, Button('button'), modules['broadcaster']))
-
-        while pulse_queue:
-            pulse = pulse_queue.popleft()
-
+        for pulse in press_button(modules):
             if pulse.value and pulse.source.name in targets and not targets[pulse.source.name]:
                 targets[pulse.source.name] = i
-
-            pulse_queue.extend(pulse.target.dispatch_pulse(pulse))
         
         if all(targets.values()):
             return lcm(*targets.values())
         
     raise RuntimeError("Unreachable")
 
+
+def solve(data: Sequence[str]) -> tuple[int, Optional[int]]:
+    modules = parse_input(data)
+
+    # Without an rx module, like the examples, there is no part 2
+    if 'rx' not in modules:
+        return pulse_product(modules), None
+
+    # Part 1 is the first 1000 presses of the same run of the circuit
+    pulse_count = Counter()
+    targets = rx_feeders(modules)
+
+    for i in count(1):
+        for pulse in press_button(modules):
+            if i <= 1000:
+                pulse_count[pulse.value] += 1
+
+            if pulse.value and pulse.source.name in targets and not targets[pulse.source.name]:
+                targets[pulse.source.name] = i
+
+        if i >= 1000 and all(targets.values()):
+            return reduce(operator.mul, pulse_count.values()), lcm(*targets.values())
+
+    raise RuntimeError("Unreachable")
+
 def main() -> None:
-    with open("input/day20.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day20.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Self
 
+from aoc.common import MappedInput
+
 
 @dataclass(slots=True, order=True)
 class Vector2d:
@@ -183,19 +185,29 @@ def quadratic_solve(world: Map, counts: Sequence[int], steps: int):
     return a * x ** 2 + b * x + c
 
 
+def count_reachable_expanded(world: Map, steps: int) -> int:
+    counts = [count_reachable(world, 65 + i * 131) for i in range(3)]
+
+    return quadratic_solve(world, counts, steps)
+
+
 def solve_part2(data: Sequence[str], steps: int) -> int:
     world = parse_input(data)
 
-    counts = [count_reachable(world, 65 + i * 131) for i in range(3)]
+    return count_reachable_expanded(world, steps)
 
-    return quadratic_solve(world, counts, steps)
+
+def solve(data: Sequence[str], steps: int = 64, expanded_steps: int = 26501365) -> tuple[int, int]:
+    world = parse_input(data)
+
+    return count_reachable(world, steps), count_reachable_expanded(world, expanded_steps)
 
 def main() -> None:
-    with open("input/day21.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day21.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data, 64))
-    print("Part 2:", solve_part2(data, 26501365))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
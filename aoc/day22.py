@@ -1,3 +1,4 @@
+from array import array
 from collections import Counter, deque
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -5,6 +6,9 @@ from itertools import product, groupby, count
 from operator import attrgetter
 from typing import Any, Generator, Iterator, Self
 
+from aoc.cache import cached
+from aoc.common import MappedInput, profile_section, profiled
+
 
 @dataclass(slots=True, order=True)
 class Vector3d:
@@ -99,6 +103,7 @@ def parse_line(line: str) -> Brick:
     return Brick(start, end)
 
 
+@profiled
 def parse_input(data: Sequence[str]) -> list[Brick]:
     bricks = sorted([parse_line(line) for line in data], key=attrgetter('start.z'))
 
@@ -124,6 +129,7 @@ def fall_distance(brick: Brick, height: int) -> int:
     return max(brick.start.z - height - 1, 0)
 
 
+@profiled
 def process_fall(bricks: list[Brick]) -> None:
     width = bricks[0].end.x + 1
     depth = bricks[0].end.y + 1
@@ -145,6 +151,7 @@ def process_fall(bricks: list[Brick]) -> None:
     bricks.sort(key=attrgetter('start.z'))
 
 
+@profiled
 def build_tree(bricks: list[Brick]):
     groups: dict[int, list[Brick]] = {}
 
@@ -173,6 +180,44 @@ def build_tree(bricks: list[Brick]):
                 continue
 
 
+def encode_bricks(bricks: list[Brick]) -> tuple[array, array]:
+    # Corner coordinates of every brick, and (parent, child) index pairs
+    index = {id(brick): i for i, brick in enumerate(bricks)}
+
+    corners = array('I', (n for brick in bricks for n in (*brick.start, *brick.end)))
+    links = array('I', (
+        n for brick in bricks for child in brick.children
+        for n in (index[id(brick)], index[id(child)])
+    ))
+
+    return corners, links
+
+
+def decode_bricks(encoded: tuple[array, array]) -> list[Brick]:
+    corners, links = encoded
+
+    bricks = [
+        Brick(Vector3d(*corners[i:i + 3]), Vector3d(*corners[i + 3:i + 6]))
+        for i in range(0, len(corners), 6)
+    ]
+    for i in range(0, len(links), 2):
+        bricks[links[i]].add_child(bricks[links[i + 1]])
+
+    return bricks
+
+
+@cached(encode_bricks, decode_bricks)
+def settle_bricks(data: Sequence[str]) -> list[Brick]:
+    bricks = parse_input(data)
+
+    process_fall(bricks)
+
+    build_tree(bricks)
+
+    return bricks
+
+
+@profiled
 def mark_removable(bricks: Sequence[Brick]):
     for brick in bricks:
         if not brick.children:
@@ -184,17 +229,16 @@ def mark_removable(bricks: Sequence[Brick]):
         
         
 
-def solve_part1(data: Sequence[str]) -> int:
-    bricks = parse_input(data)
+def count_removable(bricks: Sequence[Brick]) -> int:
+    return sum(1 for brick in bricks if brick.removable)
 
-    process_fall(bricks)
-    
-    build_tree(bricks)
+
+def solve_part1(data: Sequence[str]) -> int:
+    bricks = settle_bricks(data)
 
     mark_removable(bricks)
-    total_dead = sum(1 for brick in bricks if brick.removable)
 
-    return total_dead
+    return count_removable(bricks)
 
 
 def calculate_falls(node):
@@ -213,33 +257,42 @@ def calculate_falls(node):
     return len(passed) - 1
 
 
-def solve_part2(data: Sequence[str]) -> int:
-    bricks = parse_input(data)
+def count_chain_reactions(bricks: Sequence[Brick]) -> int:
+    total = 0
+    with profile_section('calculate_falls'):
+        for brick in bricks[1:]:
+            if brick.removable:
+                continue
 
-    process_fall(bricks)
+            falls = calculate_falls(brick)
+
+            total += falls
     
-    build_tree(bricks)
+    return total
+
+
+def solve_part2(data: Sequence[str]) -> int:
+    bricks = settle_bricks(data)
 
     mark_removable(bricks)
 
-    total = 0
-    for brick in bricks[1:]:
-        if brick.removable:
-            continue
+    return count_chain_reactions(bricks)
 
-        falls = calculate_falls(brick)
 
-        total += falls
-    
-    return total
+def solve(data: Sequence[str]) -> tuple[int, int]:
+    bricks = settle_bricks(data)
+
+    mark_removable(bricks)
+
+    return count_removable(bricks), count_chain_reactions(bricks)
 
 
 def main() -> None:
-    with open("input/day22.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day22.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
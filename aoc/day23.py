@@ -1,9 +1,13 @@
+from array import array
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from itertools import product
 from typing import Optional, Self        
 
+from aoc.cache import cached
+from aoc.common import MappedInput, profile_section, profiled
+
 
 @dataclass(slots=True, order=True, frozen=True)
 class Vector2d:
@@ -90,7 +94,60 @@ class Edge:
     target: Node
 
 
-def build_paths(data: Sequence[str], slopes: bool) -> tuple[dict[Vector2d, Node], Vector2d, Vector2d]:
+Paths = tuple[dict[Vector2d, Node], Vector2d, Vector2d]
+
+
+def encode_paths(paths: Paths) -> tuple[array, str, bytes, array, array, array]:
+    # Nodes dropped from the map by simplify() can still be edge targets, so
+    # every node reachable through an edge is stored, flagged if it is mapped
+    nodes, start, end = paths
+
+    index: dict[int, int] = {}
+    graph: list[Node] = []
+    to_visit = list(nodes.values())
+    while to_visit:
+        node = to_visit.pop()
+        if id(node) in index:
+            continue
+        index[id(node)] = len(graph)
+        graph.append(node)
+        to_visit.extend(edge.target for edge in node.edges)
+
+    positions = array('i', (n for node in graph for n in (node.position.x, node.position.y)))
+    positions.extend((start.x, start.y, end.x, end.y))
+    contents = ''.join(node.content for node in graph)
+    mapped = bytes(nodes.get(node.position) is node for node in graph)
+
+    edge_offsets = array('I', [0])
+    edge_targets = array('I')
+    edge_costs = array('I')
+    for node in graph:
+        edge_targets.extend(index[id(edge.target)] for edge in node.edges)
+        edge_costs.extend(edge.cost for edge in node.edges)
+        edge_offsets.append(len(edge_targets))
+
+    return positions, contents, mapped, edge_offsets, edge_targets, edge_costs
+
+
+def decode_paths(encoded: tuple[array, str, bytes, array, array, array]) -> Paths:
+    positions, contents, mapped, edge_offsets, edge_targets, edge_costs = encoded
+
+    graph = [
+        Node(Vector2d(positions[2 * i], positions[2 * i + 1]), content)
+        for i, content in enumerate(contents)
+    ]
+    for node, first, last in zip(graph, edge_offsets, edge_offsets[1:]):
+        node.edges = [Edge(edge_costs[i], graph[edge_targets[i]]) for i in range(first, last)]
+
+    nodes = {node.position: node for node, is_mapped in zip(graph, mapped) if is_mapped}
+    start_x, start_y, end_x, end_y = positions[-4:]
+
+    return nodes, Vector2d(start_x, start_y), Vector2d(end_x, end_y)
+
+
+@cached(encode_paths, decode_paths)
+@profiled
+def build_paths(data: Sequence[str], slopes: bool) -> Paths:
     width, height = len(data[0]), len(data)
     start = Vector2d(data[0].index('.'), 0)
     end = Vector2d(data[-1].index('.'), height - 1)
@@ -151,6 +208,7 @@ def detach_node(node: Node) -> None:
     node.edges.clear()
 
 
+@profiled
 def simplify(nodes: dict[Vector2d, Node]) -> None:
     """
     Simplify graph by removing non-terminal and non-branching nodes,
@@ -193,26 +251,35 @@ def dfs(root: Node, target: Node) -> int:
     return length
 
 
-def solve_part1(data: Sequence[str]) -> int:
-    paths, start, end = build_paths(data, slopes=True)
-    path_lengths = dfs(paths[start], paths[end])
+def longest_hike(data: Sequence[str], slopes: bool) -> int:
+    paths, start, end = build_paths(data, slopes=slopes)
+
+    # dfs is recursive, so it is timed as a whole from here
+    with profile_section('dfs'):
+        path_lengths = dfs(paths[start], paths[end])
 
     return path_lengths
 
 
+def solve_part1(data: Sequence[str]) -> int:
+    return longest_hike(data, slopes=True)
+
+
 def solve_part2(data: Sequence[str]) -> int:
-    paths, start, end = build_paths(data, slopes=False)
-    path_lengths = dfs(paths[start], paths[end])
+    return longest_hike(data, slopes=False)
 
-    return path_lengths
+
+def solve(data: Sequence[str]) -> tuple[int, int]:
+    # The slopes change which edges exist, so each part builds its own graph
+    return longest_hike(data, slopes=True), longest_hike(data, slopes=False)
 
 
 def main() -> None:
-    with open("input/day23.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day23.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
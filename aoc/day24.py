@@ -1,10 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from copy import deepcopy
 from dataclasses import dataclass
-from itertools import combinations
+from itertools import combinations, islice
 from math import copysign
 from typing import Iterator, Self
 
+from aoc.common import MappedInput
+
 @dataclass(slots=True, order=True, frozen=True)
 class Vector3d:
     x: float
@@ -47,7 +49,7 @@ def parse_line(line: str) -> Hailstone:
 
 
 
-def parse_input(data: Sequence[str]) -> list[Hailstone]:
+def parse_input(data: Iterable[str]) -> list[Hailstone]:
     return [parse_line(line) for line in data]
 
 
@@ -98,9 +100,7 @@ def check_bounds(intersection: Vector3d, bounds: tuple[float, float]):
     )
 
 
-def solve_part1(data: Sequence[str], bounds: tuple[float, float]) -> int:
-    hailstones = parse_input(data)
-
+def count_intersections(hailstones: Sequence[Hailstone], bounds: tuple[float, float]) -> int:
     total = 0
 
     for a, b in combinations(hailstones, 2):
@@ -112,6 +112,10 @@ def solve_part1(data: Sequence[str], bounds: tuple[float, float]) -> int:
     return total
 
 
+def solve_part1(data: Iterable[str], bounds: tuple[float, float]) -> int:
+    return count_intersections(parse_input(data), bounds)
+
+
 # Many parts of this code ported to Python from:
 # https://github.com/tckmn/polyaoc-2023/blob/97689dc6b5ff38c557cd885b10be425e14928958/24/rb/24.rb#L22
 # among other hints and tips from other shared solutions
@@ -144,7 +148,7 @@ def gaussian_elimination(matrix: list[list[float]]):
 
     return m
 
-def generate_matrices(hailstones: list[Hailstone], properties: tuple[str, str]):
+def generate_matrices(hailstones: Sequence[Hailstone], properties: tuple[str, str]):
     m = [
         [
         -getattr(s.velocity, properties[1]),
@@ -158,8 +162,7 @@ def generate_matrices(hailstones: list[Hailstone], properties: tuple[str, str]):
         
     return [[a - b for a, b in zip(r, m[-1])] for r in m[:4]]
 
-def solve_part2(data: Sequence[str]) -> int:
-    hailstones = parse_input(data)
+def rock_position_sum(hailstones: Sequence[Hailstone]) -> int:
     xy_elim = gaussian_elimination(generate_matrices(hailstones, ('x', 'y')))
     zy_elim = gaussian_elimination(generate_matrices(hailstones, ('z', 'y')))
     
@@ -168,14 +171,21 @@ def solve_part2(data: Sequence[str]) -> int:
     
     return int(round(x) + round(y) + round(z))
 
-def main() -> None:
-    with open("input/day24.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+def solve_part2(data: Iterable[str]) -> int:
+    # Five hailstones are enough to pin down the rock, the rest of the input is never read
+    return rock_position_sum(parse_input(islice(data, 5)))
+
+def solve(data: Iterable[str], bounds: tuple[float, float] = (200_000_000_000_000, 400_000_000_000_000)) -> tuple[int, int]:
+    hailstones = parse_input(data)
 
-    bounds=(200_000_000_000_000, 400_000_000_000_000)
+    return count_intersections(hailstones, bounds), rock_position_sum(hailstones[:5])
+
+def main() -> None:
+    with MappedInput("input/day24.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data, bounds=bounds))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
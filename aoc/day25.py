@@ -6,6 +6,8 @@ from math import prod
 from random import choice
 from typing import Self
 
+from aoc.common import MappedInput
+
 
 class ZeroDeletingCounter(Counter):
     def __setitem__(self: Self, key, value):
@@ -119,12 +121,17 @@ def solve_part2(data: Sequence[str]) -> int:
     return 0
 
 
+def solve(data: Sequence[str]) -> tuple[int, int]:
+    # There is no second puzzle on the last day
+    return solve_part1(data), solve_part2(data)
+
+
 def main() -> None:
-    with open("input/day25.txt", 'r') as data_file:
-        data: list[str] = data_file.read().splitlines()
+    with MappedInput("input/day25.txt") as data:
+        part1, part2 = solve(data)
 
-    print("Part 1:", solve_part1(data))
-    print("Part 2:", solve_part2(data))
+    print("Part 1:", part1)
+    print("Part 2:", part2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,283 @@
+import argparse
+import importlib
+import io
+import json
+import sys
+import time
+from collections.abc import Callable, Sequence
+from contextlib import ExitStack, redirect_stdout
+from pathlib import Path
+from typing import Any, Optional
+
+import aoc
+from aoc.cache import DEFAULT_MAX_BYTES, caching
+from aoc.common import MappedInput, profiling, stream_lines
+
+# The days, concurrent.futures, pkgutil, platform, subprocess and tracemalloc
+# are imported where they are used: a single day run should not pay for the
+# process pool, or for the other days. startup_report() keeps it that way
+
+# Extra arguments each part needs besides the input, as used by the days' main()
+PART_ARGS: dict[int, tuple[tuple, tuple]] = {
+    11: ((), (1_000_000,)),
+    21: ((64,), (26501365,)),
+    24: (((200_000_000_000_000, 400_000_000_000_000),), ()),
+}
+
+# Days whose solvers go through their input once, so they can read it from a stream
+STREAMING_DAYS = {1, 2, 3, 4, 7, 9, 12, 15, 18, 19, 24}
+
+
+def available_days() -> list[int]:
+    import pkgutil
+
+    return sorted(
+        int(module.name.removeprefix('day'))
+        for module in pkgutil.iter_modules(aoc.__path__)
+        if module.name.startswith('day') and module.name[3:].isdecimal()
+    )
+
+
+def load_input(day: int, input_dir: Path) -> MappedInput:
+    return MappedInput(input_dir / f"day{day:02}.txt")
+
+
+def measure(func: Callable, *args: Any, trace_memory: bool = True) -> tuple[Any, dict[str, Any]]:
+    stats: dict[str, Any] = {}
+
+    if trace_memory:
+        import tracemalloc
+
+        tracemalloc.start()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        # Some days report progress on stdout, which would corrupt the report
+        with redirect_stdout(io.StringIO()):
+            result = func(*args)
+    except Exception as error:
+        result = None
+        stats['error'] = repr(error)
+    finally:
+        stats['wall'] = time.perf_counter() - wall_start
+        stats['cpu'] = time.process_time() - cpu_start
+
+        if trace_memory:
+            stats['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return result, stats
+
+
+def run_day(day: int, input_dir: Path, trace_memory: bool = True, profile: bool = False,
+            cache_dir: Optional[Path] = None, cache_size: int = DEFAULT_MAX_BYTES,
+            together: bool = False, cross_check: bool = False) -> dict[str, Any]:
+    module = importlib.import_module(f"aoc.day{day:02}")
+    part_args = PART_ARGS.get(day, ((), ()))
+
+    if together:
+        # solve() parses once for both parts, with the puzzle's own arguments as defaults
+        runs = [('solve', module.solve, ())]
+    else:
+        runs = [(str(part), getattr(module, f"solve_part{part}"), args) for part, args in enumerate(part_args, 1)]
+
+    try:
+        data = load_input(day, input_dir)
+    except OSError as error:
+        # A missing input only fails its own day, the others still report
+        return {'day': day, 'error': repr(error)}
+
+    results = {}
+    stacks: list[str] = []
+    with ExitStack() as contexts:
+        contexts.enter_context(data)
+        if cache_dir is not None:
+            contexts.enter_context(caching(cache_dir, cache_size))
+
+        for name, solver, args in runs:
+            if profile:
+                with profiling() as profiler:
+                    with profiler.section(f"day{day:02}"), profiler.section(solver.__name__):
+                        answer, stats = measure(solver, data, *args, trace_memory=trace_memory)
+                stacks.extend(profiler.collapsed())
+            else:
+                answer, stats = measure(solver, data, *args, trace_memory=trace_memory)
+
+            results[name] = {'answer': answer, **stats}
+
+        # Days whose parts can be solved by several methods list a solver per
+        # method in CROSS_CHECK, by part
+        checked = {}
+        for part, solvers in (getattr(module, 'CROSS_CHECK', {}) if cross_check else {}).items():
+            methods = {}
+            for method, solver in solvers.items():
+                answer, stats = measure(solver, data, *part_args[part - 1], trace_memory=trace_memory)
+                methods[method] = {'answer': answer, **stats}
+
+            answers = [check['answer'] for check in methods.values()]
+            checked[str(part)] = {'methods': methods, 'agree': None not in answers and len(set(answers)) == 1}
+
+    result: dict[str, Any] = {'day': day, 'parts': results}
+    if together:
+        stats = results.pop('solve')
+        answers = stats.pop('answer') or (None, None)
+        result['parts'] = {'1': {'answer': answers[0]}, '2': {'answer': answers[1]}}
+        result['solve'] = stats
+
+    if checked:
+        result['cross_check'] = checked
+
+    if profile:
+        result['stacks'] = stacks
+
+    return result
+
+
+def run_stream(day: int, source: str, parts: Sequence[int], trace_memory: bool = True) -> dict[str, Any]:
+    if day not in STREAMING_DAYS:
+        raise ValueError(f"Day {day} cannot read its input from a stream")
+    if source == '-' and len(parts) > 1:
+        raise ValueError("stdin can only be streamed through a single part")
+
+    module = importlib.import_module(f"aoc.day{day:02}")
+    part_args = PART_ARGS.get(day, ((), ()))
+
+    results = {}
+    for part in parts:
+        solver = getattr(module, f"solve_part{part}")
+        answer, stats = measure(solver, stream_lines(source), *part_args[part - 1], trace_memory=trace_memory)
+        results[str(part)] = {'answer': answer, **stats}
+
+    return {'day': day, 'parts': results}
+
+
+def run(days: Sequence[int], input_dir: Path, jobs: int = 1, trace_memory: bool = True,
+        profile: bool = False, cache_dir: Optional[Path] = None,
+        cache_size: int = DEFAULT_MAX_BYTES, together: bool = False,
+        cross_check: bool = False) -> list[dict[str, Any]]:
+    if jobs == 1:
+        return [
+            run_day(day, input_dir, trace_memory, profile, cache_dir, cache_size, together, cross_check)
+            for day in days
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(run_day, day, input_dir, trace_memory, profile, cache_dir, cache_size, together, cross_check)
+            for day in days
+        ]
+        return [future.result() for future in futures]
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    # Lines of -X importtime look like 'import time:  self [us] | cumulative | imported package',
+    # nested imports being indented under the module that triggered them
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative, name = line.removeprefix('import time:').split('|')
+        if self_time.strip().isdecimal():
+            modules[name.strip()] = (int(self_time), int(cumulative))
+
+    return modules
+
+
+def startup_report(day: int, top: int = 5) -> dict[str, Any]:
+    import subprocess
+
+    # Cold start of a fresh interpreter importing only the day's module
+    module = f"aoc.day{day:02}"
+    wall_start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        capture_output=True, text=True, cwd=Path(aoc.__path__[0]).parent,
+    )
+    wall = time.perf_counter() - wall_start
+
+    if process.returncode:
+        return {'day': day, 'error': process.stderr.strip().splitlines()[-1]}
+
+    modules = parse_importtime(process.stderr)
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+
+    return {
+        'day': day,
+        'wall': wall,
+        'import': modules[module][1] / 1e6,
+        'slowest': {name: self_time / 1e6 for name, (self_time, _) in slowest},
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='aoc', description="Run and time the Advent of Code 2023 solutions")
+    parser.add_argument('days', nargs='*', type=int, help="days to run, all of them by default")
+    parser.add_argument('-i', '--input-dir', type=Path, default=Path('input'), help="directory holding the dayNN.txt inputs")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="number of worker processes")
+    parser.add_argument('-o', '--output', type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument('--no-memory', dest='trace_memory', action='store_false', help="skip peak memory tracing, which slows down the solvers")
+    parser.add_argument('--together', action='store_true', help="time both parts at once through solve(), which parses the input only once")
+    parser.add_argument('--profile', metavar='PATH', type=Path, help="write the time spent in the instrumented functions to PATH as flamegraph collapsed stacks")
+    parser.add_argument('--cache', metavar='DIR', type=Path, help="reuse the parsed inputs of days 10, 17, 22 and 23 stored in DIR")
+    parser.add_argument('--cache-size', metavar='MB', type=int, default=DEFAULT_MAX_BYTES // 2**20, help="evict the least recently used entries past this size")
+    parser.add_argument('--stream', metavar='PATH', help="feed a single day its input line by line from PATH, or from stdin with '-'")
+    parser.add_argument('-p', '--part', type=int, choices=(1, 2), help="only run this part, required when streaming stdin")
+    parser.add_argument('--cross-check', action='store_true', help="also solve the parts that have several methods with each of them, failing if their answers differ")
+    parser.add_argument('--startup', action='store_true', help="report how long a fresh interpreter takes to import each day instead of running it")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    if args.startup:
+        days = [startup_report(day) for day in args.days or available_days()]
+    elif args.stream:
+        if len(args.days) != 1:
+            sys.exit("--stream needs exactly one day")
+        parts = [args.part] if args.part else [1, 2]
+        try:
+            days = [run_stream(args.days[0], args.stream, parts, args.trace_memory)]
+        except ValueError as error:
+            sys.exit(str(error))
+    else:
+        days = run(
+            args.days or available_days(), args.input_dir, args.jobs, args.trace_memory,
+            args.profile is not None, args.cache, args.cache_size * 2**20, args.together,
+            args.cross_check,
+        )
+
+    if args.profile:
+        with open(args.profile, 'w') as profile_file:
+            for day in days:
+                for stack in day.pop('stacks', []):
+                    print(stack, file=profile_file)
+
+    import platform
+
+    report = {
+        'python': platform.python_version(),
+        'days': days,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    mismatches = [
+        day['day'] for day in days
+        if not all(check['agree'] for check in day.get('cross_check', {}).values())
+    ]
+    if mismatches:
+        sys.exit(f"The methods disagree on days {', '.join(map(str, mismatches))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,598 @@
+import math
+import string
+from collections.abc import Callable
+from itertools import count, product
+from random import Random
+
+# Every generator takes a seeded Random and a scale factor, where 1 produces an
+# input about the size of the real puzzle input, and returns its lines.
+Generator = Callable[[Random, float], list[str]]
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def scaled_side(base: int, scale: float) -> int:
+    # Grid days scale their area, not their side
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def unique_names(rng: Random, n: int, excluded: set[str] = set(), alphabet: str = string.ascii_lowercase) -> list[str]:
+    length = 2
+    while len(alphabet) ** length < 2 * (n + len(excluded)):
+        length += 1
+
+    names: set[str] = set()
+    while len(names) < n:
+        name = ''.join(rng.choices(alphabet, k=length))
+        if name not in excluded:
+            names.add(name)
+
+    result = sorted(names)
+    rng.shuffle(result)
+    return result
+
+
+def random_grid(rng: Random, width: int, height: int, cells: str, weights: list[float]) -> list[str]:
+    return [''.join(rng.choices(cells, weights, k=width)) for _ in range(height)]
+
+
+def generate_day01(rng: Random, scale: float) -> list[str]:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(2, 8)):
+            match rng.randrange(3):
+                case 0:
+                    pieces.append(rng.choice(string.digits[1:]))
+                case 1:
+                    pieces.append(rng.choice(DIGIT_WORDS))
+                case _:
+                    pieces.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))))
+        rng.shuffle(pieces)
+        lines.append(''.join(pieces))
+
+    return lines
+
+
+def generate_day02(rng: Random, scale: float) -> list[str]:
+    lines = []
+    for game_id in range(1, scaled(100, scale) + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            sets.append(', '.join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(sets)}")
+
+    return lines
+
+
+def generate_day03(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(140, scale)
+    rows = [['.'] * side for _ in range(side)]
+
+    for _ in range(side * side // 16):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if rng.random() < 0.25:
+            rows[y][x] = rng.choice('*#+$/@%=&-')
+        else:
+            digits = str(rng.randint(1, 999))
+            for i, digit in enumerate(digits[:side - x]):
+                rows[y][x + i] = digit
+
+    return [''.join(row) for row in rows]
+
+
+def generate_day04(rng: Random, scale: float) -> list[str]:
+    n_cards = scaled(200, scale)
+    width = len(str(n_cards))
+    lines = []
+    for card_id in range(1, n_cards + 1):
+        numbers = rng.sample(range(1, 100), 25)
+        matches = min(rng.randint(0, 10), rng.randint(0, 10))
+        others = [n for n in range(1, 100) if n not in numbers]
+        winners = rng.sample(numbers, matches) + rng.sample(others, 10 - matches)
+        rng.shuffle(winners)
+
+        winners_str = ' '.join(f"{n:2}" for n in winners)
+        numbers_str = ' '.join(f"{n:2}" for n in numbers)
+        lines.append(f"Card {card_id:>{width}}: {winners_str} | {numbers_str}")
+
+    return lines
+
+
+def generate_day05(rng: Random, scale: float) -> list[str]:
+    stages = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+    limit = 2 ** 32
+
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randrange(1, limit // 20)]
+
+    lines = ["seeds: " + ' '.join(map(str, seeds))]
+    for source, destination in zip(stages, stages[1:]):
+        cuts = sorted(set(rng.sample(range(1, limit), scaled(30, scale))))
+        segments = [(a, b - a) for a, b in zip([0] + cuts, cuts + [limit])]
+        rng.shuffle(segments)
+
+        lines += ['', f"{source}-to-{destination} map:"]
+        position = 0
+        for source_start, length in segments:
+            if rng.random() < 0.9:
+                lines.append(f"{position} {source_start} {length}")
+            position += length
+
+    return lines
+
+
+def generate_day06(rng: Random, scale: float) -> list[str]:
+    times = [rng.randint(40, 99) * max(1, round(scale)) for _ in range(4)]
+    distances = [t * t // 4 - rng.randint(1, t * t // 8) for t in times]
+
+    return [
+        "Time:     " + ''.join(f"{t:>7}" for t in times),
+        "Distance: " + ''.join(f"{d:>7}" for d in distances),
+    ]
+
+
+def generate_day07(rng: Random, scale: float) -> list[str]:
+    return [
+        f"{''.join(rng.choices('AKQJT98765432', k=5))} {rng.randint(1, 1000)}"
+        for _ in range(scaled(1000, scale))
+    ]
+
+
+def generate_day08(rng: Random, scale: float) -> list[str]:
+    n_ghosts = 6
+    layers_per_ghost = scaled(60, scale)
+
+    instructions = ''.join(rng.choices('LR', k=scaled(280, scale)))
+
+    # Intermediate names never end in A or Z, so only the chosen ones are starts or ends
+    n_middle = n_ghosts * 4 * layers_per_ghost
+    middle = [
+        name + rng.choice(string.ascii_uppercase[1:-1])
+        for name in unique_names(rng, n_middle, alphabet=string.ascii_uppercase)
+    ]
+    starts = ['AAA'] + [name + 'A' for name in unique_names(rng, n_ghosts - 1, {'AA'}, string.ascii_uppercase)]
+    ends = ['ZZZ'] + [name + 'Z' for name in unique_names(rng, n_ghosts - 1, {'ZZ'}, string.ascii_uppercase)]
+
+    nodes: list[tuple[str, str, str]] = []
+    middle_names = iter(middle)
+    for start, end in zip(starts, ends):
+        # Every ghost walks a ring of two-node layers, so each instruction
+        # advances it one layer, and the ring length decides its cycle
+        layers = [(next(middle_names), next(middle_names)) for _ in range(layers_per_ghost + rng.randrange(layers_per_ghost))]
+        nodes.append((start, layers[0][0], layers[0][1]))
+        for (a, b), (next_a, next_b) in zip(layers, layers[1:]):
+            nodes.append((a, next_a, next_b))
+            nodes.append((b, next_b, next_a))
+        last_a, last_b = layers[-1]
+        nodes.append((last_a, end, end))
+        nodes.append((last_b, end, end))
+        nodes.append((end, layers[0][0], layers[0][1]))
+
+    rng.shuffle(nodes)
+    return [instructions, ''] + [f"{name} = ({left}, {right})" for name, left, right in nodes]
+
+
+def generate_day09(rng: Random, scale: float) -> list[str]:
+    lines = []
+    for _ in range(scaled(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(' '.join(map(str, values)))
+
+    return lines
+
+
+def random_tree(rng: Random, width: int, height: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    start = (rng.randrange(width), rng.randrange(height))
+    visited = {start}
+    stack = [start]
+    edges = []
+
+    while stack:
+        x, y = stack[-1]
+        neighbors = [
+            (nx, ny)
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+
+        neighbor = rng.choice(neighbors)
+        visited.add(neighbor)
+        edges.append(((x, y), neighbor))
+        stack.append(neighbor)
+
+    return edges
+
+
+PIPES = {
+    frozenset({(0, -1), (0, 1)}): '|',
+    frozenset({(-1, 0), (1, 0)}): '-',
+    frozenset({(0, -1), (1, 0)}): 'L',
+    frozenset({(0, -1), (-1, 0)}): 'J',
+    frozenset({(0, 1), (-1, 0)}): '7',
+    frozenset({(0, 1), (1, 0)}): 'F',
+}
+
+
+def generate_day10(rng: Random, scale: float) -> list[str]:
+    blocks = max(2, scaled_side(140, scale) // 4)
+    side = blocks * 4 + 1
+
+    # Thicken a random spanning tree of 3x3 blocks, whose outline is a single loop
+    region: set[tuple[int, int]] = set()
+    for bx, by in product(range(blocks), repeat=2):
+        region.update(product(range(4 * bx + 1, 4 * bx + 4), range(4 * by + 1, 4 * by + 4)))
+    for (ax, ay), (bx, by) in random_tree(rng, blocks, blocks):
+        low_x, low_y = 4 * min(ax, bx) + 1, 4 * min(ay, by) + 1
+        if ax != bx:
+            region.update((low_x + 3, low_y + i) for i in range(3))
+        else:
+            region.update((low_x + i, low_y + 3) for i in range(3))
+
+    loop = {
+        (x, y) for x, y in region
+        if any((x + dx, y + dy) not in region for dx, dy in product((-1, 0, 1), repeat=2))
+    }
+
+    rows = [list(row) for row in random_grid(rng, side, side, '|-LJ7F.', [1, 1, 1, 1, 1, 1, 3])]
+    for x, y in loop:
+        openings = frozenset(
+            (dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if (x + dx, y + dy) in loop
+        )
+        rows[y][x] = PIPES[openings]
+
+    sx, sy = rng.choice(sorted(loop))
+    rows[sy][sx] = 'S'
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        if (sx + dx, sy + dy) not in loop and 0 <= sx + dx < side and 0 <= sy + dy < side:
+            rows[sy + dy][sx + dx] = '.'
+
+    return [''.join(row) for row in rows]
+
+
+def generate_day11(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 14))
+    empty_columns = set(rng.sample(range(side), side // 14))
+
+    rows = []
+    for y in range(side):
+        row = ['.'] * side
+        if y not in empty_rows:
+            for x in range(side):
+                if x not in empty_columns and rng.random() < 0.025:
+                    row[x] = '#'
+        rows.append(''.join(row))
+
+    return rows
+
+
+def generate_day12(rng: Random, scale: float) -> list[str]:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        springs = '#' + ''.join(rng.choices('.#', k=rng.randint(3, 19)))
+        clues = [len(group) for group in springs.split('.') if group]
+
+        masked = ''.join('?' if rng.random() < 0.5 else ch for ch in springs)
+        lines.append(f"{masked} {','.join(map(str, clues))}")
+
+    return lines
+
+
+def generate_day13(rng: Random, scale: float) -> list[str]:
+    lines: list[str] = []
+    for n in range(scaled(100, scale)):
+        width, height = rng.randint(5, 17), rng.randint(5, 17)
+
+        # Mirror a random block both ways, so there is a vertical reflection at
+        # column, and a horizontal one at row which is then smudged outside the
+        # columns the vertical reflection covers
+        column = rng.randint(1, (width - 1) // 2)
+        row = rng.randint(1, height // 2)
+        cells = [[rng.random() < 0.5 for _ in range(width)] for _ in range(height)]
+        for y in range(height):
+            for x in range(column):
+                cells[y][2 * column - 1 - x] = cells[y][x]
+        for y in range(row):
+            cells[2 * row - 1 - y] = cells[y].copy()
+
+        smudge_y = rng.randrange(row)
+        smudge_x = rng.randrange(2 * column, width)
+        cells[smudge_y][smudge_x] = not cells[smudge_y][smudge_x]
+
+        if n:
+            lines.append('')
+        lines += [''.join('#' if cell else '.' for cell in line) for line in cells]
+
+    return lines
+
+
+def generate_day14(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(100, scale)
+    return random_grid(rng, side, side, 'O#.', [0.2, 0.1, 0.7])
+
+
+def generate_day15(rng: Random, scale: float) -> list[str]:
+    labels = unique_names(rng, scaled(500, scale))
+    steps = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+
+    return [','.join(steps)]
+
+
+def generate_day16(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(110, scale)
+    return random_grid(rng, side, side, '.\\/|-', [0.9, 0.025, 0.025, 0.025, 0.025])
+
+
+def generate_day17(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(141, scale)
+    return random_grid(rng, side, side, '123456789', [1] * 9)
+
+
+def generate_day18(rng: Random, scale: float) -> list[str]:
+    columns = scaled(300, scale)
+
+    def skyline(max_step: int) -> list[tuple[str, int]]:
+        # Rectilinear polygon made of columns of random heights over a baseline
+        heights = [rng.randint(1, max_step)]
+        while len(heights) < columns:
+            height = rng.randint(1, max_step)
+            if height != heights[-1]:
+                heights.append(height)
+
+        moves = [('U', heights[0])]
+        for height, next_height in zip(heights, heights[1:] + [0]):
+            moves.append(('R', rng.randint(1, max_step)))
+            moves.append(('D', height - next_height) if height > next_height else ('U', next_height - height))
+        moves.append(('L', sum(length for direction, length in moves if direction == 'R')))
+
+        return moves
+
+    color_codes = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+    return [
+        f"{direction} {length} (#{color_length:05x}{color_codes[color_direction]})"
+        for (direction, length), (color_direction, color_length)
+        in zip(skyline(10), skyline(0xfffff // columns))
+    ]
+
+
+def generate_day19(rng: Random, scale: float) -> list[str]:
+    n_workflows = scaled(550, scale)
+    names = iter(unique_names(rng, n_workflows, {'in'}))
+    lines = []
+
+    # Workflows form a tree rooted at 'in', so every part ends up in A or R, and
+    # each rule splits the ranges that reach it, like in the real inputs
+    pending = [('in', {category: (1, 4000) for category in 'xmas'})]
+    created = 1
+    while pending:
+        name, ranges = pending.pop()
+        body = []
+        n_rules = rng.randint(1, 3)
+        for i in range(n_rules + 1):
+            splittable = [category for category, (low, high) in ranges.items() if high - low >= 2]
+            last = i == n_rules or not splittable
+
+            if last:
+                matched = ranges
+            else:
+                category = rng.choice(splittable)
+                low, high = ranges[category]
+                operator = rng.choice('<>')
+                if operator == '<':
+                    argument = rng.randint(low + 1, high)
+                    matched = ranges | {category: (low, argument - 1)}
+                    ranges = ranges | {category: (argument, high)}
+                else:
+                    argument = rng.randint(low, high - 1)
+                    matched = ranges | {category: (argument + 1, high)}
+                    ranges = ranges | {category: (low, argument)}
+
+            # The last open workflow always branches, so the tree reaches its size
+            if created < n_workflows and (rng.random() < 0.6 or not pending and i == 0):
+                target = next(names)
+                pending.append((target, matched))
+                created += 1
+            else:
+                target = rng.choice('AR')
+
+            if last:
+                body.append(target)
+                break
+            body.append(f"{category}{operator}{argument}:{target}")
+
+        lines.append(f"{name}{{{','.join(body)}}}")
+
+    rng.shuffle(lines)
+    lines.append('')
+    for _ in range(scaled(200, scale)):
+        x, m, a, s = (rng.randint(1, 4000) for _ in range(4))
+        lines.append(f"{{x={x},m={m},a={a},s={s}}}")
+
+    return lines
+
+
+def generate_day20(rng: Random, scale: float) -> list[str]:
+    n_counters = max(1, round(4 * scale))
+    names = iter(unique_names(rng, n_counters * 14 + 1, {'rx'}))
+    collector = next(names)
+
+    # Each counter is a chain of 12 flip-flops acting as a binary counter that
+    # its conjunction resets whenever it reaches a random 12-bit target
+    lines = [f"&{collector} -> rx"]
+    starts = []
+    for _ in range(n_counters):
+        flip_flops = [next(names) for _ in range(12)]
+        hub, inverter = next(names), next(names)
+        target = rng.randrange(2 ** 11, 2 ** 12) | 1
+        starts.append(flip_flops[0])
+
+        hub_outputs = [flip_flops[0], inverter]
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[bit + 1:bit + 2]
+            if target >> bit & 1:
+                outputs.append(hub)
+            elif bit:
+                hub_outputs.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(outputs)}")
+
+        lines.append(f"&{hub} -> {', '.join(hub_outputs)}")
+        lines.append(f"&{inverter} -> {collector}")
+
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(lines)
+    return lines
+
+
+def generate_day21(rng: Random, scale: float) -> list[str]:
+    side = scaled_side(131, scale) | 1
+    middle = side // 2
+    rows = [list(row) for row in random_grid(rng, side, side, '.#', [0.85, 0.15])]
+
+    # Keep the border, the middle row and column clear, like the real inputs
+    for i in range(side):
+        for x, y in ((i, 0), (i, side - 1), (0, i), (side - 1, i), (i, middle), (middle, i)):
+            rows[y][x] = '.'
+    rows[middle][middle] = 'S'
+
+    return [''.join(row) for row in rows]
+
+
+def generate_day22(rng: Random, scale: float) -> list[str]:
+    n_bricks = scaled(1400, scale)
+    max_z = max(10, n_bricks // 4)
+    occupied: set[tuple[int, int, int]] = set()
+    lines = []
+
+    while len(lines) < n_bricks:
+        start = [rng.randrange(10), rng.randrange(10), rng.randint(1, max_z)]
+        end = start.copy()
+        axis = rng.randrange(3)
+        end[axis] += rng.randint(0, 4)
+        if end[0] > 9 or end[1] > 9:
+            continue
+
+        cells = set(product(*(range(a, b + 1) for a, b in zip(start, end))))
+        if cells & occupied:
+            continue
+
+        occupied |= cells
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+
+    return lines
+
+
+def generate_day23(rng: Random, scale: float) -> list[str]:
+    junctions = max(2, round(6 * math.sqrt(scale)))
+
+    def positions() -> list[int]:
+        result = [rng.randint(4, 20)]
+        for _ in range(junctions - 1):
+            result.append(result[-1] + rng.randint(8, 30))
+        return result
+
+    columns, rows = positions(), positions()
+    width, height = columns[-1] + 5, rows[-1] + 5
+    grid = [['#'] * width for _ in range(height)]
+
+    # A lattice of junctions joined by corridors whose slopes point east and south
+    for y in rows:
+        for x in range(columns[0], columns[-1] + 1):
+            grid[y][x] = '.'
+        for x in columns[:-1]:
+            grid[y][x + 1] = '>'
+        for x in columns[1:]:
+            grid[y][x - 1] = '>'
+    for x in columns:
+        for y in range(rows[0], rows[-1] + 1):
+            grid[y][x] = '.'
+        for y in rows[:-1]:
+            grid[y + 1][x] = 'v'
+        for y in rows[1:]:
+            grid[y - 1][x] = 'v'
+
+    for y in range(rows[0]):
+        grid[y][columns[0]] = '.'
+    for y in range(rows[-1], height):
+        grid[y][columns[-1]] = '.'
+
+    return [''.join(row) for row in grid]
+
+
+def generate_day24(rng: Random, scale: float) -> list[str]:
+    rock_position = [rng.randrange(100_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10_000_000_000, 1_000_000_000_000), scaled(300, scale))
+
+    lines = []
+    for time in times:
+        velocity = [rng.randint(-500, 500) for _ in range(3)]
+        position = [p + time * (v - hv) for p, v, hv in zip(rock_position, rock_velocity, velocity)]
+        lines.append(f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}")
+
+    return lines
+
+
+def generate_day25(rng: Random, scale: float) -> list[str]:
+    names = unique_names(rng, scaled(1500, scale) // 2 * 2)
+    half = len(names) // 2
+    edges: set[frozenset[str]] = set()
+    degrees = dict.fromkeys(names, 0)
+
+    def connect(a: str, b: str) -> None:
+        edge = frozenset({a, b})
+        if a != b and edge not in edges:
+            edges.add(edge)
+            degrees[a] += 1
+            degrees[b] += 1
+
+    # Two well connected halves joined by exactly three edges
+    for cluster in (names[:half], names[half:]):
+        for i, vertex in enumerate(cluster):
+            connect(vertex, cluster[i - 1])
+            while degrees[vertex] < 4:
+                connect(vertex, rng.choice(cluster))
+
+    for a, b in zip(rng.sample(names[:half], 3), rng.sample(names[half:], 3)):
+        edges.add(frozenset({a, b}))
+
+    adjacency: dict[str, list[str]] = {}
+    for edge in edges:
+        a, b = sorted(edge)
+        adjacency.setdefault(a, []).append(b)
+
+    return [f"{vertex}: {' '.join(targets)}" for vertex, targets in adjacency.items()]
+
+
+GENERATORS: dict[int, Generator] = {
+    day: generator
+    for day, generator in zip(count(1), [
+        generate_day01, generate_day02, generate_day03, generate_day04, generate_day05,
+        generate_day06, generate_day07, generate_day08, generate_day09, generate_day10,
+        generate_day11, generate_day12, generate_day13, generate_day14, generate_day15,
+        generate_day16, generate_day17, generate_day18, generate_day19, generate_day20,
+        generate_day21, generate_day22, generate_day23, generate_day24, generate_day25,
+    ])
+}
+
+
+def generate(day: int, scale: float, seed: int = 2023) -> list[str]:
+    return GENERATORS[day](Random(f"{seed}-{day}-{scale:g}"), scale)
@@ -0,0 +1,129 @@
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import queue
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from aoc.runner import PART_ARGS, measure
+from benchmarks.generators import GENERATORS, generate
+
+SIZES = (1, 10, 100)
+
+
+def bench_worker(day: int, scale: float, seed: int, trace_memory: bool, results: multiprocessing.Queue) -> None:
+    data = generate(day, scale, seed)
+    results.put(('input', {'lines': len(data), 'bytes': sum(len(line) + 1 for line in data)}))
+
+    module = importlib.import_module(f"aoc.day{day:02}")
+    for part, args in enumerate(PART_ARGS.get(day, ((), ())), 1):
+        solver = getattr(module, f"solve_part{part}")
+        _, stats = measure(solver, data, *args, trace_memory=trace_memory)
+        results.put(('part', str(part), stats))
+
+    results.put(('done', None))
+
+
+def bench_size(day: int, scale: float, seed: int, timeout: float, trace_memory: bool = True) -> dict[str, Any]:
+    # Each size runs in its own process, so a runaway solver can be killed
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=bench_worker, args=(day, scale, seed, trace_memory, results))
+    worker.start()
+
+    report: dict[str, Any] = {'scale': scale, 'parts': {}}
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            kind, *payload = results.get(timeout=0.1)
+        except queue.Empty:
+            if time.monotonic() > deadline:
+                report['timeout'] = True
+                worker.kill()
+                break
+            if not worker.is_alive() and results.empty():
+                report['error'] = f"worker exited with code {worker.exitcode}"
+                break
+            continue
+
+        match kind:
+            case 'input':
+                report['input'] = payload[0]
+            case 'part':
+                part, stats = payload
+                report['parts'][part] = stats
+            case 'done':
+                break
+
+    worker.join()
+    return report
+
+
+def growth(previous: dict[str, Any], current: dict[str, Any], part: str) -> float | None:
+    # Empirical exponent k of time ~ size^k between two consecutive sizes
+    try:
+        before, after = previous['parts'][part]['wall'], current['parts'][part]['wall']
+    except KeyError:
+        return None
+
+    if before <= 0 or after <= 0:
+        return None
+
+    return math.log(after / before) / math.log(current['scale'] / previous['scale'])
+
+
+def bench_day(day: int, sizes: Sequence[float], seed: int, timeout: float, trace_memory: bool = True) -> dict[str, Any]:
+    reports: list[dict[str, Any]] = []
+
+    for scale in sizes:
+        if reports and (reports[-1].get('timeout') or reports[-1].get('error')):
+            # A bigger input will not do any better
+            reports.append({'scale': scale, 'parts': {}, 'skipped': True})
+            continue
+
+        report = bench_size(day, scale, seed, timeout, trace_memory)
+
+        if reports:
+            for part, stats in report['parts'].items():
+                stats['growth'] = growth(reports[-1], report, part)
+
+        reports.append(report)
+
+    return {'day': day, 'sizes': reports}
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='benchmarks', description="Benchmark the solutions on scaled synthetic inputs")
+    parser.add_argument('days', nargs='*', type=int, help="days to benchmark, all of them by default")
+    parser.add_argument('-s', '--sizes', nargs='+', type=float, default=SIZES, help="input sizes relative to the real puzzle inputs")
+    parser.add_argument('--seed', type=int, default=2023, help="seed for the input generators")
+    parser.add_argument('-t', '--timeout', type=float, default=60, help="seconds allowed for each day and size")
+    parser.add_argument('-o', '--output', type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument('--no-memory', dest='trace_memory', action='store_false', help="skip peak memory tracing")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    days = args.days or sorted(GENERATORS)
+
+    report = {
+        'seed': args.seed,
+        'days': [bench_day(day, args.sizes, args.seed, args.timeout, args.trace_memory) for day in days],
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+import aoc.batch as batch
+
+_INPUTS = {
+    'a.txt': "1abc2\npqr3stu8vwx",
+    'b.txt': "two1nine\neightwo3three",
+    'c.txt': "broken",
+}
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+        for name, content in _INPUTS.items():
+            (self.directory / name).write_text(content)
+
+    def test_find_inputs(self):
+        self.assertEqual([path.name for path in batch.find_inputs(self.directory)], ['a.txt', 'b.txt', 'c.txt'])
+
+        manifest = self.directory / 'manifest'
+        manifest.write_text("# inputs\nb.txt\n\na.txt\n")
+        self.assertEqual(batch.find_inputs(manifest), [self.directory / 'b.txt', self.directory / 'a.txt'])
+
+    def test_batch(self):
+        inputs = batch.find_inputs(self.directory) + [self.directory / 'missing.txt']
+        results = {Path(result['input']).name: result for result in batch.batch(1, inputs, jobs=2)}
+
+        self.assertEqual(results['a.txt']['answers'], {'1': 50, '2': 50})
+        self.assertEqual(results['b.txt']['answers'], {'1': 44, '2': 112})
+        self.assertIn('error', results['c.txt'])
+        self.assertIn('error', results['missing.txt'])
+
+    def test_missing_day(self):
+        inputs = batch.find_inputs(self.directory)
+        results = list(batch.batch(26, inputs, jobs=1))
+
+        self.assertEqual(sorted(Path(result['input']).name for result in results), ['a.txt', 'b.txt', 'c.txt'])
+        self.assertTrue(all('ModuleNotFoundError' in result['error'] for result in results))
+
+    def test_part(self):
+        result = batch.solve_input(1, self.directory / 'b.txt', part=2)
+
+        self.assertEqual(result['answers'], {'2': 112})
+        self.assertGreaterEqual(result['wall'], 0)
+
+    def test_main(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            batch.main(['1', str(self.directory), '-j', '1'])
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(lines), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from aoc.runner import PART_ARGS
+from benchmarks import harness
+from benchmarks.generators import GENERATORS, generate
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generators_are_seeded(self):
+        for day in GENERATORS:
+            with self.subTest(day=day):
+                self.assertEqual(generate(day, 0.05, seed=1), generate(day, 0.05, seed=1))
+                self.assertNotEqual(generate(day, 0.05, seed=1), generate(day, 0.05, seed=2))
+
+    def test_generators_scale(self):
+        for day in (1, 7, 12, 22):
+            with self.subTest(day=day):
+                self.assertEqual(len(generate(day, 1)), 10 * len(generate(day, 0.1)))
+
+    def test_generated_inputs_are_solvable(self):
+        for day in GENERATORS:
+            with self.subTest(day=day):
+                module = importlib.import_module(f"aoc.day{day:02}")
+                args = PART_ARGS.get(day, ((), ()))[0]
+
+                with redirect_stdout(io.StringIO()):
+                    self.assertIsInstance(module.solve_part1(generate(day, 0.05), *args), int)
+
+    def test_solve_matches_parts(self):
+        # Day 21's part 2 walks the full sized garden three times, whatever the scale
+        for day in GENERATORS.keys() - {21}:
+            with self.subTest(day=day):
+                module = importlib.import_module(f"aoc.day{day:02}")
+                data = generate(day, 0.05)
+                part_args = PART_ARGS.get(day, ((), ()))
+
+                with redirect_stdout(io.StringIO()):
+                    answers = tuple(
+                        getattr(module, f"solve_part{part}")(data, *args)
+                        for part, args in enumerate(part_args, 1)
+                    )
+                    self.assertEqual(module.solve(data), answers)
+
+    def test_bench_day(self):
+        report = harness.bench_day(1, [0.1, 1], seed=1, timeout=60)
+
+        small, large = report['sizes']
+        self.assertEqual(large['input']['lines'], 10 * small['input']['lines'])
+        self.assertEqual(set(large['parts']), {'1', '2'})
+        self.assertIn('growth', large['parts']['1'])
+        self.assertIn('peak_memory', large['parts']['1'])
+
+    def test_bench_timeout(self):
+        report = harness.bench_day(21, [1, 10], seed=1, timeout=0.5, trace_memory=False)
+
+        self.assertTrue(report['sizes'][0]['timeout'])
+        self.assertTrue(report['sizes'][1]['skipped'])
+
+if __name__ == '__main__':
+    unittest.main()
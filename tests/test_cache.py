@@ -0,0 +1,101 @@
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.cache import DiskCache, cached, caching, input_digest
+
+_calls: list[int] = []
+
+@cached(encode=lambda value: value * 2, decode=lambda stored: stored // 2)
+def _parse(data: list[str], offset: int) -> int:
+    _calls.append(offset)
+    return len(data) + offset
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("unpicklable")
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+    def test_get_set(self):
+        cache = DiskCache(self.directory)
+
+        self.assertIsNone(cache.get('key'))
+        cache.set('key', [1, 2, 3])
+        self.assertEqual(cache.get('key'), [1, 2, 3])
+        self.assertIsNone(cache.get('other'))
+
+    def test_eviction(self):
+        cache = DiskCache(self.directory, max_bytes=3500)
+
+        for i, key in enumerate(('a', 'b', 'c')):
+            cache.set(key, bytes(1000))
+            os.utime(cache.path(key), (i, i))
+
+        # Reading refreshes an entry, so 'b' is now the oldest
+        cache.get('a')
+        cache.set('d', bytes(1000))
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertIsNotNone(cache.get('d'))
+
+    def test_damaged_entry(self):
+        cache = DiskCache(self.directory)
+        with open(cache.path('key'), 'wb') as entry_file:
+            entry_file.write(b'garbage')
+
+        self.assertIsNone(cache.get('key'))
+        self.assertFalse(os.path.exists(cache.path('key')))
+
+    def test_failed_set(self):
+        cache = DiskCache(self.directory)
+
+        with self.assertRaises(pickle.PicklingError):
+            cache.set('key', _Unpicklable())
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_cached(self):
+        _calls.clear()
+        data = ['ab', 'cd']
+
+        self.assertEqual(_parse(data, 1), 3)
+        with caching(self.directory):
+            self.assertEqual(_parse(data, 1), 3)
+            self.assertEqual(_parse(data, 1), 3)
+            self.assertEqual(_parse(data, 2), 4)
+            self.assertEqual(_parse(['ab'], 1), 2)
+
+        self.assertEqual(_calls, [1, 1, 2, 1])
+
+    def test_versions(self):
+        _calls.clear()
+        data = ['ab', 'cd']
+        old = cached(encode=lambda value: (value, 'old'), decode=lambda stored: stored[0])(_parse.__wrapped__)
+
+        with caching(self.directory):
+            old(data, 1)
+            # A new version doesn't read the old entry
+            new = cached(encode=lambda value: value, decode=lambda stored: stored + 0, version=2)(_parse.__wrapped__)
+            self.assertEqual(new(data, 1), 3)
+            self.assertEqual(_calls, [1, 1])
+
+            # Without one, an entry it cannot decode is rebuilt
+            stale = cached(encode=lambda value: value, decode=lambda stored: stored + 0)(_parse.__wrapped__)
+            self.assertEqual(stale(data, 1), 3)
+            self.assertEqual(stale(data, 1), 3)
+            self.assertEqual(_calls, [1, 1, 1])
+
+    def test_input_digest(self):
+        self.assertEqual(input_digest(['ab', 'cd']), input_digest(iter(['ab', 'cd'])))
+        self.assertNotEqual(input_digest(['ab', 'cd']), input_digest(['abc', 'd']))
+
+if __name__ == '__main__':
+    unittest.main()
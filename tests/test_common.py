@@ -0,0 +1,152 @@
+import os
+import tempfile
+import time
+import unittest
+
+from aoc.common import Grid, MappedInput, profile_section, profiled, profiling, stream_lines
+
+_INPUT = """#..
+.#.
+..O
+.#.""".splitlines()
+
+class TestGrid(unittest.TestCase):
+    def test_from_lines(self):
+        grid = Grid.from_lines(_INPUT, typecode='B')
+
+        self.assertEqual((grid.width, grid.height), (3, 4))
+        self.assertEqual(grid.get(2, 2), ord('O'))
+        self.assertEqual(grid[grid.index(1, 3)], ord('#'))
+        self.assertEqual(grid.position(7), (1, 2))
+
+    def test_bounds(self):
+        grid = Grid(3, 4, 0)
+
+        for x, y in ((3, 0), (0, 4), (-1, 0), (0, -1)):
+            with self.assertRaises(IndexError):
+                grid.get(x, y)
+            with self.assertRaises(IndexError):
+                grid.set(x, y, 1)
+
+    def test_views(self):
+        grid = Grid.from_lines(_INPUT, typecode='B')
+
+        self.assertEqual(bytes(grid.row(1)), b'.#.')
+        self.assertEqual(bytes(grid.column(1)), b'.#.#')
+
+        grid.column(1)[0] = ord('O')
+        self.assertEqual(bytes(grid.row(0)), b'#O.')
+
+    def test_object_cells(self):
+        grid = Grid.from_lines(_INPUT, convert=lambda ch: ch == '#')
+
+        self.assertEqual(list(grid.rows)[1], [False, True, False])
+        self.assertEqual(grid.column(0), [True, False, False, False])
+
+    def test_neighbors(self):
+        grid = Grid(3, 4)
+
+        self.assertEqual(list(grid.neighbors(grid.index(0, 0))), [1, 3])
+        self.assertEqual(list(grid.neighbors(grid.index(1, 1))), [5, 7, 3, 1])
+        self.assertEqual(list(grid.neighbors(grid.index(2, 3))), [10, 8])
+        self.assertEqual([4 + offset for offset in grid.offsets], [5, 7, 3, 1])
+
+    def test_equality(self):
+        grid = Grid.from_lines(_INPUT, typecode='B')
+        other = grid.copy()
+
+        self.assertEqual(grid, other)
+        self.assertEqual(hash(grid), hash(other))
+
+        other.set(0, 0, ord('.'))
+        self.assertNotEqual(grid, other)
+
+class TestMappedInput(unittest.TestCase):
+    def mapped(self, content: bytes) -> MappedInput:
+        with tempfile.NamedTemporaryFile(delete=False) as input_file:
+            input_file.write(content)
+        self.addCleanup(os.remove, input_file.name)
+
+        mapped = MappedInput(input_file.name)
+        self.addCleanup(mapped.close)
+        return mapped
+
+    def test_lines(self):
+        mapped = self.mapped(b"ab\r\ncd\n\nef")
+
+        self.assertEqual(list(mapped), ['ab', 'cd', '', 'ef'])
+        self.assertEqual(mapped[1:], ['cd', '', 'ef'])
+        self.assertEqual(mapped[-1], 'ef')
+        self.assertEqual(mapped.index(''), 2)
+        self.assertEqual(bytes(mapped.line(0)), b'ab')
+
+    def test_trailing_newline(self):
+        self.assertEqual(list(self.mapped(b"ab\ncd\n")), ['ab', 'cd'])
+
+    def test_empty(self):
+        self.assertEqual(len(self.mapped(b"")), 0)
+
+    def test_grid(self):
+        mapped = self.mapped('\n'.join(_INPUT).encode())
+
+        self.assertEqual(Grid.from_lines(mapped, typecode='B'), Grid.from_lines(_INPUT, typecode='B'))
+        self.assertEqual(Grid.from_lines(mapped, str.upper), Grid.from_lines(_INPUT, str.upper))
+
+class TestStreamLines(unittest.TestCase):
+    def test_lines(self):
+        with tempfile.NamedTemporaryFile(delete=False) as input_file:
+            input_file.write(b"ab\r\ncd\n\nef")
+        self.addCleanup(os.remove, input_file.name)
+
+        lines = stream_lines(input_file.name)
+        self.assertEqual(next(lines), 'ab')
+        self.assertEqual(list(lines), ['cd', '', 'ef'])
+
+    def test_crlf(self):
+        content = b"ab\r\n\r\nc\rd\r\nef\r\n"
+        with tempfile.NamedTemporaryFile(delete=False) as input_file:
+            input_file.write(content)
+        self.addCleanup(os.remove, input_file.name)
+
+        with MappedInput(input_file.name) as mapped:
+            self.assertEqual(list(stream_lines(input_file.name)), list(mapped))
+        self.assertEqual(list(stream_lines(input_file.name)), ['ab', '', 'c\rd', 'ef'])
+
+@profiled
+def _inner() -> int:
+    return 1
+
+@profiled
+def _outer() -> int:
+    with profile_section('loop'):
+        return _inner() + _inner()
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled(self):
+        self.assertEqual(_outer(), 2)
+        self.assertEqual(_outer.__name__, '_outer')
+
+    def test_stacks(self):
+        with profiling() as profiler:
+            with profiler.section('root'):
+                self.assertEqual(_outer(), 2)
+            _inner()
+
+        self.assertEqual(set(profiler.stacks), {'root', 'root;_outer', 'root;_outer;loop', 'root;_outer;loop;_inner', '_inner'})
+        self.assertTrue(all(seconds >= 0 for seconds in profiler.stacks.values()))
+
+        frames, value = profiler.collapsed()[0].rsplit(' ', 1)
+        self.assertEqual(frames.split(';')[0], 'root')
+        self.assertTrue(value.isdecimal())
+
+    def test_self_time(self):
+        with profiling() as profiler:
+            with profiler.section('outer'):
+                with profiler.section('inner'):
+                    time.sleep(0.05)
+
+        self.assertGreaterEqual(profiler.stacks['outer;inner'], 0.05)
+        self.assertLess(profiler.stacks['outer'], 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,5 +22,49 @@ class TestDay01(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day01.solve_part2(_PART_2_INPUT.splitlines()), 281)
 
+    def test_part_1_bytes(self):
+        data = _PART_1_INPUT.encode()
+
+        self.assertEqual(day01.solve_part1(data), 142)
+        self.assertEqual(day01.solve_part1(memoryview(data.replace(b'\n', b'\r\n') + b'\n')), 142)
+
+    def test_chunks(self):
+        # Cut in the middle of lines, and of the numbers in them
+        data = (_PART_1_INPUT + "\n1234567890\n0x0\n").encode()
+        expected = day01.solve_part1(data.decode().split())
+
+        for chunk_size in (1, 3, 7, len(data)):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(day01.sum_calibration_bytes(data, chunk_size), expected)
+
+    def test_no_digits(self):
+        for data in ("1abc2\nabc\n3", "abc", "1abc2\nabc", "1\n\n2\n", "1\r\n\r\n2"):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    day01.solve_part1(data.splitlines())
+                for chunk_size in (1, 2, len(data)):
+                    with self.assertRaises(ValueError):
+                        day01.sum_calibration_bytes(data.encode(), chunk_size)
+
+        self.assertEqual(day01.solve_part1(b''), 0)
+        self.assertEqual(day01.solve_part1([]), 0)
+
+    def test_first_and_last_numbers(self):
+        for line, expected in (('eightwo', (8, 2)), ('oneight', (1, 8)), ('zero1x', (0, 1)),
+                               ('seveninenine', (7, 9)), ('twone', (2, 1)), ('ttwo', (2, 2)),
+                               ('sevenine', (7, 9)), ('5', (5, 5)), ('ninininine', (9, 9))):
+            with self.subTest(line=line):
+                self.assertEqual(day01.first_and_last_numbers(line), expected)
+
+        with self.assertRaises(ValueError):
+            day01.first_and_last_numbers('abc')
+
+    def test_stream(self):
+        self.assertEqual(day01.solve_part1(iter(_PART_1_INPUT.splitlines())), 142)
+        self.assertEqual(day01.solve_part2(iter(_PART_2_INPUT.splitlines())), 281)
+
+    def test_solve(self):
+        self.assertEqual(day01.solve(_PART_1_INPUT.splitlines()), (142, 142))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
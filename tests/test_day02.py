@@ -15,5 +15,28 @@ class TestDay02(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day02.solve_part2(_INPUT.splitlines()), 2286)
 
+    def test_limits(self):
+        store = day02.GameStore.from_lines(_INPUT.splitlines())
+
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.possible_id_sum({'red': 20, 'green': 13, 'blue': 15}), 15)
+        self.assertEqual(store.possible_id_sums([{'red': 4, 'green': 3, 'blue': 6}, {}, day02.LIMITS]), [3, 0, 8])
+        # No game can be played without any blue cube
+        self.assertEqual(store.possible_id_sum({'red': 100, 'green': 100}), 0)
+
+    def test_missing_colors(self):
+        store = day02.GameStore.from_lines(["Game 7: 2 red; 3 green", "Game 9: 1 blue, 1 blue"])
+
+        self.assertEqual(store.possible_id_sum(), 16)
+        self.assertEqual(store.possible_id_sum({'red': 2, 'green': 3}), 7)
+        self.assertEqual(store.power_sum(), 6 + 2)
+
+    def test_stream(self):
+        self.assertEqual(day02.solve_part1(iter(_INPUT.splitlines())), 8)
+        self.assertEqual(day02.solve_part2(iter(_INPUT.splitlines())), 2286)
+
+    def test_solve(self):
+        self.assertEqual(day02.solve(_INPUT.splitlines()), (8, 2286))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
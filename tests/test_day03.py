@@ -21,5 +21,20 @@ class TestDay03(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day03.solve_part2(_INPUT.splitlines()), 467835)
 
+    def test_stream(self):
+        self.assertEqual(day03.solve_part1(iter(_INPUT.splitlines())), 4361)
+        self.assertEqual(day03.solve_part2(iter(_INPUT.splitlines())), 467835)
+
+    def test_edges(self):
+        # Numbers touching symbols across the first and last rows and columns,
+        # and a gear with three numbers around it, which does not count
+        lines = ["12*3", "4..#", "5*67", "8.9."]
+
+        self.assertEqual(day03.solve(lines), (12 + 3 + 4 + 5 + 67 + 8 + 9, 12 * 3))
+        self.assertEqual(day03.solve(["7*7"]), (14, 49))
+
+    def test_solve(self):
+        self.assertEqual(day03.solve(_INPUT.splitlines()), (4361, 467835))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
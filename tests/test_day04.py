@@ -16,5 +16,25 @@ class TestDay04(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day04.solve_part2(_INPUT.splitlines()), 30)
 
+    def test_matches(self):
+        card = next(day04.extract_card_info(["Card 9: 41 48 83 | 83 86  6 41 17 41"]))
+
+        self.assertEqual((card.card_id, card.matches), (9, 2))
+
+    def test_long_reach(self):
+        # Card 1 wins a copy of every other card, and card 2 of the cards past the end
+        winners = " ".join(str(n) for n in range(1, 51))
+        lines = [f"Card 1: {winners} | {winners}", f"Card 2: {winners} | {winners}"]
+        lines += [f"Card {n}: 1 | 2" for n in range(3, 6)]
+
+        self.assertEqual(day04.solve_part2(lines), 1 + 2 + 4 * 3)
+
+    def test_stream(self):
+        self.assertEqual(day04.solve_part1(iter(_INPUT.splitlines())), 13)
+        self.assertEqual(day04.solve_part2(iter(_INPUT.splitlines())), 30)
+
+    def test_solve(self):
+        self.assertEqual(day04.solve(_INPUT.splitlines()), (13, 30))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
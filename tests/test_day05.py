@@ -44,5 +44,43 @@ class TestDay05(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day05.solve_part2(_INPUT.splitlines()), 46)
 
+    def test_piecewise(self):
+        _, maps = day05.extract_info(_INPUT.splitlines())
+        seed_to_soil = maps[0].piecewise
+
+        self.assertEqual(seed_to_soil.starts, [0, 50, 98, 100])
+        self.assertEqual([seed_to_soil(seed) for seed in (0, 49, 50, 97, 98, 99, 100)], [0, 49, 52, 99, 50, 51, 100])
+
+        with self.assertRaises(ValueError):
+            day05.Piecewise.from_transforms([day05.Transform(0, 10, 5), day05.Transform(20, 12, 5)])
+
+    def test_compose(self):
+        _, maps = day05.extract_info(_INPUT.splitlines())
+        location = day05.compose_maps(maps)
+
+        for seed in range(200):
+            expected = seed
+            for mapping in maps:
+                expected = mapping.apply_transforms(expected)
+
+            self.assertEqual(location(seed), expected)
+
+    def test_range_propagation(self):
+        _, maps = day05.extract_info(_INPUT.splitlines())
+        location = day05.compose_maps(maps)
+
+        # Ranges from 0 and straddling many transforms, checked seed by seed
+        for seeds in ([0, 5], [0, 100], [40, 70, 95, 10], [10, 20, 15, 30, 99, 1]):
+            with self.subTest(seeds=seeds):
+                expected = min(location(seed) for start, length in zip(seeds[::2], seeds[1::2])
+                               for seed in range(start, start + length))
+                self.assertEqual(day05.lowest_range_location(seeds, maps), expected)
+
+    def test_merge_ranges(self):
+        self.assertEqual(day05.merge_ranges([(5, 8), (0, 2), (2, 3), (6, 7), (9, 9)]), [(0, 3), (5, 8)])
+
+    def test_solve(self):
+        self.assertEqual(day05.solve(_INPUT.splitlines()), (35, 46))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,5 +13,22 @@ class TestDay06(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day06.solve_part2(_INPUT.splitlines()), 71503)
 
+    def test_count_ways(self):
+        # 5 * 5 = 25 only ties the record, and 30 * 30 - 4 * 200 is a perfect square
+        cases = [(7, 9, 4), (30, 200, 9), (10, 25, 0), (10, 24, 1), (10, 0, 9), (0, 0, 0), (3, -1, 4), (30, 224, 1), (30, 225, 0)]
+        for time, distance, expected in cases:
+            with self.subTest(time=time, distance=distance):
+                self.assertEqual(day06.count_ways(time, distance), expected)
+
+    def test_count_ways_batch(self):
+        times = list(range(60))
+        distances = [time * time // 5 for time in times]
+        expected = [sum(t * (time - t) > distance for t in range(time + 1)) for time, distance in zip(times, distances)]
+
+        self.assertEqual(day06.count_ways_batch(times, distances), expected)
+
+    def test_solve(self):
+        self.assertEqual(day06.solve(_INPUT.splitlines()), (288, 71503))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
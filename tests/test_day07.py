@@ -1,3 +1,4 @@
+import itertools
 import unittest
 
 import aoc.day07 as day07
@@ -43,5 +44,40 @@ class TestDay07(unittest.TestCase):
     def test_part_2_alt(self):
         self.assertEqual(day07.solve_part2(_ALT_INPUT.splitlines()), 6839)
 
+    def test_hand_key(self):
+        ordered = ['23456', '2345A', '22345', '22334', '2AAA3', 'KKK22', 'AAAA2', '22222']
+        keys = [day07.hand_key(cards) for cards in ordered]
+        self.assertEqual(keys, sorted(keys))
+
+        # A joker is the weakest card, but makes the best type it can
+        self.assertLess(day07.hand_key('JKKK2', jokers=True), day07.hand_key('QQQQ2', jokers=True))
+        self.assertGreater(day07.hand_key('JKKK2', jokers=True), day07.hand_key('AAA22', jokers=True))
+        self.assertEqual(day07.Hand(list('T55J5'), True).key, day07.hand_key('T55J5', jokers=True))
+
+    def test_type_table(self):
+        # Every hand over a few labels, jokers included, against the group counting classifier
+        for jokers in (False, True):
+            table = day07.type_table(jokers)
+            self.assertEqual(len(table), day07.HAND_CODES)
+
+            for cards in map(''.join, itertools.product('J2TKA', repeat=5)):
+                self.assertEqual(table[day07.hand_code(cards, jokers)], day07.classify(cards, jokers), (cards, jokers))
+
+    def test_hand_code(self):
+        self.assertEqual(day07.hand_code('22222'), 0)
+        self.assertEqual(day07.hand_code('AAAAA'), day07.HAND_CODES - 1)
+        self.assertEqual(day07.hand_code('JJJJJ', jokers=True), 0)
+
+        for cards in ('2345', '23456A', '2345X'):
+            with self.assertRaises(ValueError):
+                day07.hand_code(cards)
+
+    def test_stream(self):
+        self.assertEqual(day07.solve_part1(iter(_INPUT.splitlines())), 6440)
+        self.assertEqual(day07.solve_part2(iter(_INPUT.splitlines())), 5905)
+
+    def test_solve(self):
+        self.assertEqual(day07.solve(_INPUT.splitlines()), (6440, 5905))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
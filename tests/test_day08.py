@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import aoc.day08 as day08
 
@@ -20,6 +21,20 @@ BBB = (AAA, ZZZ)
 ZZZ = (ZZZ, ZZZ)
 """
 
+# Ghost 1 hits a Z at steps 2, 5, 8..., ghost 2 at every odd step, so the
+# first hits' lcm of 2 is wrong
+_INPUT_OFFSETS = """L
+
+11A = (11P, 11P)
+11P = (11Z, 11Z)
+11Z = (11Q, 11Q)
+11Q = (11R, 11R)
+11R = (11Z, 11Z)
+22A = (22Z, 22Z)
+22Z = (22S, 22S)
+22S = (22Z, 22Z)
+"""
+
 _INPUT_C = """LR
 
 11A = (11B, XXX)
@@ -39,8 +54,68 @@ class TestDay08(unittest.TestCase):
     def test_part_1b(self):
         self.assertEqual(day08.solve_part1(_INPUT_B.splitlines()), 6)
 
+    def test_cycle(self):
+        network = day08.Network(*day08.extract_info(_INPUT_B.splitlines()))
+        aaa, bbb, zzz = (network.ids[name] for name in ('AAA', 'BBB', 'ZZZ'))
+        cycle = network.cycle([zzz])
+
+        # LLR from AAA goes BBB, AAA, BBB; from BBB it goes AAA, BBB, ZZZ
+        self.assertEqual(cycle.next_pass(aaa), bbb)
+        self.assertEqual(cycle.next_pass(bbb), zzz)
+        self.assertEqual(cycle.hits, {bbb: [3]})
+        self.assertEqual(cycle.first_hit(aaa), 6)
+
+    def test_cycle_batch(self):
+        network = day08.Network(*day08.extract_info(_INPUT_C.splitlines()))
+        targets = network.matching('Z')
+        batch, single = network.cycle(targets), day08.Cycle(network, targets)
+
+        with mock.patch.object(day08, 'BATCH_SIZE', 2):
+            batch.compose(range(len(network)))
+        for node in range(len(network)):
+            single.compose([node])
+
+        self.assertEqual(batch.jump, single.jump)
+        self.assertEqual(batch.hits, single.hits)
+
+    def test_unreachable(self):
+        network = day08.Network(*day08.extract_info(_INPUT_C.splitlines()))
+
+        with self.assertRaises(ValueError):
+            network.cycle(network.matching('Z')).first_hit(network.ids['XXX'])
+        with self.assertRaises(ValueError):
+            day08.Network('LRX', {})
+
     def test_part_2(self):
         self.assertEqual(day08.solve_part2(_INPUT_C.splitlines()), 6)
 
+    def test_part_2_offsets(self):
+        self.assertEqual(day08.solve_part2(_INPUT_OFFSETS.splitlines()), 5)
+
+        # One ghost on a Z at odd steps only, the other at even steps only
+        lines = ["L", "", "11A = (11Z, 11Z)", "11Z = (11Q, 11Q)", "11Q = (11Z, 11Z)",
+                 "22A = (22S, 22S)", "22S = (22Z, 22Z)", "22Z = (22S, 22S)"]
+        with self.assertRaises(ValueError):
+            day08.solve_part2(lines)
+
+    def test_trace_ghosts(self):
+        network = day08.Network(*day08.extract_info(_INPUT_OFFSETS.splitlines()))
+        cycle = network.cycle(network.matching('Z'))
+        first, second = day08.trace_ghosts(cycle, network.matching('A'))
+
+        self.assertEqual((first.prefix, first.period), (2, 3))
+        self.assertEqual(first.hit_times(cycle, 0, len(first.passes)), [2, 5])
+        self.assertTrue(all(first.is_hit(cycle, time) for time in (2, 5, 8, 302)))
+        self.assertFalse(any(first.is_hit(cycle, time) for time in (1, 3, 4, 6, 300)))
+        self.assertEqual((second.prefix, second.period), (1, 2))
+
+    def test_combine_congruences(self):
+        self.assertEqual(day08.combine_congruences((2, 3), (1, 2)), (5, 6))
+        self.assertEqual(day08.combine_congruences((1, 4), (3, 6)), (9, 12))
+        self.assertIsNone(day08.combine_congruences((1, 4), (2, 6)))
+
+    def test_solve(self):
+        self.assertEqual(day08.solve(_INPUT_B.splitlines()), (6, 6))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
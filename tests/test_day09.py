@@ -13,5 +13,28 @@ class TestDay09(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day09.solve_part2(_INPUT.splitlines()), 2)
 
+    def test_weights(self):
+        self.assertEqual(day09.weights(3), ((1, -3, 3), (3, -3, 1)))
+        self.assertEqual(day09.next_value([10, 13, 16, 21, 30, 45]), 68)
+        self.assertEqual(day09.previous_value([10, 13, 16, 21, 30, 45]), 5)
+        # Not a polynomial of low degree, the pyramid goes all the way down
+        self.assertEqual(day09.next_value([1, -4, 2]), 19)
+        self.assertEqual(day09.previous_value([7]), 7)
+
+    def test_totals(self):
+        histories = [[0, 3, 6, 9], [1, 3, 6, 10, 15, 21], [2, 2], [10, 13, 16, 21, 30, 45], [5, 1, 0, 2]]
+        totals = day09.HistoryTotals().update(histories)
+
+        self.assertEqual(set(totals.columns), {2, 4, 6})
+        self.assertEqual(totals.next_total(), sum(map(day09.next_value, histories)))
+        self.assertEqual(totals.previous_total(), sum(map(day09.previous_value, histories)))
+
+    def test_stream(self):
+        self.assertEqual(day09.solve_part1(iter(_INPUT.splitlines())), 114)
+        self.assertEqual(day09.solve_part2(iter(_INPUT.splitlines())), 2)
+
+    def test_solve(self):
+        self.assertEqual(day09.solve(_INPUT.splitlines()), (114, 2))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
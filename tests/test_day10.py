@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 
 import aoc.day10 as day10
+from aoc.cache import caching
 
 _INPUT = """7-F7-
 .FJ|7
@@ -20,6 +22,15 @@ _INPUT_2 = """..........
 ..........
 """
 
+# Every neighbor of the start connects to it, only the east and south ones
+# lead back
+_INPUT_3 = """.|...
+-S-7.
+.|.|.
+.L-J.
+.....
+"""
+
 class TestDay10(unittest.TestCase):
     def test_part_1(self):
         self.assertEqual(day10.solve_part1(_INPUT.splitlines()), 8)
@@ -27,5 +38,44 @@ class TestDay10(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day10.solve_part2(_INPUT_2.splitlines()), 4)
 
+    def test_loop(self):
+        world, loop, in_loop = day10.trace_loop(_INPUT.splitlines())
+
+        # The start became the pipe joining its neighbors
+        self.assertEqual(chr(world[loop[0]]), 'F')
+        # One row of padding above the map
+        self.assertEqual(world.position(loop[0]), (0, 3))
+        self.assertEqual(len(loop), 16)
+        self.assertEqual([i for i, mark in enumerate(in_loop) if mark], sorted(loop))
+
+    def test_methods(self):
+        for method in day10.INTERIOR_METHODS:
+            with self.subTest(method=method):
+                self.assertEqual(day10.solve_part2(_INPUT.splitlines(), method), 1)
+                self.assertEqual(day10.solve_part2(_INPUT_2.splitlines(), method), 4)
+
+        with self.assertRaises(ValueError):
+            day10.solve_part2(_INPUT_2.splitlines(), 'flood')
+
+    def test_stray_pipes(self):
+        world, loop, _ = day10.trace_loop(_INPUT_3.splitlines())
+
+        self.assertEqual(chr(world[loop[0]]), 'F')
+        self.assertEqual(day10.solve(_INPUT_3.splitlines()), (4, 1))
+        for method in day10.INTERIOR_METHODS:
+            self.assertEqual(day10.solve_part2(_INPUT_3.splitlines(), method), 1)
+
+    def test_broken_loop(self):
+        for data in ("S7.\n|J.\n...", "-S-\n.|.", "S-7\n|.|\nL--"):
+            with self.assertRaises(ValueError):
+                day10.trace_loop(data.splitlines())
+
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir, caching(cache_dir):
+            # The second round decodes the stored entries
+            for _ in range(2):
+                self.assertEqual(day10.solve_part1(_INPUT.splitlines()), 8)
+                self.assertEqual(day10.solve_part2(_INPUT_2.splitlines()), 4)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -23,5 +23,8 @@ class TestDay11(unittest.TestCase):
     def test_part_2b(self):
         self.assertEqual(day11.solve_part2(_INPUT.splitlines(), 100), 8410)
 
+    def test_solve(self):
+        self.assertEqual(day11.solve(_INPUT.splitlines(), 10), (374, 1030))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
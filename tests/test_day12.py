@@ -17,5 +17,12 @@ class TestDay12(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day12.solve_part2(_INPUT.splitlines()), 525152)
 
+    def test_stream(self):
+        self.assertEqual(day12.solve_part1(iter(_INPUT.splitlines())), 21)
+        self.assertEqual(day12.solve_part2(iter(_INPUT.splitlines())), 525152)
+
+    def test_solve(self):
+        self.assertEqual(day12.solve(_INPUT.splitlines()), (21, 525152))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
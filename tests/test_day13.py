@@ -27,5 +27,8 @@ class TestDay13(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day13.solve_part2(_INPUT.splitlines()), 400)
 
+    def test_solve(self):
+        self.assertEqual(day13.solve(_INPUT.splitlines()), (405, 400))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
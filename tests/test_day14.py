@@ -22,5 +22,8 @@ class TestDay14(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day14.solve_part2(_INPUT.splitlines()), 64)
 
+    def test_solve(self):
+        self.assertEqual(day14.solve(_INPUT.splitlines()), (136, 64))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
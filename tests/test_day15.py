@@ -13,5 +13,16 @@ class TestDay15(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day15.solve_part2(_INPUT.splitlines()), 145)
 
+    def test_stream(self):
+        self.assertEqual(day15.solve_part1(iter(_INPUT.splitlines())), 1320)
+        self.assertEqual(day15.solve_part2(iter(_INPUT.splitlines())), 145)
+
+    def test_wrapped_sequence(self):
+        wrapped = iter(['rn=1,cm-,q', 'p=3,cm=2,qp-,', 'pc=4,ot=9,ab=5,pc-,pc=6,ot=7'])
+        self.assertEqual(day15.solve_part2(wrapped), 145)
+
+    def test_solve(self):
+        self.assertEqual(day15.solve(_INPUT.splitlines()), (1320, 145))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
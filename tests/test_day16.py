@@ -22,5 +22,8 @@ class TestDay16(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day16.solve_part2(_INPUT.splitlines()), 51)
 
+    def test_solve(self):
+        self.assertEqual(day16.solve(_INPUT.splitlines()), (46, 51))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
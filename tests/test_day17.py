@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 
 import aoc.day17 as day17
+from aoc.cache import caching
 
 _INPUT_A = R'''
 2413432311323
@@ -33,5 +35,15 @@ class TestDay17(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day17.solve_part2(_INPUT_A.splitlines()), 94)
 
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir, caching(cache_dir):
+            # The second round decodes the stored entries
+            for _ in range(2):
+                self.assertEqual(day17.solve_part1(_INPUT_A.splitlines()), 102)
+                self.assertEqual(day17.solve_part2(_INPUT_A.splitlines()), 94)
+
+    def test_solve(self):
+        self.assertEqual(day17.solve(_INPUT_A.splitlines()), (102, 94))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
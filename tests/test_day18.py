@@ -34,5 +34,12 @@ class TestDay18(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day18.solve_part2(_INPUT), 952408144115)
 
+    def test_stream(self):
+        self.assertEqual(day18.solve_part1(iter(_INPUT)), 62)
+        self.assertEqual(day18.solve_part2(iter(_INPUT)), 952408144115)
+
+    def test_solve(self):
+        self.assertEqual(day18.solve(_INPUT), (62, 952408144115))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
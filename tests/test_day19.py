@@ -30,6 +30,13 @@ class TestDay19(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day19.solve_part2(_INPUT), 167409079868000)
 
+    def test_stream(self):
+        self.assertEqual(day19.solve_part1(iter(_INPUT)), 19114)
+        self.assertEqual(day19.solve_part2(iter(_INPUT)), 167409079868000)
+
+    def test_solve(self):
+        self.assertEqual(day19.solve(_INPUT), (19114, 167409079868000))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
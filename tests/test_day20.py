@@ -26,6 +26,11 @@ class TestDay20(unittest.TestCase):
     def test_part_1b(self):
         self.assertEqual(day20.solve_part1(_INPUT_B), 11687500)
 
+    def test_solve(self):
+        # Neither example has an rx module, so there is no part 2
+        self.assertEqual(day20.solve(_INPUT_A), (32000000, None))
+        self.assertEqual(day20.solve(_INPUT_B), (11687500, None))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
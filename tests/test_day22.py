@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 
 import aoc.day22 as day22
+from aoc.cache import caching
 
 _INPUT = R'''
 1,0,1~1,2,1
@@ -43,5 +45,15 @@ class TestDay22(unittest.TestCase):
     def test_part_2custom(self):
         self.assertEqual(day22.solve_part2(_CUSTOM_INPUT), 13)
 
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir, caching(cache_dir):
+            # The second round decodes the stored entries
+            for _ in range(2):
+                self.assertEqual(day22.solve_part1(_INPUT), 5)
+                self.assertEqual(day22.solve_part2(_INPUT), 7)
+
+    def test_solve(self):
+        self.assertEqual(day22.solve(_INPUT), (5, 7))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
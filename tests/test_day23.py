@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 
 import aoc.day23 as day23
+from aoc.cache import caching
 
 _INPUT = R'''
 #.#####################
@@ -36,5 +38,15 @@ class TestDay23(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day23.solve_part2(_INPUT), 154)
 
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir, caching(cache_dir):
+            # The second round decodes the stored entries
+            for _ in range(2):
+                self.assertEqual(day23.solve_part1(_INPUT), 94)
+                self.assertEqual(day23.solve_part2(_INPUT), 154)
+
+    def test_solve(self):
+        self.assertEqual(day23.solve(_INPUT), (94, 154))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -18,5 +18,12 @@ class TestDay24(unittest.TestCase):
     def test_part_2(self):
         self.assertEqual(day24.solve_part2(_INPUT), 47)
 
+    def test_stream(self):
+        self.assertEqual(day24.solve_part1(iter(_INPUT), (7, 27)), 2)
+        self.assertEqual(day24.solve_part2(iter(_INPUT)), 47)
+
+    def test_solve(self):
+        self.assertEqual(day24.solve(_INPUT, (7, 27)), (2, 47))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
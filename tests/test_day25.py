@@ -23,5 +23,8 @@ class TestDay25(unittest.TestCase):
     def test_part_1(self):
         self.assertEqual(day25.solve_part1(_INPUT), 54)
 
+    def test_solve(self):
+        self.assertEqual(day25.solve(_INPUT), (54, 0))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import aoc.day10 as day10
+import aoc.runner as runner
+
+_INPUT = """1abc2
+pqr3stu8vwx
+a1b2c3d4e5f
+treb7uchet"""
+
+# Seconds a fresh interpreter may spend importing one day, several times what
+# any of them takes now, so only real regressions like an eager heavy import trip it
+_IMPORT_BUDGET = 0.25
+
+def _fail():
+    raise ValueError("broken")
+
+class TestRunner(unittest.TestCase):
+    def test_available_days(self):
+        self.assertEqual(runner.available_days(), list(range(1, 26)))
+
+    def test_measure(self):
+        result, stats = runner.measure(lambda: [0] * 1000)
+
+        self.assertEqual(len(result), 1000)
+        self.assertGreaterEqual(stats['wall'], 0)
+        self.assertGreaterEqual(stats['cpu'], 0)
+        self.assertGreater(stats['peak_memory'], 0)
+
+    def test_measure_error(self):
+        result, stats = runner.measure(_fail, trace_memory=False)
+
+        self.assertIsNone(result)
+        self.assertIn('broken', stats['error'])
+        self.assertNotIn('peak_memory', stats)
+
+    def test_run(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            (Path(input_dir) / 'day01.txt').write_text(_INPUT)
+
+            for jobs in (1, 2):
+                report = runner.run([1], Path(input_dir), jobs=jobs)
+
+                self.assertEqual(report[0]['day'], 1)
+                self.assertEqual(report[0]['parts']['1']['answer'], 142)
+                self.assertEqual(report[0]['parts']['2']['answer'], 142)
+
+    def test_run_missing_input(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            (Path(input_dir) / 'day01.txt').write_text(_INPUT)
+
+            for jobs in (1, 2):
+                report = runner.run([1, 2], Path(input_dir), jobs=jobs, trace_memory=False)
+
+                self.assertEqual(report[0]['parts']['1']['answer'], 142)
+                self.assertEqual(report[1]['day'], 2)
+                self.assertIn('FileNotFoundError', report[1]['error'])
+
+    def test_run_profile(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            (Path(input_dir) / 'day01.txt').write_text(_INPUT)
+
+            report = runner.run_day(1, Path(input_dir), trace_memory=False, profile=True)
+
+            self.assertEqual(report['parts']['1']['answer'], 142)
+            self.assertIn('day01;solve_part1', [stack.rsplit(' ', 1)[0] for stack in report['stacks']])
+            self.assertNotIn('stacks', runner.run_day(1, Path(input_dir), trace_memory=False))
+
+    def test_run_cross_check(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            (Path(input_dir) / 'day10.txt').write_text("..F7.\n.FJ|.\nSJ.L7\n|F--J\nLJ...\n")
+
+            report = runner.run_day(10, Path(input_dir), trace_memory=False, cross_check=True)
+
+            self.assertEqual(report['parts']['2']['answer'], 1)
+            self.assertEqual(list(report['cross_check']), ['2'])
+            self.assertEqual({method: check['answer'] for method, check in report['cross_check']['2']['methods'].items()},
+                             {'scan': 1, 'shoelace': 1})
+            self.assertTrue(report['cross_check']['2']['agree'])
+            self.assertNotIn('cross_check', runner.run_day(10, Path(input_dir), trace_memory=False))
+
+            # The methods are the day's own
+            with mock.patch('aoc.day10.CROSS_CHECK', {2: {'scan': day10.solve_part2, 'wrong': lambda data: 0}}):
+                report = runner.run_day(10, Path(input_dir), trace_memory=False, cross_check=True)
+            self.assertEqual(list(report['cross_check']['2']['methods']), ['scan', 'wrong'])
+            self.assertFalse(report['cross_check']['2']['agree'])
+
+            # Days without alternative methods have nothing to check
+            (Path(input_dir) / 'day01.txt').write_text(_INPUT)
+            self.assertNotIn('cross_check', runner.run_day(1, Path(input_dir), trace_memory=False, cross_check=True))
+
+    def test_run_stream(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            path = Path(input_dir) / 'day01.txt'
+            path.write_text(_INPUT)
+
+            report = runner.run_stream(1, str(path), [1, 2])
+            self.assertEqual(report['parts']['1']['answer'], 142)
+            self.assertEqual(report['parts']['2']['answer'], 142)
+
+            with self.assertRaises(ValueError):
+                runner.run_stream(5, str(path), [1])
+            with self.assertRaises(ValueError):
+                runner.run_stream(1, '-', [1, 2])
+
+class TestStartup(unittest.TestCase):
+    def test_parse_importtime(self):
+        modules = runner.parse_importtime("""import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | aoc.day01
+unrelated line""")
+
+        self.assertEqual(modules, {'_io': (120, 120), 'aoc.day01': (300, 420)})
+
+    def test_budget(self):
+        for day in runner.available_days():
+            with self.subTest(day=day):
+                report = runner.startup_report(day)
+
+                self.assertNotIn('error', report)
+                self.assertLess(report['import'], _IMPORT_BUDGET)
+
+    def test_lazy_imports(self):
+        # The runner alone loads no day, and none of the modules only some runs need
+        script = """import sys
+import aoc.runner
+print(' '.join(sorted(sys.modules)))"""
+        modules = set(subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout.split())
+
+        self.assertFalse({name for name in modules if name.startswith('aoc.day')})
+        for name in ('concurrent.futures', 'tracemalloc', 'subprocess', 'pickle', 'tempfile', 'hashlib'):
+            self.assertNotIn(name, modules)
+
+if __name__ == '__main__':
+    unittest.main()